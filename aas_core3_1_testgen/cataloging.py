@@ -0,0 +1,383 @@
+"""
+Record the generated cases in an indexed SQLite catalog.
+
+The test runners of the SDKs can select a subset of the cases with a single query
+instead of walking the test data directory, and the incremental runs can diff
+two catalogs to find the cases which changed.
+"""
+import argparse
+import os
+import pathlib
+import sqlite3
+import sys
+import types
+from typing import AbstractSet, Any, Iterator, List, Optional, Tuple, Type
+
+from icontract import require
+
+from aas_core3_1_testgen import serialized
+
+
+class Entry:
+    """Describe a generated case in the catalog."""
+
+    #: Path to the case relative to the test data directory
+    relative_path: pathlib.PurePosixPath
+
+    #: Format of the case
+    fmt: serialized.Format
+
+    #: Name of the container class in the meta-model
+    container_class: str
+
+    #: Name of the class in the meta-model
+    class_name: str
+
+    #: Kind of the case, *e.g.*, ``Minimal`` or ``PatternViolation``
+    kind: str
+
+    #: Name of the property in the meta-model concerned by the case, if any
+    property_name: Optional[str]
+
+    #: Name of the example or of the custom-tailored case, if any
+    example_name: Optional[str]
+
+    #: What a consumer should observe when loading the case
+    expected_outcome: serialized.ExpectedOutcome
+
+    #: SHA-256 digest of the content in hexadecimal
+    sha256: str
+
+    @require(lambda relative_path: not relative_path.is_absolute())
+    @require(lambda sha256: len(sha256) == 64)
+    def __init__(
+        self,
+        relative_path: pathlib.PurePosixPath,
+        fmt: serialized.Format,
+        container_class: str,
+        class_name: str,
+        kind: str,
+        property_name: Optional[str],
+        example_name: Optional[str],
+        expected_outcome: serialized.ExpectedOutcome,
+        sha256: str,
+    ) -> None:
+        """Initialize with the given values."""
+        self.relative_path = relative_path
+        self.fmt = fmt
+        self.container_class = container_class
+        self.class_name = class_name
+        self.kind = kind
+        self.property_name = property_name
+        self.example_name = example_name
+        self.expected_outcome = expected_outcome
+        self.sha256 = sha256
+
+
+_COLUMNS = (
+    "relative_path",
+    "format",
+    "container_class",
+    "class_name",
+    "kind",
+    "property_name",
+    "example_name",
+    "expected_outcome",
+    "sha256",
+)
+
+
+def _to_row(entry: Entry) -> Tuple[Optional[str], ...]:
+    """Convert the ``entry`` to a row of the table in the order of the columns."""
+    return (
+        entry.relative_path.as_posix(),
+        entry.fmt.value,
+        entry.container_class,
+        entry.class_name,
+        entry.kind,
+        entry.property_name,
+        entry.example_name,
+        entry.expected_outcome.value,
+        entry.sha256,
+    )
+
+
+def _from_row(row: Tuple[Any, ...]) -> Entry:
+    """Convert the ``row`` of the table back to an entry."""
+    return Entry(
+        relative_path=pathlib.PurePosixPath(row[0]),
+        fmt=serialized.Format(row[1]),
+        container_class=row[2],
+        class_name=row[3],
+        kind=row[4],
+        property_name=row[5],
+        example_name=row[6],
+        expected_outcome=serialized.ExpectedOutcome(row[7]),
+        sha256=row[8],
+    )
+
+
+_CREATE_TABLE = """\
+CREATE TABLE IF NOT EXISTS cases (
+    relative_path TEXT PRIMARY KEY,
+    format TEXT NOT NULL,
+    container_class TEXT NOT NULL,
+    class_name TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    property_name TEXT,
+    example_name TEXT,
+    expected_outcome TEXT NOT NULL,
+    sha256 TEXT NOT NULL
+)"""
+
+# The runners usually select the cases of one format by their outcome, class or
+# kind, so we index these combinations. The indices of a new catalog are created
+# only once all the entries have been inserted, which is much faster than updating
+# them on every insert.
+_CREATE_INDICES = (
+    "CREATE INDEX IF NOT EXISTS cases_by_outcome ON cases (format, expected_outcome)",
+    "CREATE INDEX IF NOT EXISTS cases_by_class ON cases (format, class_name)",
+    "CREATE INDEX IF NOT EXISTS cases_by_kind ON cases (format, kind)",
+    "CREATE INDEX IF NOT EXISTS cases_by_container_class "
+    "ON cases (format, container_class)",
+    "CREATE INDEX IF NOT EXISTS cases_by_property ON cases (class_name, property_name)",
+)
+
+
+class CatalogWriter:
+    """Write the entries to a catalog in batches."""
+
+    #: Number of the entries inserted in a single statement
+    BATCH_SIZE = 1000
+
+    def __init__(
+        self,
+        path: pathlib.Path,
+        replaced_class_names: Optional[AbstractSet[str]] = None,
+    ) -> None:
+        """
+        Create the catalog at ``path``, replacing any previous catalog.
+
+        The new catalog is written to a temporary file next to ``path``, which
+        replaces the previous catalog only once the catalog is closed.
+
+        If ``replaced_class_names`` are given, the previous catalog is updated in
+        place instead. Only the entries of these classes are deleted, and
+        the written entries are added to the remaining ones. The update is
+        committed only once the catalog is closed.
+        """
+        self.path = path
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._temporary_path = None  # type: Optional[pathlib.Path]
+        if replaced_class_names is None:
+            self._temporary_path = path.parent / f"{path.name}.tmp"
+            if self._temporary_path.exists():
+                self._temporary_path.unlink()
+
+        self._connection = sqlite3.connect(
+            str(self._temporary_path if self._temporary_path is not None else path)
+        )
+        self._connection.execute(_CREATE_TABLE)
+
+        if replaced_class_names is not None and len(replaced_class_names) > 0:
+            placeholders = ", ".join("?" for _ in replaced_class_names)
+            self._connection.execute(
+                f"DELETE FROM cases WHERE class_name IN ({placeholders})",
+                sorted(replaced_class_names),
+            )
+
+        self._batch = []  # type: List[Tuple[Optional[str], ...]]
+
+    def _flush(self) -> None:
+        """Insert the pending entries."""
+        if len(self._batch) == 0:
+            return
+
+        placeholders = ", ".join("?" for _ in _COLUMNS)
+        self._connection.executemany(
+            f"INSERT INTO cases ({', '.join(_COLUMNS)}) VALUES ({placeholders})",
+            self._batch,
+        )
+        self._batch = []
+
+    def write(self, entry: Entry) -> None:
+        """Record the ``entry`` in the catalog."""
+        self._batch.append(_to_row(entry))
+
+        if len(self._batch) >= CatalogWriter.BATCH_SIZE:
+            self._flush()
+
+    def close(self) -> None:
+        """Insert the pending entries, index them and close the catalog."""
+        self._flush()
+
+        for statement in _CREATE_INDICES:
+            self._connection.execute(statement)
+
+        self._connection.commit()
+        self._connection.close()
+
+        if self._temporary_path is not None:
+            os.replace(self._temporary_path, self.path)
+
+    def abort(self) -> None:
+        """Discard the written entries and leave the previous catalog as it was."""
+        self._batch = []
+
+        self._connection.rollback()
+        self._connection.close()
+
+        if self._temporary_path is not None:
+            self._temporary_path.unlink()
+
+    def __enter__(self) -> "CatalogWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[types.TracebackType],
+    ) -> None:
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.close()
+
+
+def select(
+    path: pathlib.Path,
+    fmt: Optional[serialized.Format] = None,
+    container_class: Optional[str] = None,
+    class_name: Optional[str] = None,
+    kind: Optional[str] = None,
+    property_name: Optional[str] = None,
+    expected_outcome: Optional[serialized.ExpectedOutcome] = None,
+) -> List[Entry]:
+    """
+    Select the entries from the catalog at ``path`` which match all the filters.
+
+    The filters which are None are ignored. The entries are sorted by their paths.
+    """
+    conditions = []  # type: List[str]
+    parameters = []  # type: List[str]
+
+    for column, value in (
+        ("format", fmt.value if fmt is not None else None),
+        ("container_class", container_class),
+        ("class_name", class_name),
+        ("kind", kind),
+        ("property_name", property_name),
+        (
+            "expected_outcome",
+            expected_outcome.value if expected_outcome is not None else None,
+        ),
+    ):
+        if value is not None:
+            conditions.append(f"{column} = ?")
+            parameters.append(value)
+
+    query = f"SELECT {', '.join(_COLUMNS)} FROM cases"
+    if len(conditions) > 0:
+        query += " WHERE " + " AND ".join(conditions)
+    query += " ORDER BY relative_path"
+
+    connection = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+    try:
+        return [_from_row(row) for row in connection.execute(query, parameters)]
+    finally:
+        connection.close()
+
+
+class Diff:
+    """Represent the differences between an old and a new catalog."""
+
+    #: Relative paths of the cases only in the new catalog
+    added: List[str]
+
+    #: Relative paths of the cases only in the old catalog
+    removed: List[str]
+
+    #: Relative paths of the cases whose content changed
+    changed: List[str]
+
+    def __init__(
+        self, added: List[str], removed: List[str], changed: List[str]
+    ) -> None:
+        """Initialize with the given values."""
+        self.added = added
+        self.removed = removed
+        self.changed = changed
+
+    def __iter__(self) -> Iterator[Tuple[str, List[str]]]:
+        """Iterate over the labels and the paths of the differences."""
+        yield "added", self.added
+        yield "removed", self.removed
+        yield "changed", self.changed
+
+
+def diff(old_path: pathlib.Path, new_path: pathlib.Path) -> Diff:
+    """Compare the catalog at ``old_path`` against the catalog at ``new_path``."""
+    connection = sqlite3.connect(f"{new_path.resolve().as_uri()}?mode=ro", uri=True)
+    try:
+        connection.execute(
+            "ATTACH DATABASE ? AS old", (f"{old_path.resolve().as_uri()}?mode=ro",)
+        )
+
+        def paths(query: str) -> List[str]:
+            """Collect the paths selected by the ``query``."""
+            return [row[0] for row in connection.execute(query)]
+
+        return Diff(
+            added=paths(
+                "SELECT new.relative_path FROM main.cases AS new "
+                "LEFT JOIN old.cases AS old USING (relative_path) "
+                "WHERE old.relative_path IS NULL "
+                "ORDER BY new.relative_path"
+            ),
+            removed=paths(
+                "SELECT old.relative_path FROM old.cases AS old "
+                "LEFT JOIN main.cases AS new USING (relative_path) "
+                "WHERE new.relative_path IS NULL "
+                "ORDER BY old.relative_path"
+            ),
+            changed=paths(
+                "SELECT new.relative_path FROM main.cases AS new "
+                "JOIN old.cases AS old USING (relative_path) "
+                "WHERE new.sha256 != old.sha256 "
+                "ORDER BY new.relative_path"
+            ),
+        )
+    finally:
+        connection.close()
+
+
+def main() -> int:
+    """Execute the main routine."""
+    parser = argparse.ArgumentParser(
+        description="Compare two catalogs of the generated cases."
+    )
+    parser.add_argument("old", help="path to the old catalog")
+    parser.add_argument("new", help="path to the new catalog")
+    args = parser.parse_args()
+
+    old_path = pathlib.Path(args.old)
+    new_path = pathlib.Path(args.new)
+
+    for path in (old_path, new_path):
+        if not path.is_file():
+            print(f"The catalog does not exist: {path}", file=sys.stderr)
+            return 1
+
+    differences = diff(old_path=old_path, new_path=new_path)
+    for label, relative_paths in differences:
+        for relative_path in relative_paths:
+            print(f"{label} {relative_path}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,11 +9,12 @@ import collections
 import json
 from typing import (
     Any,
+    Dict,
     get_args,
+    Iterator,
     List,
     MutableMapping,
     Optional,
-    OrderedDict,
     Tuple,
     Union,
 )
@@ -33,9 +34,107 @@ assert PrimitiveValueTuple == get_args(PrimitiveValueUnion)
 ValueUnion = Union[PrimitiveValueUnion, "Instance", "ListOfInstances"]
 
 
+class _Schema:
+    """
+    Represent the names of the properties in the order of their insertion.
+
+    The schemas are interned so that all the instances with the same properties
+    share the same schema.
+    """
+
+    __slots__ = ("names", "index_by_name", "_successors")
+
+    def __init__(self, names: Tuple[str, ...]) -> None:
+        """Initialize with the given values."""
+        self.names = names
+        self.index_by_name = {
+            name: i for i, name in enumerate(names)
+        }  # type: Dict[str, int]
+        self._successors = dict()  # type: Dict[str, _Schema]
+
+    def appended(self, name: str) -> "_Schema":
+        """Retrieve the schema with ``name`` appended to our names."""
+        successor = self._successors.get(name, None)
+        if successor is None:
+            successor = _schema_for(self.names + (name,))
+            self._successors[name] = successor
+
+        return successor
+
+    def removed(self, name: str) -> "_Schema":
+        """Retrieve the schema with ``name`` removed from our names."""
+        return _schema_for(tuple(other for other in self.names if other != name))
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "_Schema":
+        return self
+
+    def __reduce__(self) -> Tuple[Any, Tuple[Tuple[str, ...]]]:
+        return _schema_for, (self.names,)
+
+
+_SCHEMAS = dict()  # type: Dict[Tuple[str, ...], _Schema]
+
+
+def _schema_for(names: Tuple[str, ...]) -> _Schema:
+    """Retrieve the interned schema for the ``names``."""
+    schema = _SCHEMAS.get(names, None)
+    if schema is None:
+        schema = _Schema(names)
+        _SCHEMAS[names] = schema
+
+    return schema
+
+
+_EMPTY_SCHEMA = _schema_for(())
+
+
+class Properties(MutableMapping[str, Optional[ValueUnion]]):
+    """
+    Map names of the properties to their pre-serialized values.
+
+    The properties are iterated over in the order of their insertion. The names
+    are kept in a schema shared among the instances, while the values are kept
+    in a list.
+    """
+
+    __slots__ = ("_schema", "_values")
+
+    def __init__(self) -> None:
+        """Initialize empty."""
+        self._schema = _EMPTY_SCHEMA
+        self._values = []  # type: List[Optional[ValueUnion]]
+
+    def __getitem__(self, name: str) -> Optional[ValueUnion]:
+        return self._values[self._schema.index_by_name[name]]
+
+    def __setitem__(self, name: str, value: Optional[ValueUnion]) -> None:
+        index = self._schema.index_by_name.get(name, None)
+        if index is None:
+            self._schema = self._schema.appended(name)
+            self._values.append(value)
+        else:
+            self._values[index] = value
+
+    def __delitem__(self, name: str) -> None:
+        index = self._schema.index_by_name[name]
+        self._schema = self._schema.removed(name)
+        del self._values[index]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._schema.index_by_name
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._schema.names)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+
 class Instance:
     """Represent an instance of a class."""
 
+    __slots__ = ("properties", "class_name")
+
     #: Pre-serialized properties of the instance.
     #:
     #: Our default pre-serialization is to *omit* properties which are set to ``None``.
@@ -43,14 +142,12 @@ class Instance:
     #: ``null`` JSON values. We leave it therefore open for the downstream client
     #: to define properties as ``null`` (by setting them to ``None``) even though
     #: our pre-serializer simply omits them.
-    properties: OrderedDict[str, Optional[ValueUnion]]
+    properties: Properties
 
     #: Class name according to aas-core-meta format, *not* as a Python class
     class_name: Identifier
 
-    def __init__(
-        self, properties: OrderedDict[str, Optional[ValueUnion]], class_name: Identifier
-    ) -> None:
+    def __init__(self, properties: Properties, class_name: Identifier) -> None:
         """
         Initialize with the given values.
 
@@ -64,6 +161,8 @@ class Instance:
 class ListOfInstances:
     """Represent a list of instances."""
 
+    __slots__ = ("values",)
+
     def __init__(self, values: List[Instance]) -> None:
         """Initialize with the given values."""
         self.values = values
@@ -119,9 +218,7 @@ class _Preserializer(aas_types.AbstractTransformer[Instance]):
         )  # type: MutableMapping[aas_types.Class, Instance]
 
     def transform_extension(self, that: aas_types.Extension) -> Instance:
-        properties = (
-            collections.OrderedDict()
-        )  # type: OrderedDict[str, Optional[ValueUnion]]
+        properties = Properties()
 
         if that.semantic_id is not None:
             properties["semantic_ID"] = self.transform(that.semantic_id)
@@ -153,9 +250,7 @@ class _Preserializer(aas_types.AbstractTransformer[Instance]):
     def transform_administrative_information(
         self, that: aas_types.AdministrativeInformation
     ) -> Instance:
-        properties = (
-            collections.OrderedDict()
-        )  # type: OrderedDict[str, Optional[ValueUnion]]
+        properties = Properties()
 
         if that.embedded_data_specifications is not None:
             properties["embedded_data_specifications"] = ListOfInstances(
@@ -181,9 +276,7 @@ class _Preserializer(aas_types.AbstractTransformer[Instance]):
         return preserialized
 
     def transform_qualifier(self, that: aas_types.Qualifier) -> Instance:
-        properties = (
-            collections.OrderedDict()
-        )  # type: OrderedDict[str, Optional[ValueUnion]]
+        properties = Properties()
 
         if that.semantic_id is not None:
             properties["semantic_ID"] = self.transform(that.semantic_id)
@@ -215,9 +308,7 @@ class _Preserializer(aas_types.AbstractTransformer[Instance]):
     def transform_asset_administration_shell(
         self, that: aas_types.AssetAdministrationShell
     ) -> Instance:
-        properties = (
-            collections.OrderedDict()
-        )  # type: OrderedDict[str, Optional[ValueUnion]]
+        properties = Properties()
 
         if that.extensions is not None:
             properties["extensions"] = ListOfInstances(
@@ -267,9 +358,7 @@ class _Preserializer(aas_types.AbstractTransformer[Instance]):
         return preserialized
 
     def transform_asset_information(self, that: aas_types.AssetInformation) -> Instance:
-        properties = (
-            collections.OrderedDict()
-        )  # type: OrderedDict[str, Optional[ValueUnion]]
+        properties = Properties()
 
         properties["asset_kind"] = that.asset_kind.value
 
@@ -294,9 +383,7 @@ class _Preserializer(aas_types.AbstractTransformer[Instance]):
         return preserialized
 
     def transform_resource(self, that: aas_types.Resource) -> Instance:
-        properties = (
-            collections.OrderedDict()
-        )  # type: OrderedDict[str, Optional[ValueUnion]]
+        properties = Properties()
 
         properties["path"] = that.path
 
@@ -310,9 +397,7 @@ class _Preserializer(aas_types.AbstractTransformer[Instance]):
         return preserialized
 
     def transform_specific_asset_id(self, that: aas_types.SpecificAssetID) -> Instance:
-        properties = (
-            collections.OrderedDict()
-        )  # type: OrderedDict[str, Optional[ValueUnion]]
+        properties = Properties()
 
         if that.semantic_id is not None:
             properties["semantic_ID"] = self.transform(that.semantic_id)
@@ -336,9 +421,7 @@ class _Preserializer(aas_types.AbstractTransformer[Instance]):
         return preserialized
 
     def transform_submodel(self, that: aas_types.Submodel) -> Instance:
-        properties = (
-            collections.OrderedDict()
-        )  # type: OrderedDict[str, Optional[ValueUnion]]
+        properties = Properties()
 
         if that.extensions is not None:
             properties["extensions"] = ListOfInstances(
@@ -401,9 +484,7 @@ class _Preserializer(aas_types.AbstractTransformer[Instance]):
     def transform_relationship_element(
         self, that: aas_types.RelationshipElement
     ) -> Instance:
-        properties = (
-            collections.OrderedDict()
-        )  # type: OrderedDict[str, Optional[ValueUnion]]
+        properties = Properties()
 
         if that.extensions is not None:
             properties["extensions"] = ListOfInstances(
@@ -457,9 +538,7 @@ class _Preserializer(aas_types.AbstractTransformer[Instance]):
     def transform_submodel_element_list(
         self, that: aas_types.SubmodelElementList
     ) -> Instance:
-        properties = (
-            collections.OrderedDict()
-        )  # type: OrderedDict[str, Optional[ValueUnion]]
+        properties = Properties()
 
         if that.extensions is not None:
             properties["extensions"] = ListOfInstances(
@@ -527,9 +606,7 @@ class _Preserializer(aas_types.AbstractTransformer[Instance]):
     def transform_submodel_element_collection(
         self, that: aas_types.SubmodelElementCollection
     ) -> Instance:
-        properties = (
-            collections.OrderedDict()
-        )  # type: OrderedDict[str, Optional[ValueUnion]]
+        properties = Properties()
 
         if that.extensions is not None:
             properties["extensions"] = ListOfInstances(
@@ -582,9 +659,7 @@ class _Preserializer(aas_types.AbstractTransformer[Instance]):
         return preserialized
 
     def transform_property(self, that: aas_types.Property) -> Instance:
-        properties = (
-            collections.OrderedDict()
-        )  # type: OrderedDict[str, Optional[ValueUnion]]
+        properties = Properties()
 
         if that.extensions is not None:
             properties["extensions"] = ListOfInstances(
@@ -642,9 +717,7 @@ class _Preserializer(aas_types.AbstractTransformer[Instance]):
     def transform_multi_language_property(
         self, that: aas_types.MultiLanguageProperty
     ) -> Instance:
-        properties = (
-            collections.OrderedDict()
-        )  # type: OrderedDict[str, Optional[ValueUnion]]
+        properties = Properties()
 
         if that.extensions is not None:
             properties["extensions"] = ListOfInstances(
@@ -700,9 +773,7 @@ class _Preserializer(aas_types.AbstractTransformer[Instance]):
         return preserialized
 
     def transform_range(self, that: aas_types.Range) -> Instance:
-        properties = (
-            collections.OrderedDict()
-        )  # type: OrderedDict[str, Optional[ValueUnion]]
+        properties = Properties()
 
         if that.extensions is not None:
             properties["extensions"] = ListOfInstances(
@@ -756,9 +827,7 @@ class _Preserializer(aas_types.AbstractTransformer[Instance]):
         return preserialized
 
     def transform_reference_element(self, that: aas_types.ReferenceElement) -> Instance:
-        properties = (
-            collections.OrderedDict()
-        )  # type: OrderedDict[str, Optional[ValueUnion]]
+        properties = Properties()
 
         if that.extensions is not None:
             properties["extensions"] = ListOfInstances(
@@ -809,9 +878,7 @@ class _Preserializer(aas_types.AbstractTransformer[Instance]):
         return preserialized
 
     def transform_blob(self, that: aas_types.Blob) -> Instance:
-        properties = (
-            collections.OrderedDict()
-        )  # type: OrderedDict[str, Optional[ValueUnion]]
+        properties = Properties()
 
         if that.extensions is not None:
             properties["extensions"] = ListOfInstances(
@@ -862,9 +929,7 @@ class _Preserializer(aas_types.AbstractTransformer[Instance]):
         return preserialized
 
     def transform_file(self, that: aas_types.File) -> Instance:
-        properties = (
-            collections.OrderedDict()
-        )  # type: OrderedDict[str, Optional[ValueUnion]]
+        properties = Properties()
 
         if that.extensions is not None:
             properties["extensions"] = ListOfInstances(
@@ -917,9 +982,7 @@ class _Preserializer(aas_types.AbstractTransformer[Instance]):
     def transform_annotated_relationship_element(
         self, that: aas_types.AnnotatedRelationshipElement
     ) -> Instance:
-        properties = (
-            collections.OrderedDict()
-        )  # type: OrderedDict[str, Optional[ValueUnion]]
+        properties = Properties()
 
         if that.extensions is not None:
             properties["extensions"] = ListOfInstances(
@@ -977,9 +1040,7 @@ class _Preserializer(aas_types.AbstractTransformer[Instance]):
         return preserialized
 
     def transform_entity(self, that: aas_types.Entity) -> Instance:
-        properties = (
-            collections.OrderedDict()
-        )  # type: OrderedDict[str, Optional[ValueUnion]]
+        properties = Properties()
 
         if that.extensions is not None:
             properties["extensions"] = ListOfInstances(
@@ -1040,9 +1101,7 @@ class _Preserializer(aas_types.AbstractTransformer[Instance]):
         return preserialized
 
     def transform_event_payload(self, that: aas_types.EventPayload) -> Instance:
-        properties = (
-            collections.OrderedDict()
-        )  # type: OrderedDict[str, Optional[ValueUnion]]
+        properties = Properties()
 
         properties["source"] = self.transform(that.source)
 
@@ -1076,9 +1135,7 @@ class _Preserializer(aas_types.AbstractTransformer[Instance]):
     def transform_basic_event_element(
         self, that: aas_types.BasicEventElement
     ) -> Instance:
-        properties = (
-            collections.OrderedDict()
-        )  # type: OrderedDict[str, Optional[ValueUnion]]
+        properties = Properties()
 
         if that.extensions is not None:
             properties["extensions"] = ListOfInstances(
@@ -1147,9 +1204,7 @@ class _Preserializer(aas_types.AbstractTransformer[Instance]):
         return preserialized
 
     def transform_operation(self, that: aas_types.Operation) -> Instance:
-        properties = (
-            collections.OrderedDict()
-        )  # type: OrderedDict[str, Optional[ValueUnion]]
+        properties = Properties()
 
         if that.extensions is not None:
             properties["extensions"] = ListOfInstances(
@@ -1214,9 +1269,7 @@ class _Preserializer(aas_types.AbstractTransformer[Instance]):
     def transform_operation_variable(
         self, that: aas_types.OperationVariable
     ) -> Instance:
-        properties = (
-            collections.OrderedDict()
-        )  # type: OrderedDict[str, Optional[ValueUnion]]
+        properties = Properties()
 
         properties["value"] = self.transform(that.value)
 
@@ -1227,9 +1280,7 @@ class _Preserializer(aas_types.AbstractTransformer[Instance]):
         return preserialized
 
     def transform_capability(self, that: aas_types.Capability) -> Instance:
-        properties = (
-            collections.OrderedDict()
-        )  # type: OrderedDict[str, Optional[ValueUnion]]
+        properties = Properties()
 
         if that.extensions is not None:
             properties["extensions"] = ListOfInstances(
@@ -1279,9 +1330,7 @@ class _Preserializer(aas_types.AbstractTransformer[Instance]):
     def transform_concept_description(
         self, that: aas_types.ConceptDescription
     ) -> Instance:
-        properties = (
-            collections.OrderedDict()
-        )  # type: OrderedDict[str, Optional[ValueUnion]]
+        properties = Properties()
 
         if that.extensions is not None:
             properties["extensions"] = ListOfInstances(
@@ -1326,9 +1375,7 @@ class _Preserializer(aas_types.AbstractTransformer[Instance]):
         return preserialized
 
     def transform_reference(self, that: aas_types.Reference) -> Instance:
-        properties = (
-            collections.OrderedDict()
-        )  # type: OrderedDict[str, Optional[ValueUnion]]
+        properties = Properties()
 
         properties["type"] = that.type.value
 
@@ -1348,9 +1395,7 @@ class _Preserializer(aas_types.AbstractTransformer[Instance]):
         return preserialized
 
     def transform_key(self, that: aas_types.Key) -> Instance:
-        properties = (
-            collections.OrderedDict()
-        )  # type: OrderedDict[str, Optional[ValueUnion]]
+        properties = Properties()
 
         properties["type"] = that.type.value
 
@@ -1363,9 +1408,7 @@ class _Preserializer(aas_types.AbstractTransformer[Instance]):
     def transform_lang_string_name_type(
         self, that: aas_types.LangStringNameType
     ) -> Instance:
-        properties = (
-            collections.OrderedDict()
-        )  # type: OrderedDict[str, Optional[ValueUnion]]
+        properties = Properties()
 
         properties["language"] = that.language
 
@@ -1380,9 +1423,7 @@ class _Preserializer(aas_types.AbstractTransformer[Instance]):
     def transform_lang_string_text_type(
         self, that: aas_types.LangStringTextType
     ) -> Instance:
-        properties = (
-            collections.OrderedDict()
-        )  # type: OrderedDict[str, Optional[ValueUnion]]
+        properties = Properties()
 
         properties["language"] = that.language
 
@@ -1395,9 +1436,7 @@ class _Preserializer(aas_types.AbstractTransformer[Instance]):
         return preserialized
 
     def transform_environment(self, that: aas_types.Environment) -> Instance:
-        properties = (
-            collections.OrderedDict()
-        )  # type: OrderedDict[str, Optional[ValueUnion]]
+        properties = Properties()
 
         if that.asset_administration_shells is not None:
             properties["asset_administration_shells"] = ListOfInstances(
@@ -1423,9 +1462,7 @@ class _Preserializer(aas_types.AbstractTransformer[Instance]):
     def transform_embedded_data_specification(
         self, that: aas_types.EmbeddedDataSpecification
     ) -> Instance:
-        properties = (
-            collections.OrderedDict()
-        )  # type: OrderedDict[str, Optional[ValueUnion]]
+        properties = Properties()
 
         properties["data_specification"] = self.transform(that.data_specification)
 
@@ -1440,9 +1477,7 @@ class _Preserializer(aas_types.AbstractTransformer[Instance]):
         return preserialized
 
     def transform_level_type(self, that: aas_types.LevelType) -> Instance:
-        properties = (
-            collections.OrderedDict()
-        )  # type: OrderedDict[str, Optional[ValueUnion]]
+        properties = Properties()
 
         properties["min"] = that.min
 
@@ -1461,9 +1496,7 @@ class _Preserializer(aas_types.AbstractTransformer[Instance]):
     def transform_value_reference_pair(
         self, that: aas_types.ValueReferencePair
     ) -> Instance:
-        properties = (
-            collections.OrderedDict()
-        )  # type: OrderedDict[str, Optional[ValueUnion]]
+        properties = Properties()
 
         properties["value"] = that.value
 
@@ -1476,9 +1509,7 @@ class _Preserializer(aas_types.AbstractTransformer[Instance]):
         return preserialized
 
     def transform_value_list(self, that: aas_types.ValueList) -> Instance:
-        properties = (
-            collections.OrderedDict()
-        )  # type: OrderedDict[str, Optional[ValueUnion]]
+        properties = Properties()
 
         properties["value_reference_pairs"] = ListOfInstances(
             [self.transform(item) for item in that.value_reference_pairs]
@@ -1493,9 +1524,7 @@ class _Preserializer(aas_types.AbstractTransformer[Instance]):
     def transform_lang_string_preferred_name_type_iec_61360(
         self, that: aas_types.LangStringPreferredNameTypeIEC61360
     ) -> Instance:
-        properties = (
-            collections.OrderedDict()
-        )  # type: OrderedDict[str, Optional[ValueUnion]]
+        properties = Properties()
 
         properties["language"] = that.language
 
@@ -1511,9 +1540,7 @@ class _Preserializer(aas_types.AbstractTransformer[Instance]):
     def transform_lang_string_short_name_type_iec_61360(
         self, that: aas_types.LangStringShortNameTypeIEC61360
     ) -> Instance:
-        properties = (
-            collections.OrderedDict()
-        )  # type: OrderedDict[str, Optional[ValueUnion]]
+        properties = Properties()
 
         properties["language"] = that.language
 
@@ -1529,9 +1556,7 @@ class _Preserializer(aas_types.AbstractTransformer[Instance]):
     def transform_lang_string_definition_type_iec_61360(
         self, that: aas_types.LangStringDefinitionTypeIEC61360
     ) -> Instance:
-        properties = (
-            collections.OrderedDict()
-        )  # type: OrderedDict[str, Optional[ValueUnion]]
+        properties = Properties()
 
         properties["language"] = that.language
 
@@ -1547,9 +1572,7 @@ class _Preserializer(aas_types.AbstractTransformer[Instance]):
     def transform_data_specification_iec_61360(
         self, that: aas_types.DataSpecificationIEC61360
     ) -> Instance:
-        properties = (
-            collections.OrderedDict()
-        )  # type: OrderedDict[str, Optional[ValueUnion]]
+        properties = Properties()
 
         properties["preferred_name"] = ListOfInstances(
             [self.transform(item) for item in that.preferred_name]
@@ -13,12 +13,15 @@ Create instances wrapped in environment.
 # Do NOT edit or append!
 
 
-from typing import Callable, List, Tuple, Union
+import copy
+from typing import Any, Callable, Dict, List, Tuple, TypeVar, Union
 
 from aas_core3_1_testgen import common
 from aas_core3_1_testgen.codegened import creation
 from aas_core3_1 import types as aas_types
 
+T = TypeVar("T")
+
 
 def _extension_in_environment(
     creation_function: Callable[[common.CanHash], aas_types.Extension]
@@ -1341,6 +1344,75 @@ def _data_specification_iec_61360_in_environment(
     return (the_environment, the_data_specification_iec_61360, path)
 
 
+class _Placeholder:
+    """Mark the place of the target instance in a wrapper skeleton."""
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "_Placeholder":
+        return self
+
+
+_PLACEHOLDER = _Placeholder()
+
+_Route = Callable[
+    [Callable[[common.CanHash], Any]],
+    Tuple[aas_types.Environment, Any, List[Union[str, int]]],
+]
+
+#: Environment with the placeholder, path hash of the target and path to it
+_Skeleton = Tuple[aas_types.Environment, common.CanHash, List[Union[str, int]]]
+
+#: Wrapper skeletons by route
+_SKELETONS = dict()  # type: Dict[_Route, _Skeleton]
+
+
+def _in_cached_environment(
+    route: _Route, creation_function: Callable[[common.CanHash], T]
+) -> Tuple[aas_types.Environment, T, List[Union[str, int]]]:
+    """
+    Create the target instance with ``creation_function`` in a copy of the skeleton.
+
+    The skeleton of the ``route`` is created only once. We deep-copy it for each
+    call, and replace the placeholder with the target instance. The path hashes
+    are the same as if the ``route`` were called with ``creation_function``.
+    """
+    skeleton = _SKELETONS.get(route, None)
+    if skeleton is None:
+        recorded_path_hashes = []  # type: List[common.CanHash]
+
+        def record(path_hash: common.CanHash) -> Any:
+            recorded_path_hashes.append(path_hash.copy())
+            return _PLACEHOLDER
+
+        environment, _, path = route(record)
+        assert len(recorded_path_hashes) == 1
+        assert len(path) > 0
+
+        skeleton = (environment, recorded_path_hashes[0], path)
+        _SKELETONS[route] = skeleton
+
+    environment_skeleton, path_hash, path = skeleton
+
+    environment = copy.deepcopy(environment_skeleton)
+    instance = creation_function(path_hash.copy())
+
+    container = environment  # type: Any
+    for segment in path[:-1]:
+        if isinstance(segment, int):
+            container = container[segment]
+        else:
+            container = getattr(container, segment)
+
+    last_segment = path[-1]
+    if isinstance(last_segment, int):
+        assert container[last_segment] is _PLACEHOLDER
+        container[last_segment] = instance
+    else:
+        assert getattr(container, last_segment) is _PLACEHOLDER
+        setattr(container, last_segment, instance)
+
+    return environment, instance, list(path)
+
+
 def minimal_extension_in_environment() -> Tuple[
     aas_types.Environment, aas_types.Extension, List[Union[str, int]]
 ]:
@@ -1353,7 +1425,9 @@ def minimal_extension_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _extension_in_environment(creation_function=creation.minimal_extension)
+    return _in_cached_environment(
+        route=_extension_in_environment, creation_function=creation.minimal_extension
+    )
 
 
 def minimal_administrative_information_in_environment() -> Tuple[
@@ -1368,8 +1442,9 @@ def minimal_administrative_information_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _administrative_information_in_environment(
-        creation_function=creation.minimal_administrative_information
+    return _in_cached_environment(
+        route=_administrative_information_in_environment,
+        creation_function=creation.minimal_administrative_information,
     )
 
 
@@ -1385,7 +1460,9 @@ def minimal_qualifier_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _qualifier_in_environment(creation_function=creation.minimal_qualifier)
+    return _in_cached_environment(
+        route=_qualifier_in_environment, creation_function=creation.minimal_qualifier
+    )
 
 
 def minimal_asset_administration_shell_in_environment() -> Tuple[
@@ -1400,8 +1477,9 @@ def minimal_asset_administration_shell_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _asset_administration_shell_in_environment(
-        creation_function=creation.minimal_asset_administration_shell
+    return _in_cached_environment(
+        route=_asset_administration_shell_in_environment,
+        creation_function=creation.minimal_asset_administration_shell,
     )
 
 
@@ -1417,8 +1495,9 @@ def minimal_asset_information_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _asset_information_in_environment(
-        creation_function=creation.minimal_asset_information
+    return _in_cached_environment(
+        route=_asset_information_in_environment,
+        creation_function=creation.minimal_asset_information,
     )
 
 
@@ -1434,7 +1513,9 @@ def minimal_resource_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _resource_in_environment(creation_function=creation.minimal_resource)
+    return _in_cached_environment(
+        route=_resource_in_environment, creation_function=creation.minimal_resource
+    )
 
 
 def minimal_specific_asset_id_in_environment() -> Tuple[
@@ -1449,8 +1530,9 @@ def minimal_specific_asset_id_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _specific_asset_id_in_environment(
-        creation_function=creation.minimal_specific_asset_id
+    return _in_cached_environment(
+        route=_specific_asset_id_in_environment,
+        creation_function=creation.minimal_specific_asset_id,
     )
 
 
@@ -1466,7 +1548,9 @@ def minimal_submodel_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _submodel_in_environment(creation_function=creation.minimal_submodel)
+    return _in_cached_environment(
+        route=_submodel_in_environment, creation_function=creation.minimal_submodel
+    )
 
 
 def minimal_relationship_element_in_environment() -> Tuple[
@@ -1481,8 +1565,9 @@ def minimal_relationship_element_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _relationship_element_in_environment(
-        creation_function=creation.concrete_minimal_relationship_element
+    return _in_cached_environment(
+        route=_relationship_element_in_environment,
+        creation_function=creation.concrete_minimal_relationship_element,
     )
 
 
@@ -1498,8 +1583,9 @@ def minimal_submodel_element_list_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _submodel_element_list_in_environment(
-        creation_function=creation.minimal_submodel_element_list
+    return _in_cached_environment(
+        route=_submodel_element_list_in_environment,
+        creation_function=creation.minimal_submodel_element_list,
     )
 
 
@@ -1515,8 +1601,9 @@ def minimal_submodel_element_collection_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _submodel_element_collection_in_environment(
-        creation_function=creation.minimal_submodel_element_collection
+    return _in_cached_environment(
+        route=_submodel_element_collection_in_environment,
+        creation_function=creation.minimal_submodel_element_collection,
     )
 
 
@@ -1532,7 +1619,9 @@ def minimal_property_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _property_in_environment(creation_function=creation.minimal_property)
+    return _in_cached_environment(
+        route=_property_in_environment, creation_function=creation.minimal_property
+    )
 
 
 def minimal_multi_language_property_in_environment() -> Tuple[
@@ -1547,8 +1636,9 @@ def minimal_multi_language_property_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _multi_language_property_in_environment(
-        creation_function=creation.minimal_multi_language_property
+    return _in_cached_environment(
+        route=_multi_language_property_in_environment,
+        creation_function=creation.minimal_multi_language_property,
     )
 
 
@@ -1564,7 +1654,9 @@ def minimal_range_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _range_in_environment(creation_function=creation.minimal_range)
+    return _in_cached_environment(
+        route=_range_in_environment, creation_function=creation.minimal_range
+    )
 
 
 def minimal_reference_element_in_environment() -> Tuple[
@@ -1579,8 +1671,9 @@ def minimal_reference_element_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _reference_element_in_environment(
-        creation_function=creation.minimal_reference_element
+    return _in_cached_environment(
+        route=_reference_element_in_environment,
+        creation_function=creation.minimal_reference_element,
     )
 
 
@@ -1596,7 +1689,9 @@ def minimal_blob_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _blob_in_environment(creation_function=creation.minimal_blob)
+    return _in_cached_environment(
+        route=_blob_in_environment, creation_function=creation.minimal_blob
+    )
 
 
 def minimal_file_in_environment() -> Tuple[
@@ -1611,7 +1706,9 @@ def minimal_file_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _file_in_environment(creation_function=creation.minimal_file)
+    return _in_cached_environment(
+        route=_file_in_environment, creation_function=creation.minimal_file
+    )
 
 
 def minimal_annotated_relationship_element_in_environment() -> Tuple[
@@ -1626,8 +1723,9 @@ def minimal_annotated_relationship_element_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _annotated_relationship_element_in_environment(
-        creation_function=creation.minimal_annotated_relationship_element
+    return _in_cached_environment(
+        route=_annotated_relationship_element_in_environment,
+        creation_function=creation.minimal_annotated_relationship_element,
     )
 
 
@@ -1643,7 +1741,9 @@ def minimal_entity_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _entity_in_environment(creation_function=creation.minimal_entity)
+    return _in_cached_environment(
+        route=_entity_in_environment, creation_function=creation.minimal_entity
+    )
 
 
 def minimal_basic_event_element_in_environment() -> Tuple[
@@ -1658,8 +1758,9 @@ def minimal_basic_event_element_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _basic_event_element_in_environment(
-        creation_function=creation.minimal_basic_event_element
+    return _in_cached_environment(
+        route=_basic_event_element_in_environment,
+        creation_function=creation.minimal_basic_event_element,
     )
 
 
@@ -1675,7 +1776,9 @@ def minimal_operation_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _operation_in_environment(creation_function=creation.minimal_operation)
+    return _in_cached_environment(
+        route=_operation_in_environment, creation_function=creation.minimal_operation
+    )
 
 
 def minimal_operation_variable_in_environment() -> Tuple[
@@ -1690,8 +1793,9 @@ def minimal_operation_variable_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _operation_variable_in_environment(
-        creation_function=creation.minimal_operation_variable
+    return _in_cached_environment(
+        route=_operation_variable_in_environment,
+        creation_function=creation.minimal_operation_variable,
     )
 
 
@@ -1707,7 +1811,9 @@ def minimal_capability_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _capability_in_environment(creation_function=creation.minimal_capability)
+    return _in_cached_environment(
+        route=_capability_in_environment, creation_function=creation.minimal_capability
+    )
 
 
 def minimal_concept_description_in_environment() -> Tuple[
@@ -1722,8 +1828,9 @@ def minimal_concept_description_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _concept_description_in_environment(
-        creation_function=creation.minimal_concept_description
+    return _in_cached_environment(
+        route=_concept_description_in_environment,
+        creation_function=creation.minimal_concept_description,
     )
 
 
@@ -1739,7 +1846,9 @@ def minimal_reference_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _reference_in_environment(creation_function=creation.minimal_reference)
+    return _in_cached_environment(
+        route=_reference_in_environment, creation_function=creation.minimal_reference
+    )
 
 
 def minimal_key_in_environment() -> Tuple[
@@ -1754,7 +1863,9 @@ def minimal_key_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _key_in_environment(creation_function=creation.minimal_key)
+    return _in_cached_environment(
+        route=_key_in_environment, creation_function=creation.minimal_key
+    )
 
 
 def minimal_lang_string_name_type_in_environment() -> Tuple[
@@ -1769,8 +1880,9 @@ def minimal_lang_string_name_type_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _lang_string_name_type_in_environment(
-        creation_function=creation.minimal_lang_string_name_type
+    return _in_cached_environment(
+        route=_lang_string_name_type_in_environment,
+        creation_function=creation.minimal_lang_string_name_type,
     )
 
 
@@ -1786,8 +1898,9 @@ def minimal_lang_string_text_type_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _lang_string_text_type_in_environment(
-        creation_function=creation.minimal_lang_string_text_type
+    return _in_cached_environment(
+        route=_lang_string_text_type_in_environment,
+        creation_function=creation.minimal_lang_string_text_type,
     )
 
 
@@ -1803,8 +1916,9 @@ def minimal_embedded_data_specification_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _embedded_data_specification_in_environment(
-        creation_function=creation.minimal_embedded_data_specification
+    return _in_cached_environment(
+        route=_embedded_data_specification_in_environment,
+        creation_function=creation.minimal_embedded_data_specification,
     )
 
 
@@ -1820,7 +1934,9 @@ def minimal_level_type_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _level_type_in_environment(creation_function=creation.minimal_level_type)
+    return _in_cached_environment(
+        route=_level_type_in_environment, creation_function=creation.minimal_level_type
+    )
 
 
 def minimal_value_reference_pair_in_environment() -> Tuple[
@@ -1835,8 +1951,9 @@ def minimal_value_reference_pair_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _value_reference_pair_in_environment(
-        creation_function=creation.minimal_value_reference_pair
+    return _in_cached_environment(
+        route=_value_reference_pair_in_environment,
+        creation_function=creation.minimal_value_reference_pair,
     )
 
 
@@ -1852,7 +1969,9 @@ def minimal_value_list_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _value_list_in_environment(creation_function=creation.minimal_value_list)
+    return _in_cached_environment(
+        route=_value_list_in_environment, creation_function=creation.minimal_value_list
+    )
 
 
 def minimal_lang_string_preferred_name_type_iec_61360_in_environment() -> Tuple[
@@ -1869,8 +1988,9 @@ def minimal_lang_string_preferred_name_type_iec_61360_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _lang_string_preferred_name_type_iec_61360_in_environment(
-        creation_function=creation.minimal_lang_string_preferred_name_type_iec_61360
+    return _in_cached_environment(
+        route=_lang_string_preferred_name_type_iec_61360_in_environment,
+        creation_function=creation.minimal_lang_string_preferred_name_type_iec_61360,
     )
 
 
@@ -1888,8 +2008,9 @@ def minimal_lang_string_short_name_type_iec_61360_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _lang_string_short_name_type_iec_61360_in_environment(
-        creation_function=creation.minimal_lang_string_short_name_type_iec_61360
+    return _in_cached_environment(
+        route=_lang_string_short_name_type_iec_61360_in_environment,
+        creation_function=creation.minimal_lang_string_short_name_type_iec_61360,
     )
 
 
@@ -1907,8 +2028,9 @@ def minimal_lang_string_definition_type_iec_61360_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _lang_string_definition_type_iec_61360_in_environment(
-        creation_function=creation.minimal_lang_string_definition_type_iec_61360
+    return _in_cached_environment(
+        route=_lang_string_definition_type_iec_61360_in_environment,
+        creation_function=creation.minimal_lang_string_definition_type_iec_61360,
     )
 
 
@@ -1924,8 +2046,9 @@ def minimal_data_specification_iec_61360_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _data_specification_iec_61360_in_environment(
-        creation_function=creation.minimal_data_specification_iec_61360
+    return _in_cached_environment(
+        route=_data_specification_iec_61360_in_environment,
+        creation_function=creation.minimal_data_specification_iec_61360,
     )
 
 
@@ -2003,7 +2126,9 @@ def maximal_extension_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _extension_in_environment(creation_function=creation.maximal_extension)
+    return _in_cached_environment(
+        route=_extension_in_environment, creation_function=creation.maximal_extension
+    )
 
 
 def maximal_administrative_information_in_environment() -> Tuple[
@@ -2018,8 +2143,9 @@ def maximal_administrative_information_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _administrative_information_in_environment(
-        creation_function=creation.maximal_administrative_information
+    return _in_cached_environment(
+        route=_administrative_information_in_environment,
+        creation_function=creation.maximal_administrative_information,
     )
 
 
@@ -2035,7 +2161,9 @@ def maximal_qualifier_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _qualifier_in_environment(creation_function=creation.maximal_qualifier)
+    return _in_cached_environment(
+        route=_qualifier_in_environment, creation_function=creation.maximal_qualifier
+    )
 
 
 def maximal_asset_administration_shell_in_environment() -> Tuple[
@@ -2050,8 +2178,9 @@ def maximal_asset_administration_shell_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _asset_administration_shell_in_environment(
-        creation_function=creation.maximal_asset_administration_shell
+    return _in_cached_environment(
+        route=_asset_administration_shell_in_environment,
+        creation_function=creation.maximal_asset_administration_shell,
     )
 
 
@@ -2067,8 +2196,9 @@ def maximal_asset_information_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _asset_information_in_environment(
-        creation_function=creation.maximal_asset_information
+    return _in_cached_environment(
+        route=_asset_information_in_environment,
+        creation_function=creation.maximal_asset_information,
     )
 
 
@@ -2084,7 +2214,9 @@ def maximal_resource_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _resource_in_environment(creation_function=creation.maximal_resource)
+    return _in_cached_environment(
+        route=_resource_in_environment, creation_function=creation.maximal_resource
+    )
 
 
 def maximal_specific_asset_id_in_environment() -> Tuple[
@@ -2099,8 +2231,9 @@ def maximal_specific_asset_id_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _specific_asset_id_in_environment(
-        creation_function=creation.maximal_specific_asset_id
+    return _in_cached_environment(
+        route=_specific_asset_id_in_environment,
+        creation_function=creation.maximal_specific_asset_id,
     )
 
 
@@ -2116,7 +2249,9 @@ def maximal_submodel_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _submodel_in_environment(creation_function=creation.maximal_submodel)
+    return _in_cached_environment(
+        route=_submodel_in_environment, creation_function=creation.maximal_submodel
+    )
 
 
 def maximal_relationship_element_in_environment() -> Tuple[
@@ -2131,8 +2266,9 @@ def maximal_relationship_element_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _relationship_element_in_environment(
-        creation_function=creation.concrete_maximal_relationship_element
+    return _in_cached_environment(
+        route=_relationship_element_in_environment,
+        creation_function=creation.concrete_maximal_relationship_element,
     )
 
 
@@ -2148,8 +2284,9 @@ def maximal_submodel_element_list_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _submodel_element_list_in_environment(
-        creation_function=creation.maximal_submodel_element_list
+    return _in_cached_environment(
+        route=_submodel_element_list_in_environment,
+        creation_function=creation.maximal_submodel_element_list,
     )
 
 
@@ -2165,8 +2302,9 @@ def maximal_submodel_element_collection_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _submodel_element_collection_in_environment(
-        creation_function=creation.maximal_submodel_element_collection
+    return _in_cached_environment(
+        route=_submodel_element_collection_in_environment,
+        creation_function=creation.maximal_submodel_element_collection,
     )
 
 
@@ -2182,7 +2320,9 @@ def maximal_property_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _property_in_environment(creation_function=creation.maximal_property)
+    return _in_cached_environment(
+        route=_property_in_environment, creation_function=creation.maximal_property
+    )
 
 
 def maximal_multi_language_property_in_environment() -> Tuple[
@@ -2197,8 +2337,9 @@ def maximal_multi_language_property_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _multi_language_property_in_environment(
-        creation_function=creation.maximal_multi_language_property
+    return _in_cached_environment(
+        route=_multi_language_property_in_environment,
+        creation_function=creation.maximal_multi_language_property,
     )
 
 
@@ -2214,7 +2355,9 @@ def maximal_range_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _range_in_environment(creation_function=creation.maximal_range)
+    return _in_cached_environment(
+        route=_range_in_environment, creation_function=creation.maximal_range
+    )
 
 
 def maximal_reference_element_in_environment() -> Tuple[
@@ -2229,8 +2372,9 @@ def maximal_reference_element_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _reference_element_in_environment(
-        creation_function=creation.maximal_reference_element
+    return _in_cached_environment(
+        route=_reference_element_in_environment,
+        creation_function=creation.maximal_reference_element,
     )
 
 
@@ -2246,7 +2390,9 @@ def maximal_blob_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _blob_in_environment(creation_function=creation.maximal_blob)
+    return _in_cached_environment(
+        route=_blob_in_environment, creation_function=creation.maximal_blob
+    )
 
 
 def maximal_file_in_environment() -> Tuple[
@@ -2261,7 +2407,9 @@ def maximal_file_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _file_in_environment(creation_function=creation.maximal_file)
+    return _in_cached_environment(
+        route=_file_in_environment, creation_function=creation.maximal_file
+    )
 
 
 def maximal_annotated_relationship_element_in_environment() -> Tuple[
@@ -2276,8 +2424,9 @@ def maximal_annotated_relationship_element_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _annotated_relationship_element_in_environment(
-        creation_function=creation.maximal_annotated_relationship_element
+    return _in_cached_environment(
+        route=_annotated_relationship_element_in_environment,
+        creation_function=creation.maximal_annotated_relationship_element,
     )
 
 
@@ -2293,7 +2442,9 @@ def maximal_entity_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _entity_in_environment(creation_function=creation.maximal_entity)
+    return _in_cached_environment(
+        route=_entity_in_environment, creation_function=creation.maximal_entity
+    )
 
 
 def maximal_basic_event_element_in_environment() -> Tuple[
@@ -2308,8 +2459,9 @@ def maximal_basic_event_element_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _basic_event_element_in_environment(
-        creation_function=creation.maximal_basic_event_element
+    return _in_cached_environment(
+        route=_basic_event_element_in_environment,
+        creation_function=creation.maximal_basic_event_element,
     )
 
 
@@ -2325,7 +2477,9 @@ def maximal_operation_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _operation_in_environment(creation_function=creation.maximal_operation)
+    return _in_cached_environment(
+        route=_operation_in_environment, creation_function=creation.maximal_operation
+    )
 
 
 def maximal_operation_variable_in_environment() -> Tuple[
@@ -2340,8 +2494,9 @@ def maximal_operation_variable_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _operation_variable_in_environment(
-        creation_function=creation.maximal_operation_variable
+    return _in_cached_environment(
+        route=_operation_variable_in_environment,
+        creation_function=creation.maximal_operation_variable,
     )
 
 
@@ -2357,7 +2512,9 @@ def maximal_capability_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _capability_in_environment(creation_function=creation.maximal_capability)
+    return _in_cached_environment(
+        route=_capability_in_environment, creation_function=creation.maximal_capability
+    )
 
 
 def maximal_concept_description_in_environment() -> Tuple[
@@ -2372,8 +2529,9 @@ def maximal_concept_description_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _concept_description_in_environment(
-        creation_function=creation.maximal_concept_description
+    return _in_cached_environment(
+        route=_concept_description_in_environment,
+        creation_function=creation.maximal_concept_description,
     )
 
 
@@ -2389,7 +2547,9 @@ def maximal_reference_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _reference_in_environment(creation_function=creation.maximal_reference)
+    return _in_cached_environment(
+        route=_reference_in_environment, creation_function=creation.maximal_reference
+    )
 
 
 def maximal_key_in_environment() -> Tuple[
@@ -2404,7 +2564,9 @@ def maximal_key_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _key_in_environment(creation_function=creation.maximal_key)
+    return _in_cached_environment(
+        route=_key_in_environment, creation_function=creation.maximal_key
+    )
 
 
 def maximal_lang_string_name_type_in_environment() -> Tuple[
@@ -2419,8 +2581,9 @@ def maximal_lang_string_name_type_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _lang_string_name_type_in_environment(
-        creation_function=creation.maximal_lang_string_name_type
+    return _in_cached_environment(
+        route=_lang_string_name_type_in_environment,
+        creation_function=creation.maximal_lang_string_name_type,
     )
 
 
@@ -2436,8 +2599,9 @@ def maximal_lang_string_text_type_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _lang_string_text_type_in_environment(
-        creation_function=creation.maximal_lang_string_text_type
+    return _in_cached_environment(
+        route=_lang_string_text_type_in_environment,
+        creation_function=creation.maximal_lang_string_text_type,
     )
 
 
@@ -2453,8 +2617,9 @@ def maximal_embedded_data_specification_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _embedded_data_specification_in_environment(
-        creation_function=creation.maximal_embedded_data_specification
+    return _in_cached_environment(
+        route=_embedded_data_specification_in_environment,
+        creation_function=creation.maximal_embedded_data_specification,
     )
 
 
@@ -2470,7 +2635,9 @@ def maximal_level_type_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _level_type_in_environment(creation_function=creation.maximal_level_type)
+    return _in_cached_environment(
+        route=_level_type_in_environment, creation_function=creation.maximal_level_type
+    )
 
 
 def maximal_value_reference_pair_in_environment() -> Tuple[
@@ -2485,8 +2652,9 @@ def maximal_value_reference_pair_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _value_reference_pair_in_environment(
-        creation_function=creation.maximal_value_reference_pair
+    return _in_cached_environment(
+        route=_value_reference_pair_in_environment,
+        creation_function=creation.maximal_value_reference_pair,
     )
 
 
@@ -2502,7 +2670,9 @@ def maximal_value_list_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _value_list_in_environment(creation_function=creation.maximal_value_list)
+    return _in_cached_environment(
+        route=_value_list_in_environment, creation_function=creation.maximal_value_list
+    )
 
 
 def maximal_lang_string_preferred_name_type_iec_61360_in_environment() -> Tuple[
@@ -2519,8 +2689,9 @@ def maximal_lang_string_preferred_name_type_iec_61360_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _lang_string_preferred_name_type_iec_61360_in_environment(
-        creation_function=creation.maximal_lang_string_preferred_name_type_iec_61360
+    return _in_cached_environment(
+        route=_lang_string_preferred_name_type_iec_61360_in_environment,
+        creation_function=creation.maximal_lang_string_preferred_name_type_iec_61360,
     )
 
 
@@ -2538,8 +2709,9 @@ def maximal_lang_string_short_name_type_iec_61360_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _lang_string_short_name_type_iec_61360_in_environment(
-        creation_function=creation.maximal_lang_string_short_name_type_iec_61360
+    return _in_cached_environment(
+        route=_lang_string_short_name_type_iec_61360_in_environment,
+        creation_function=creation.maximal_lang_string_short_name_type_iec_61360,
     )
 
 
@@ -2557,8 +2729,9 @@ def maximal_lang_string_definition_type_iec_61360_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _lang_string_definition_type_iec_61360_in_environment(
-        creation_function=creation.maximal_lang_string_definition_type_iec_61360
+    return _in_cached_environment(
+        route=_lang_string_definition_type_iec_61360_in_environment,
+        creation_function=creation.maximal_lang_string_definition_type_iec_61360,
     )
 
 
@@ -2574,8 +2747,9 @@ def maximal_data_specification_iec_61360_in_environment() -> Tuple[
         That means it can be serialized as-is, but probably violates one or
         more meta-model constraints.
     """
-    return _data_specification_iec_61360_in_environment(
-        creation_function=creation.maximal_data_specification_iec_61360
+    return _in_cached_environment(
+        route=_data_specification_iec_61360_in_environment,
+        creation_function=creation.maximal_data_specification_iec_61360,
     )
 
 
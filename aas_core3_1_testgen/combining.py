@@ -0,0 +1,724 @@
+"""
+Combine pairs of the negative cases into further negative cases.
+
+Each negative case of :py:mod:`aas_core3_1_testgen.generation` changes exactly one
+thing relative to a minimal or a maximal case. We record these changes as
+the edits of the pre-serialized base, and apply the edits of two such mutations
+together. The two mutations either share the base, or their bases are merged into
+a single environment.
+
+The pairs are selected deterministically by the path hash under an explicit case
+budget, and the combined cases are generated lazily, one at a time.
+"""
+import argparse
+import math
+import pathlib
+import sys
+from typing import (
+    AbstractSet,
+    Dict,
+    Iterator,
+    List,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+import aas_core_codegen.naming
+import aas_core_codegen.rdf_shacl.naming
+from aas_core_codegen import intermediate, infer_for_schema
+from aas_core_codegen.common import Identifier
+from icontract import ensure, require
+from typing_extensions import assert_never
+
+import aas_core3_1_testgen.generate_json
+import aas_core3_1_testgen.generate_rdf
+import aas_core3_1_testgen.generate_xml
+from aas_core3_1_testgen import common, generation, serialized, writing
+from aas_core3_1_testgen.codegened import preserialization
+
+#: Path to an instance in the pre-serialization, as property names and indices
+PreserializedPath = Tuple[Union[str, int], ...]
+
+
+class Edit:
+    """Represent a change of a single property of a pre-serialized instance."""
+
+    #: Path to the instance whose property is changed
+    path: PreserializedPath
+
+    #: Name of the changed property
+    property_name: str
+
+    #: New value of the property, if not removed
+    value: Optional[preserialization.ValueUnion]
+
+    #: If set, the property is removed from the instance
+    removed: bool
+
+    @require(lambda value, removed: not removed or value is None)
+    def __init__(
+        self,
+        path: PreserializedPath,
+        property_name: str,
+        value: Optional[preserialization.ValueUnion],
+        removed: bool,
+    ) -> None:
+        """Initialize with the given values."""
+        self.path = path
+        self.property_name = property_name
+        self.value = value
+        self.removed = removed
+
+
+def _diff(
+    base: preserialization.Instance,
+    mutated: preserialization.Instance,
+    path: PreserializedPath,
+    edits: List[Edit],
+) -> None:
+    """Append to ``edits`` the changes which turn ``base`` into ``mutated``."""
+    for name in base.properties:
+        if name not in mutated.properties:
+            edits.append(Edit(path=path, property_name=name, value=None, removed=True))
+
+    for name, value in mutated.properties.items():
+        if name not in base.properties:
+            edits.append(
+                Edit(path=path, property_name=name, value=value, removed=False)
+            )
+            continue
+
+        base_value = base.properties[name]
+
+        if (
+            isinstance(base_value, preserialization.Instance)
+            and isinstance(value, preserialization.Instance)
+            and base_value.class_name == value.class_name
+        ):
+            _diff(base=base_value, mutated=value, path=path + (name,), edits=edits)
+
+        elif (
+            isinstance(base_value, preserialization.ListOfInstances)
+            and isinstance(value, preserialization.ListOfInstances)
+            and len(base_value.values) == len(value.values)
+            and all(
+                base_item.class_name == item.class_name
+                for base_item, item in zip(base_value.values, value.values)
+            )
+        ):
+            for i, (base_item, item) in enumerate(zip(base_value.values, value.values)):
+                _diff(base=base_item, mutated=item, path=path + (name, i), edits=edits)
+
+        elif type(base_value) is not type(value) or base_value != value:
+            # The instances and the lists which could not be compared structurally
+            # are compared by identity here, so they are always replaced.
+            edits.append(
+                Edit(path=path, property_name=name, value=value, removed=False)
+            )
+
+
+def _dereference(
+    container: preserialization.Instance, path: PreserializedPath
+) -> preserialization.Instance:
+    """Follow the ``path`` from the ``container`` to a pre-serialized instance."""
+    something = container  # type: Optional[preserialization.ValueUnion]
+
+    for segment in path:
+        if isinstance(segment, str):
+            assert isinstance(something, preserialization.Instance), (
+                f"Expected an instance at the segment {segment!r} "
+                f"of the path {path}, but got {type(something)}"
+            )
+            something = something.properties[segment]
+
+        elif isinstance(segment, int):
+            assert isinstance(something, preserialization.ListOfInstances), (
+                f"Expected a list of instances at the segment {segment!r} "
+                f"of the path {path}, but got {type(something)}"
+            )
+            something = something.values[segment]
+
+        else:
+            assert_never(segment)
+
+    assert isinstance(something, preserialization.Instance), (
+        f"Expected an instance at the end of the path {path}, "
+        f"but got {type(something)}"
+    )
+
+    return something
+
+
+def _apply(container: preserialization.Instance, edits: Sequence[Edit]) -> None:
+    """Apply the ``edits`` in-place on the pre-serialized ``container``."""
+    for edit in edits:
+        instance = _dereference(container, edit.path)
+
+        if edit.removed:
+            del instance.properties[edit.property_name]
+        else:
+            instance.properties[edit.property_name] = edit.value
+
+
+class Mutation:
+    """Represent a negative case as the edits of the case it has been derived from."""
+
+    #: Minimal or maximal case which has been mutated
+    base: Union[generation.CaseMinimal, generation.CaseMaximal]
+
+    #: Changes of the pre-serialized base container
+    edits: Sequence[Edit]
+
+    #: Unique human-readable label used in the file names
+    label: str
+
+    #: Negative case which shares the pre-serialized container of the base so that
+    #: only its class and properties, but not its container, are kept
+    case: generation.CaseUnion
+
+    @require(lambda edits: len(edits) > 0)
+    def __init__(
+        self,
+        base: Union[generation.CaseMinimal, generation.CaseMaximal],
+        edits: Sequence[Edit],
+        label: str,
+        case: generation.CaseUnion,
+    ) -> None:
+        """Initialize with the given values."""
+        self.base = base
+        self.edits = edits
+        self.label = label
+        self.case = case
+
+        self._outcome_by_format = (
+            dict()
+        )  # type: Dict[serialized.Format, Optional[serialized.ExpectedOutcome]]
+
+    def outcome(
+        self, fmt: serialized.Format, symbol_table: intermediate.SymbolTable
+    ) -> Optional[serialized.ExpectedOutcome]:
+        """
+        Determine the outcome of the negative case in the format ``fmt``.
+
+        Return None if the case can not be represented in the format. The case is
+        re-constructed from the edits and serialized only on the first call for
+        the format.
+        """
+        if fmt not in self._outcome_by_format:
+            serialization = _serialize_single(
+                case=self.case.with_preserialized_container(_replicate(self)),
+                fmt=fmt,
+                symbol_table=symbol_table,
+            )
+
+            self._outcome_by_format[fmt] = (
+                serialization[1] if serialization is not None else None
+            )
+
+        return self._outcome_by_format[fmt]
+
+
+def _label(case: generation.CaseUnion) -> str:
+    """Label the ``case`` by its class, cause, property and example, if any."""
+    assert case.__class__.__name__.startswith("Case")
+
+    parts = [case.cls.name, case.__class__.__name__[len("Case") :]]
+
+    property_name = case.concerned_property_name()
+    if property_name is not None:
+        parts.append(property_name)
+
+    data_type_def_literal = getattr(case, "data_type_def_literal", None)
+    if data_type_def_literal is not None:
+        parts.append(data_type_def_literal.name)
+
+    for attribute in ("example_name", "name"):
+        value = getattr(case, attribute, None)
+        if value is not None:
+            parts.append(value)
+
+    return ".".join(parts)
+
+
+def _serialize_single(
+    case: generation.CaseUnion,
+    fmt: serialized.Format,
+    symbol_table: intermediate.SymbolTable,
+) -> Optional[Tuple[pathlib.Path, serialized.ExpectedOutcome, bytes]]:
+    """Serialize the ``case`` in the format ``fmt``, if it can be represented."""
+    if fmt is serialized.Format.JSON:
+        return aas_core3_1_testgen.generate_json.serialize_case(
+            test_case=case, symbol_table=symbol_table
+        )
+    elif fmt is serialized.Format.XML:
+        return aas_core3_1_testgen.generate_xml.serialize_case(
+            test_case=case, symbol_table=symbol_table
+        )
+    elif fmt is serialized.Format.RDF:
+        return aas_core3_1_testgen.generate_rdf.serialize_case(
+            test_case=case, symbol_table=symbol_table
+        )
+    else:
+        assert_never(fmt)
+        raise AssertionError("Unexpected execution path")
+
+
+def collect_mutations(
+    symbol_table: intermediate.SymbolTable,
+    constraints_by_class: MutableMapping[
+        intermediate.ClassUnion, infer_for_schema.ConstraintsByProperty
+    ],
+    class_names: Optional[AbstractSet[str]] = None,
+) -> List[Mutation]:
+    """
+    Collect the negative cases derived from a minimal or a maximal case as mutations.
+
+    The cases are generated one at a time, and only their edits are kept. Whether
+    a case can be represented in a format, and its outcome, are determined only
+    when a combination is serialized, see :py:meth:`Mutation.outcome`.
+
+    If ``class_names`` are given, only the cases of these concrete classes are
+    collected.
+    """
+    mutations = []  # type: List[Mutation]
+
+    label_set = set()  # type: Set[str]
+
+    for base, case in generation.generate_with_bases(
+        symbol_table=symbol_table,
+        constraints_by_class=constraints_by_class,
+        class_names=class_names,
+    ):
+        if base is None or case.expected:
+            continue
+
+        edits = []  # type: List[Edit]
+        _diff(
+            base=base.preserialized_container,
+            mutated=case.preserialized_container,
+            path=(),
+            edits=edits,
+        )
+
+        if len(edits) == 0:
+            continue
+
+        label = _label(case)
+        if label in label_set:
+            suffix = 1
+            while f"{label}.{suffix}" in label_set:
+                suffix += 1
+
+            label = f"{label}.{suffix}"
+
+        label_set.add(label)
+
+        mutations.append(
+            Mutation(
+                base=base,
+                edits=edits,
+                label=label,
+                case=case.with_preserialized_container(base.preserialized_container),
+            )
+        )
+
+    return mutations
+
+
+class Combination:
+    """Represent a negative test case which combines two mutations."""
+
+    #: Mutation applied first
+    first: Mutation
+
+    #: Mutation applied second
+    second: Mutation
+
+    #: Class of the container
+    container_class: intermediate.ConcreteClass
+
+    #: Pre-serialized container with both mutations applied
+    preserialized_container: preserialization.Instance
+
+    def __init__(
+        self,
+        first: Mutation,
+        second: Mutation,
+        container_class: intermediate.ConcreteClass,
+        preserialized_container: preserialization.Instance,
+    ) -> None:
+        """Initialize with the given values."""
+        self.first = first
+        self.second = second
+        self.container_class = container_class
+        self.preserialized_container = preserialized_container
+
+    def describe(self) -> str:
+        """Describe the combination in a human-readable form for the error messages."""
+        return f"combination of {self.first.label} and {self.second.label}"
+
+
+@require(lambda mutation_count: mutation_count >= 0)
+def pair_count(mutation_count: int) -> int:
+    """Count the unordered pairs of distinct mutations."""
+    return mutation_count * (mutation_count - 1) // 2
+
+
+@require(lambda index: index >= 0)
+@ensure(lambda result: 0 <= result[0] < result[1])
+@ensure(lambda index, result: result[1] * (result[1] - 1) // 2 + result[0] == index)
+def pair_at(index: int) -> Tuple[int, int]:
+    """
+    Map the ``index`` to the pair of mutations in the triangular enumeration.
+
+    >>> [pair_at(index) for index in range(6)]
+    [(0, 1), (0, 2), (1, 2), (0, 3), (1, 3), (2, 3)]
+    """
+    second = (1 + math.isqrt(1 + 8 * index)) // 2
+
+    first = index - second * (second - 1) // 2
+
+    return first, second
+
+
+@require(lambda mutation_count: mutation_count >= 0)
+def iterate_pairs(mutation_count: int) -> Iterator[Tuple[int, int]]:
+    """
+    Iterate over all the pairs of distinct mutations in a shuffled order.
+
+    The order is an affine permutation of the pair indices determined by the path
+    hash, so that the pairs are selected deterministically and spread over
+    the mutations without materializing them.
+    """
+    count = pair_count(mutation_count)
+    if count == 0:
+        return
+
+    digest = common.hash_path(None, ["combining", mutation_count]).hexdigest()
+
+    # The affine map ``k -> (stride * k + offset) mod count`` is a permutation of
+    # the pair indices if and only if the stride is coprime with the count.
+    stride = int(digest[:16], base=16) % count
+    while math.gcd(stride, count) != 1:
+        stride = (stride + 1) % count
+
+    offset = int(digest[16:32], base=16) % count
+
+    for k in range(count):
+        yield pair_at((stride * k + offset) % count)
+
+
+def _paths_overlap(first: Edit, second: Edit) -> bool:
+    """Check whether one of the edited properties is nested in the other one."""
+    first_path = first.path + (first.property_name,)
+    second_path = second.path + (second.property_name,)
+
+    shorter = min(len(first_path), len(second_path))
+    return first_path[:shorter] == second_path[:shorter]
+
+
+def _replicate(mutation: Mutation) -> preserialization.Instance:
+    """Pre-serialize the base container anew and apply the ``mutation`` on it."""
+    container, _ = preserialization.preserialize(mutation.base.replica.container)
+    _apply(container, mutation.edits)
+    return container
+
+
+def _merge_environments(
+    first: preserialization.Instance,
+    second: preserialization.Instance,
+    environment_cls: intermediate.ConcreteClass,
+) -> Optional[preserialization.Instance]:
+    """
+    Merge the pre-serialized environments by concatenating their lists.
+
+    Return None if the environments can not be merged, *e.g.*, if one of them has
+    been mutated so that a property is no longer a list.
+    """
+    names = [prop.name for prop in environment_cls.properties]  # type: List[str]
+    for instance in (first, second):
+        for name in instance.properties:
+            if name not in names:
+                names.append(name)
+
+    properties = preserialization.Properties()
+    for name in names:
+        if name in first.properties and name in second.properties:
+            first_value = first.properties[name]
+            second_value = second.properties[name]
+
+            if not isinstance(
+                first_value, preserialization.ListOfInstances
+            ) or not isinstance(second_value, preserialization.ListOfInstances):
+                return None
+
+            properties[name] = preserialization.ListOfInstances(
+                values=first_value.values + second_value.values
+            )
+
+        elif name in first.properties:
+            properties[name] = first.properties[name]
+
+        elif name in second.properties:
+            properties[name] = second.properties[name]
+
+    return preserialization.Instance(
+        properties=properties, class_name=environment_cls.name
+    )
+
+
+def combine(
+    first: Mutation, second: Mutation, environment_cls: intermediate.ConcreteClass
+) -> Optional[Combination]:
+    """
+    Apply both mutations and return the combined case.
+
+    Return None if the mutations can not be combined, *i.e.*, if they edit
+    the same property of the same base, or if their bases are not environments.
+    """
+    if first.base is second.base:
+        for first_edit in first.edits:
+            for second_edit in second.edits:
+                if _paths_overlap(first_edit, second_edit):
+                    return None
+
+        container = _replicate(first)
+        _apply(container, second.edits)
+
+        return Combination(
+            first=first,
+            second=second,
+            container_class=first.base.container_class,
+            preserialized_container=container,
+        )
+
+    if (
+        first.base.container_class.name != environment_cls.name
+        or second.base.container_class.name != environment_cls.name
+    ):
+        return None
+
+    merged = _merge_environments(
+        first=_replicate(first),
+        second=_replicate(second),
+        environment_cls=environment_cls,
+    )
+    if merged is None:
+        return None
+
+    return Combination(
+        first=first,
+        second=second,
+        container_class=environment_cls,
+        preserialized_container=merged,
+    )
+
+
+@require(lambda budget: budget >= 0)
+def iterate(
+    mutations: Sequence[Mutation],
+    environment_cls: intermediate.ConcreteClass,
+    budget: int,
+) -> Iterator[Combination]:
+    """
+    Iterate lazily over at most ``budget`` combinations of the ``mutations``.
+
+    The pairs which can not be combined are skipped and do not count against
+    the budget.
+    """
+    if budget == 0:
+        return
+
+    count = 0
+    for i, j in iterate_pairs(len(mutations)):
+        combination = combine(
+            first=mutations[i], second=mutations[j], environment_cls=environment_cls
+        )
+
+        if combination is None:
+            continue
+
+        yield combination
+
+        count += 1
+        if count == budget:
+            return
+
+
+_EXTENSION_BY_FORMAT = {
+    serialized.Format.JSON: "json",
+    serialized.Format.XML: "xml",
+    serialized.Format.RDF: "ttl",
+}
+assert all(fmt in _EXTENSION_BY_FORMAT for fmt in serialized.Format)
+
+
+def _class_directory(cls: intermediate.ConcreteClass, fmt: serialized.Format) -> str:
+    """Name the directory of the class as the other cases in the format do."""
+    if fmt is serialized.Format.JSON:
+        return str(aas_core_codegen.naming.json_model_type(cls.name))
+    elif fmt is serialized.Format.XML:
+        return str(aas_core_codegen.naming.xml_class_name(cls.name))
+    elif fmt is serialized.Format.RDF:
+        return str(aas_core_codegen.rdf_shacl.naming.class_name(cls.name))
+    else:
+        assert_never(fmt)
+        raise AssertionError("Unexpected execution path")
+
+
+def serialize(
+    combination: Combination,
+    fmt: serialized.Format,
+    symbol_table: intermediate.SymbolTable,
+) -> Optional[Tuple[pathlib.PurePosixPath, serialized.ExpectedOutcome, bytes]]:
+    """
+    Serialize the ``combination`` in the format ``fmt`` along its path and outcome.
+
+    Return None if either of the mutations or the combined container can not be
+    represented in the format.
+    """
+    outcomes = [
+        combination.first.outcome(fmt=fmt, symbol_table=symbol_table),
+        combination.second.outcome(fmt=fmt, symbol_table=symbol_table),
+    ]
+
+    if outcomes[0] is None or outcomes[1] is None:
+        return None
+
+    # The de-serialization fails before the verification, so an unserializable
+    # mutation makes the whole combination unserializable.
+    outcome = (
+        serialized.ExpectedOutcome.UNSERIALIZABLE
+        if serialized.ExpectedOutcome.UNSERIALIZABLE in outcomes
+        else serialized.ExpectedOutcome.INVALID
+    )
+
+    data = None  # type: Optional[bytes]
+    if fmt is serialized.Format.JSON:
+        data = aas_core3_1_testgen.generate_json.serialize_preserialized_container(
+            preserialized_container=combination.preserialized_container,
+            symbol_table=symbol_table,
+        )
+    elif fmt is serialized.Format.XML:
+        data = aas_core3_1_testgen.generate_xml.serialize_preserialized_container(
+            preserialized_container=combination.preserialized_container,
+            container_class=combination.container_class,
+            symbol_table=symbol_table,
+        )
+    elif fmt is serialized.Format.RDF:
+        data = aas_core3_1_testgen.generate_rdf.serialize_preserialized_environment(
+            preserialized_environment=combination.preserialized_container,
+            symbol_table=symbol_table,
+        )
+    else:
+        assert_never(fmt)
+
+    if data is None:
+        return None
+
+    base_pth = pathlib.PurePosixPath(fmt.value)
+
+    if combination.container_class.name == "Environment":
+        base_pth /= "ContainedInEnvironment"
+    else:
+        base_pth /= "SelfContained"
+
+    base_pth /= "Unexpected"
+
+    # RDF does not split the paths by the kinds of the negative cases.
+    if fmt is not serialized.Format.RDF:
+        base_pth /= outcome.value
+
+    relative_pth = (
+        base_pth
+        / "Combined"
+        / _class_directory(combination.container_class, fmt)
+        / (
+            f"{combination.first.label}--{combination.second.label}"
+            f".{_EXTENSION_BY_FORMAT[fmt]}"
+        )
+    )
+
+    return relative_pth, outcome, data
+
+
+def main() -> int:
+    """Execute the main routine."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--model_path", help="path to the meta-model", required=True)
+    parser.add_argument(
+        "--output_dir",
+        help="path to the directory where the combined cases are written to",
+        required=True,
+    )
+    parser.add_argument(
+        "--budget",
+        help="maximum number of the combined cases",
+        type=int,
+        default=1000,
+    )
+    parser.add_argument(
+        "--formats",
+        help="formats to serialize the combined cases to",
+        nargs="+",
+        choices=[fmt.value for fmt in serialized.Format],
+        default=[fmt.value for fmt in serialized.Format],
+    )
+    args = parser.parse_args()
+
+    budget = int(args.budget)
+    if budget < 0:
+        print(
+            f"Expected --budget to be non-negative, but got {budget}",
+            file=sys.stderr,
+        )
+        return 1
+
+    formats = [serialized.Format(value) for value in args.formats]
+
+    (
+        symbol_table,
+        constraints_by_class,
+    ) = common.load_symbol_table_and_infer_constraints_for_schema(
+        model_path=pathlib.Path(args.model_path)
+    )
+
+    mutations = collect_mutations(
+        symbol_table=symbol_table, constraints_by_class=constraints_by_class
+    )
+    print(
+        f"Collected {len(mutations)} mutations "
+        f"in {pair_count(len(mutations))} pairs."
+    )
+
+    environment_cls = symbol_table.must_find_concrete_class(Identifier("Environment"))
+
+    combination_count = 0
+    with writing.DirectorySink(directory=pathlib.Path(args.output_dir)) as sink:
+        for combination in iterate(
+            mutations=mutations, environment_cls=environment_cls, budget=budget
+        ):
+            for fmt in formats:
+                serialization = serialize(
+                    combination=combination, fmt=fmt, symbol_table=symbol_table
+                )
+
+                if serialization is None:
+                    continue
+
+                relative_pth, _, data = serialization
+                sink.write(relative_pth, data)
+
+            combination_count += 1
+
+    print(f"Generated {combination_count} combined cases.")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,18 +7,36 @@ Fix instances in place to conform to the meta-model constraints.
     Please always verify the results.
 """
 import ast
+import collections
+import copy
 import inspect
-from typing import TypeVar, List, Type, Sequence, Union, Optional
+from typing import (
+    TypeVar,
+    List,
+    Type,
+    Sequence,
+    Union,
+    Optional,
+    OrderedDict,
+    Tuple,
+    TYPE_CHECKING,
+)
 
 from typing_extensions import assert_never
 
 import aas_core3_1.constants as aas_constants
 import aas_core3_1.types as aas_types
-import aas_core3_1.verification as aas_verification
-from aas_core3_1_testgen import common, primitiving
+from aas_core3_1_testgen import common, lazy_importing, primitiving
 from aas_core3_1_testgen.codegened import abstract_fixing, preserialization, creation
 from aas_core3_1_testgen.frozen_examples import xs_value as frozen_examples_xs_value
 
+# The verification module is large. We load it lazily so that importing the library
+# does not pay for it before the first instance is fixed.
+if TYPE_CHECKING:
+    import aas_core3_1.verification as aas_verification
+else:
+    aas_verification = lazy_importing.lazy_import("aas_core3_1.verification")
+
 LangStringT = TypeVar("LangStringT", bound=aas_types.AbstractLangString)
 
 
@@ -186,9 +204,158 @@ def generate_minimal_submodel_element(
     return minimal_function(path_hash)
 
 
+class MemoStatistics:
+    """Count the hits and misses of the memoized fixing per class name."""
+
+    def __init__(self) -> None:
+        """Initialize with zero counts."""
+        self.hits = collections.Counter()  # type: collections.Counter[str]
+        self.misses = collections.Counter()  # type: collections.Counter[str]
+
+    def hit_rate(self, class_name: Optional[str] = None) -> float:
+        """
+        Compute the ratio of the hits among all the look-ups.
+
+        If ``class_name`` is given, only the look-ups of that class are considered.
+        """
+        if class_name is None:
+            hits = sum(self.hits.values())
+            total = hits + sum(self.misses.values())
+        else:
+            hits = self.hits[class_name]
+            total = hits + self.misses[class_name]
+
+        return hits / total if total > 0 else 0.0
+
+
+#: Classes whose subtrees are memoized during the fixing.
+#:
+#: These subtrees are small, repeat across all the wrapper environments and are
+#: expensive to fix since the fixes of references run the full verification.
+_MEMOIZED_CLASSES = (
+    aas_types.AdministrativeInformation,
+    aas_types.EmbeddedDataSpecification,
+    aas_types.Reference,
+)
+
+#: Maximum number of the fixed subtrees kept in the memo.
+#:
+#: The least recently used subtrees are evicted first so that the memo does not
+#: grow with the number of the generated cases.
+MEMO_CAPACITY = 4096
+
+#: Class name and the digest of the path together with the subtree before the fixing
+_MemoKey = Tuple[str, bytes]
+
+#: Fixed subtrees ordered from the least to the most recently used
+_Memo = OrderedDict[_MemoKey, aas_types.Class]
+
+
+def _update_with_subtree(parts: List[str], value: object) -> None:
+    """Append the canonical representation of the ``value`` subtree to ``parts``."""
+    if isinstance(value, aas_types.Class):
+        parts.append(f"{value.__class__.__name__}(")
+        for name, property_value in vars(value).items():
+            parts.append(f"{name}=")
+            _update_with_subtree(parts, property_value)
+        parts.append(")")
+
+    elif isinstance(value, list):
+        parts.append("[")
+        for item in value:
+            _update_with_subtree(parts, item)
+        parts.append("]")
+
+    else:
+        parts.append(f"{value!r},")
+
+
+def _context_digest(that: aas_types.Class, path_hash: common.CanHash) -> bytes:
+    """
+    Digest the path hash together with ``that`` subtree.
+
+    The fixing of a subtree depends only on the subtree itself and its path hash.
+    The path hash alone does not suffice since the callers modify the instances
+    before fixing them.
+    """
+    parts = []  # type: List[str]
+    _update_with_subtree(parts, that)
+
+    hsh = path_hash.copy()
+    hsh.update("".join(parts).encode("utf-8"))
+    return hsh.digest()
+
+
+def _replay(that: aas_types.Class, fixed: aas_types.Class) -> None:
+    """
+    Overwrite ``that`` in-place with a clone of the ``fixed`` subtree.
+
+    The instances and lists of ``that`` are re-used wherever ``fixed`` has
+    an instance of the same class at the same position so that the references
+    to them held by the callers remain valid.
+    """
+    properties = vars(that)
+
+    for name, fixed_value in vars(fixed).items():
+        value = properties[name]
+
+        if isinstance(fixed_value, aas_types.Class) and type(value) is type(
+            fixed_value
+        ):
+            _replay(value, fixed_value)
+
+        elif isinstance(fixed_value, list) and isinstance(value, list):
+            for i, fixed_item in enumerate(fixed_value):
+                if i >= len(value):
+                    value.append(copy.deepcopy(fixed_item))
+                elif type(value[i]) is type(fixed_item):
+                    _replay(value[i], fixed_item)
+                else:
+                    value[i] = copy.deepcopy(fixed_item)
+
+            del value[len(fixed_value) :]
+
+        else:
+            properties[name] = copy.deepcopy(fixed_value)
+
+
 class _Handyman(abstract_fixing.AbstractHandyman):
     """Fix the instances recursively on the best-effort basis."""
 
+    def __init__(self, memo_capacity: int = MEMO_CAPACITY) -> None:
+        """Initialize with an empty memo holding at most ``memo_capacity`` entries."""
+        self.memo = collections.OrderedDict()  # type: _Memo
+        self.memo_capacity = memo_capacity
+        self.memo_statistics = MemoStatistics()
+
+    def visit_with_context(
+        self, that: aas_types.Class, context: common.CanHash
+    ) -> None:
+        # We fix each subtree once, and re-play the result on the subsequent visits.
+        if not isinstance(that, _MEMOIZED_CLASSES):
+            that.accept_with_context(self, context)
+            return
+
+        class_name = that.__class__.__name__
+        key = (class_name, _context_digest(that, context))
+
+        fixed = self.memo.get(key, None)
+        if fixed is not None:
+            self.memo_statistics.hits[class_name] += 1
+
+            self.memo.move_to_end(key)
+            _replay(that, fixed)
+            return
+
+        self.memo_statistics.misses[class_name] += 1
+
+        that.accept_with_context(self, context)
+
+        # We memoize a clone since the callers modify the fixed instances later.
+        self.memo[key] = copy.deepcopy(that)
+        if len(self.memo) > self.memo_capacity:
+            self.memo.popitem(last=False)
+
     def _fix_annotated_relationship_element(
         self, that: aas_types.AnnotatedRelationshipElement, path_hash: common.CanHash
     ) -> None:
@@ -647,11 +814,20 @@ def assert_instance_at_path_in_environment(
 _HANDYMAN = _Handyman()
 
 
+def memo_statistics() -> MemoStatistics:
+    """Retrieve the hits and misses of the memoized fixing in this process."""
+    return _HANDYMAN.memo_statistics
+
+
 def fix(root: aas_types.Class) -> None:
     """
     Fix recursively the ``root`` instance.
 
     Usually, the ``root`` is either an Environment, or a self-contained instance.
+
+    The fixed subtrees of references, administrative information and embedded data
+    specifications are memoized up to :py:data:`MEMO_CAPACITY` entries, see
+    :py:func:`memo_statistics`.
     """
     path_hash = common.hash_path(prefix_hash=None, segment_or_segments=[])
     _HANDYMAN.visit_with_context(root, path_hash)
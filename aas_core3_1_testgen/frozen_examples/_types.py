@@ -1,5 +1,8 @@
 """Provide common data types for the frozen_examples."""
-from typing import OrderedDict
+import collections
+import json
+import pathlib
+from typing import Dict, Iterator, List, Mapping, Optional, OrderedDict, Tuple
 
 
 class Examples:
@@ -11,3 +14,69 @@ class Examples:
         """Initialize with the given values."""
         self.positives = positives
         self.negatives = negatives
+
+
+_DECODER = json.JSONDecoder()
+
+
+class LazyExamples(Mapping[str, Examples]):
+    """
+    Map keys to the examples stored in a JSON-lines file, loaded on first access.
+
+    Each line of the file is a JSON array ``[key, positives, negatives]``, where
+    the positives and the negatives are lists of ``[name, text]`` pairs. Only
+    the keys are decoded when the file is indexed; the examples of a key are
+    decoded the first time the key is looked up.
+    """
+
+    def __init__(self, path: pathlib.Path) -> None:
+        """Initialize with the given values."""
+        self.path = path
+        self._line_by_key = None  # type: Optional[Dict[str, str]]
+        self._examples_by_key = dict()  # type: Dict[str, Examples]
+
+    def _index(self) -> Dict[str, str]:
+        """Read the file and map the keys to their lines, if not already done."""
+        if self._line_by_key is None:
+            line_by_key = dict()  # type: Dict[str, str]
+
+            with self.path.open("rt", encoding="utf-8") as fid:
+                for line in fid:
+                    # We decode only the key, which is the first element of
+                    # the array, and skip the rest of the line.
+                    key, _ = _DECODER.raw_decode(line, 1)
+                    assert isinstance(key, str), (self.path, line)
+                    assert key not in line_by_key, (self.path, key)
+
+                    line_by_key[key] = line
+
+            self._line_by_key = line_by_key
+
+        return self._line_by_key
+
+    def __getitem__(self, key: str) -> Examples:
+        examples = self._examples_by_key.get(key, None)
+        if examples is not None:
+            return examples
+
+        line = self._index()[key]
+
+        decoded = json.loads(line)  # type: Tuple[str, List[List[str]], List[List[str]]]
+        _, positives, negatives = decoded
+
+        examples = Examples(
+            positives=collections.OrderedDict((name, text) for name, text in positives),
+            negatives=collections.OrderedDict((name, text) for name, text in negatives),
+        )
+        self._examples_by_key[key] = examples
+
+        return examples
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index())
+
+    def __len__(self) -> int:
+        return len(self._index())
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._index()
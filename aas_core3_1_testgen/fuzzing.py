@@ -0,0 +1,583 @@
+"""
+Stream fuzzed cases to soak-test the de-serializers and verifiers of the SDKs.
+
+Each fuzzed case mutates one to three properties of a minimal or a maximal case
+with the values drawn from the frozen examples and the primitive generators. The
+cases are generated one at a time from the seed and their index, so that any case
+can be reproduced without storing the corpus.
+"""
+import argparse
+import itertools
+import pathlib
+import sys
+import time
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterator,
+    List,
+    MutableMapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from aas_core_codegen import intermediate, infer_for_schema
+from aas_core_codegen.common import Identifier
+from icontract import require
+from typing_extensions import assert_never
+
+import aas_core3_1_testgen.generate_json
+import aas_core3_1_testgen.generate_xml
+from aas_core3_1_testgen import (
+    common,
+    generation,
+    lazy_importing,
+    primitiving,
+    serialized,
+    validation,
+)
+from aas_core3_1_testgen.codegened import preserialization
+from aas_core3_1_testgen.frozen_examples import (
+    pattern as frozen_examples_pattern,
+    xs_value as frozen_examples_xs_value,
+)
+
+# The verification is only needed once a fuzzed case is checked, so we do not load
+# the large module of the SDK at import.
+if TYPE_CHECKING:
+    import aas_core3_1.verification as aas_verification
+else:
+    aas_verification = lazy_importing.lazy_import("aas_core3_1.verification")
+
+# noinspection SpellCheckingInspection
+_XML_SERIALIZABLE_STRING_PATTERN = (
+    "^[\\x09\\x0A\\x0D\\x20-\\uD7FF\\uE000-\\uFFFD\\U00010000-\\U0010FFFF]*$"
+)
+
+#: Formats which the SDKs can de-serialize
+FORMATS = (serialized.Format.JSON, serialized.Format.XML)
+
+
+class FuzzedCase:
+    """Represent a case obtained by mutating a minimal or a maximal case."""
+
+    #: Seed of the stream
+    seed: int
+
+    #: Index of the case in the stream
+    index: int
+
+    #: Minimal or maximal case which has been mutated
+    base: Union[generation.CaseMinimal, generation.CaseMaximal]
+
+    #: Mutated properties as ``{class name}.{property name}``
+    mutated: Sequence[str]
+
+    #: Class of the container
+    container_class: intermediate.ConcreteClass
+
+    #: Pre-serialized container with the mutations applied
+    preserialized_container: preserialization.Instance
+
+    def __init__(
+        self,
+        seed: int,
+        index: int,
+        base: Union[generation.CaseMinimal, generation.CaseMaximal],
+        mutated: Sequence[str],
+        container_class: intermediate.ConcreteClass,
+        preserialized_container: preserialization.Instance,
+    ) -> None:
+        """Initialize with the given values."""
+        self.seed = seed
+        self.index = index
+        self.base = base
+        self.mutated = mutated
+        self.container_class = container_class
+        self.preserialized_container = preserialized_container
+
+    def describe(self) -> str:
+        """Describe the case in a human-readable form for the error messages."""
+        kind = "minimal" if isinstance(self.base, generation.CaseMinimal) else "maximal"
+        mutated = ", ".join(self.mutated) if len(self.mutated) > 0 else "nothing"
+
+        return (
+            f"fuzzed case {self.index} of the seed {self.seed} "
+            f"based on the {kind} {self.base.cls.name}, mutating {mutated}"
+        )
+
+
+def _iterate_instances(
+    instance: preserialization.Instance,
+) -> Iterator[preserialization.Instance]:
+    """Iterate over the ``instance`` and all its descendants in a stable order."""
+    yield instance
+
+    for value in instance.properties.values():
+        if isinstance(value, preserialization.Instance):
+            yield from _iterate_instances(value)
+        elif isinstance(value, preserialization.ListOfInstances):
+            for item in value.values:
+                yield from _iterate_instances(item)
+
+
+def _is_fuzzable(prop: intermediate.Property) -> bool:
+    """Check that the value of ``prop`` is a primitive or an enumeration literal."""
+    type_anno = intermediate.beneath_optional(prop.type_annotation)
+
+    return intermediate.try_primitive_type(type_anno) is not None or (
+        isinstance(type_anno, intermediate.OurTypeAnnotation)
+        and isinstance(type_anno.our_type, intermediate.Enumeration)
+    )
+
+
+class Fuzzer:
+    """Generate the fuzzed cases from the minimal and maximal cases of all classes."""
+
+    def __init__(
+        self,
+        symbol_table: intermediate.SymbolTable,
+        constraints_by_class: MutableMapping[
+            intermediate.ClassUnion, infer_for_schema.ConstraintsByProperty
+        ],
+    ) -> None:
+        """Generate the base cases of all the concrete classes."""
+        self._symbol_table = symbol_table
+        self._constraints_by_class = constraints_by_class
+
+        environment_cls = symbol_table.must_find_concrete_class(
+            Identifier("Environment")
+        )
+
+        self._bases = (
+            []
+        )  # type: List[Union[generation.CaseMinimal, generation.CaseMaximal]]
+        for our_type in sorted(
+            symbol_table.our_types, key=lambda an_our_type: str(an_our_type.name)
+        ):
+            if not isinstance(our_type, intermediate.ConcreteClass):
+                continue
+
+            self._bases.append(
+                generation.generate_minimal_case(
+                    cls=our_type, environment_cls=environment_cls
+                )
+            )
+            self._bases.append(
+                generation.generate_maximal_case(
+                    cls=our_type, environment_cls=environment_cls
+                )
+            )
+
+        self._fuzzable_properties_by_class_name = (
+            dict()
+        )  # type: Dict[str, List[intermediate.Property]]
+
+    def _fuzzable_properties(self, class_name: str) -> List[intermediate.Property]:
+        """Retrieve the properties of ``class_name`` whose values can be fuzzed."""
+        result = self._fuzzable_properties_by_class_name.get(class_name, None)
+        if result is None:
+            cls = self._symbol_table.must_find_concrete_class(Identifier(class_name))
+            result = [prop for prop in cls.properties if _is_fuzzable(prop)]
+            self._fuzzable_properties_by_class_name[class_name] = result
+
+        return result
+
+    def _fuzz_str(
+        self,
+        path_hash: common.CanHash,
+        instance: preserialization.Instance,
+        prop: intermediate.Property,
+    ) -> str:
+        """Draw a string for ``prop`` from the frozen examples or around its length."""
+        value_type = instance.properties.get("value_type", None)
+        if prop.name in ("value", "min", "max") and isinstance(value_type, str):
+            value_examples = frozen_examples_xs_value.BY_VALUE_TYPE.get(
+                value_type, None
+            )
+            if value_examples is not None:
+                return primitiving.choose_value(
+                    path_hash,
+                    list(value_examples.positives.values())
+                    + list(value_examples.negatives.values()),
+                )
+
+        cls = self._symbol_table.must_find_concrete_class(
+            Identifier(instance.class_name)
+        )
+        constraints_by_property = self._constraints_by_class[cls]
+
+        pattern_constraints = constraints_by_property.patterns_by_property.get(
+            prop, None
+        )
+        if pattern_constraints is not None:
+            # We drop the constraint for XML serializable strings as we do in
+            # the generation of the pattern examples.
+            patterns = [
+                pattern_constraint.pattern
+                for pattern_constraint in pattern_constraints
+                if pattern_constraint.pattern != _XML_SERIALIZABLE_STRING_PATTERN
+            ]
+
+            if len(patterns) == 1:
+                pattern_examples = frozen_examples_pattern.BY_PATTERN[patterns[0]]
+                return primitiving.choose_value(
+                    path_hash,
+                    list(pattern_examples.positives.values())
+                    + list(pattern_examples.negatives.values()),
+                )
+
+        lengths = [0, 1, len(primitiving.generate_str(path_hash))]
+
+        len_constraint = constraints_by_property.len_constraints_by_property.get(
+            prop, None
+        )
+        if len_constraint is not None:
+            for bound in (len_constraint.min_value, len_constraint.max_value):
+                if bound is not None:
+                    lengths.extend((bound - 1, bound, bound + 1))
+
+        length = primitiving.choose_value(
+            common.hash_path(path_hash, "length"),
+            sorted(set(length for length in lengths if length >= 0)),
+        )
+
+        return primitiving.generate_str_of_exact_len(path_hash.hexdigest(), length)
+
+    def _fuzz_value(
+        self,
+        path_hash: common.CanHash,
+        instance: preserialization.Instance,
+        prop: intermediate.Property,
+    ) -> preserialization.PrimitiveValueUnion:
+        """Draw a value for ``prop`` of the ``instance`` based on the ``path_hash``."""
+        type_anno = intermediate.beneath_optional(prop.type_annotation)
+
+        if isinstance(type_anno, intermediate.OurTypeAnnotation) and isinstance(
+            type_anno.our_type, intermediate.Enumeration
+        ):
+            return primitiving.choose_value(
+                path_hash,
+                [str(literal.value) for literal in type_anno.our_type.literals],
+            )
+
+        primitive_type = intermediate.try_primitive_type(type_anno)
+        assert primitive_type is not None, (
+            f"Unexpected property {prop.name!r} which is neither primitive "
+            f"nor an enumeration"
+        )
+
+        if primitive_type is intermediate.PrimitiveType.BOOL:
+            return primitiving.generate_bool(path_hash)
+
+        elif primitive_type is intermediate.PrimitiveType.INT:
+            return primitiving.generate_int64(path_hash)
+
+        elif primitive_type is intermediate.PrimitiveType.FLOAT:
+            return primitiving.generate_float(path_hash)
+
+        elif primitive_type is intermediate.PrimitiveType.STR:
+            return self._fuzz_str(path_hash=path_hash, instance=instance, prop=prop)
+
+        elif primitive_type is intermediate.PrimitiveType.BYTEARRAY:
+            cls = self._symbol_table.must_find_concrete_class(
+                Identifier(instance.class_name)
+            )
+            len_constraint = self._constraints_by_class[
+                cls
+            ].len_constraints_by_property.get(prop, None)
+
+            return primitiving.generate_bytes(
+                path_hash,
+                min_len=len_constraint.min_value
+                if len_constraint is not None
+                else None,
+                max_len=len_constraint.max_value
+                if len_constraint is not None
+                else None,
+            )
+
+        else:
+            assert_never(primitive_type)
+            raise AssertionError("Unexpected execution path")
+
+    @require(lambda seed, index: seed >= 0 and index >= 0)
+    def generate_case(self, seed: int, index: int) -> FuzzedCase:
+        """Generate the fuzzed case at ``index`` in the stream of the ``seed``."""
+        path_hash = common.hash_path(None, ["fuzzing", seed, index])
+
+        base = primitiving.choose_value(
+            common.hash_path(path_hash, "base"), self._bases
+        )
+
+        preserialized_container, _ = preserialization.preserialize(
+            base.replica.container
+        )
+
+        candidates = [
+            (instance, prop)
+            for instance in _iterate_instances(preserialized_container)
+            for prop in self._fuzzable_properties(instance.class_name)
+            if prop.name in instance.properties
+        ]  # type: List[Tuple[preserialization.Instance, intermediate.Property]]
+
+        mutated = []  # type: List[str]
+
+        # Some minimal cases, such as an empty environment, have nothing to mutate.
+        # We still yield them as they are, since they are valid inputs for a soak.
+        if len(candidates) > 0:
+            mutation_count = 1 + primitiving.generate_int(
+                common.hash_path(path_hash, "mutation_count")
+            ) % min(3, len(candidates))
+
+            for i in range(mutation_count):
+                mutation_hash = common.hash_path(path_hash, ["mutation", i])
+
+                instance, prop = primitiving.choose_value(
+                    common.hash_path(mutation_hash, "candidate"), candidates
+                )
+
+                instance.properties[prop.name] = self._fuzz_value(
+                    path_hash=common.hash_path(mutation_hash, "value"),
+                    instance=instance,
+                    prop=prop,
+                )
+
+                mutated.append(f"{instance.class_name}.{prop.name}")
+
+        return FuzzedCase(
+            seed=seed,
+            index=index,
+            base=base,
+            mutated=mutated,
+            container_class=base.container_class,
+            preserialized_container=preserialized_container,
+        )
+
+    @require(lambda seed, start: seed >= 0 and start >= 0)
+    def stream(self, seed: int, start: int = 0) -> Iterator[FuzzedCase]:
+        """Generate the fuzzed cases of the ``seed`` endlessly from ``start`` on."""
+        index = start
+        while True:
+            yield self.generate_case(seed=seed, index=index)
+            index += 1
+
+
+@require(lambda fmt: fmt in FORMATS)
+def serialize(
+    fuzzed_case: FuzzedCase,
+    fmt: serialized.Format,
+    symbol_table: intermediate.SymbolTable,
+) -> Optional[bytes]:
+    """
+    Serialize the ``fuzzed_case`` in the format ``fmt``.
+
+    Return None if the case can not be represented in the format.
+    """
+    if fmt is serialized.Format.JSON:
+        return aas_core3_1_testgen.generate_json.serialize_preserialized_container(
+            preserialized_container=fuzzed_case.preserialized_container,
+            symbol_table=symbol_table,
+        )
+    elif fmt is serialized.Format.XML:
+        return aas_core3_1_testgen.generate_xml.serialize_preserialized_container(
+            preserialized_container=fuzzed_case.preserialized_container,
+            container_class=fuzzed_case.container_class,
+            symbol_table=symbol_table,
+        )
+    elif fmt is serialized.Format.RDF:
+        raise AssertionError("Unexpected execution path")
+    else:
+        assert_never(fmt)
+        raise AssertionError("Unexpected execution path")
+
+
+@require(lambda fmt: fmt in FORMATS)
+def observe(
+    data: bytes, fmt: serialized.Format, container_class: intermediate.ConcreteClass
+) -> serialized.ExpectedOutcome:
+    """
+    De-serialize and verify the ``data`` with the SDK, and report the outcome.
+
+    Any exception other than a de-serialization error is a bug in the SDK, and
+    is propagated.
+    """
+    instance, _ = validation.deserialize_instance(
+        data=data, fmt=fmt, class_name=container_class.name
+    )
+    if instance is None:
+        return serialized.ExpectedOutcome.UNSERIALIZABLE
+
+    if next(iter(aas_verification.verify(instance)), None) is not None:
+        return serialized.ExpectedOutcome.INVALID
+
+    return serialized.ExpectedOutcome.EXPECTED
+
+
+class RateMeter:
+    """Measure the rate of the cases over the whole run and since the last report."""
+
+    def __init__(self) -> None:
+        """Start the measurement now."""
+        self.start = time.perf_counter()
+        self.count = 0
+
+        self._last_report = self.start
+        self._last_count = 0
+
+    def tick(self) -> None:
+        """Count a case."""
+        self.count += 1
+
+    def rate(self) -> float:
+        """Compute the overall rate in cases per second."""
+        duration = time.perf_counter() - self.start
+        return self.count / duration if duration > 0 else 0.0
+
+    def report_due(self, interval: float) -> bool:
+        """Check whether ``interval`` seconds passed since the last report."""
+        return time.perf_counter() - self._last_report >= interval
+
+    def report(self) -> str:
+        """Report the overall rate and the rate since the last report."""
+        now = time.perf_counter()
+
+        duration = now - self._last_report
+        recent_rate = (
+            (self.count - self._last_count) / duration if duration > 0 else 0.0
+        )
+
+        self._last_report = now
+        self._last_count = self.count
+
+        return (
+            f"{self.count} cases, {recent_rate:.1f} cases/s recently, "
+            f"{self.rate():.1f} cases/s overall"
+        )
+
+
+def main() -> int:
+    """Execute the main routine."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--model_path", help="path to the meta-model", required=True)
+    parser.add_argument("--seed", help="seed of the fuzzed stream", type=int, default=0)
+    parser.add_argument(
+        "--start",
+        help="index of the first case, to reproduce a case of a previous run",
+        type=int,
+        default=0,
+    )
+    parser.add_argument(
+        "--count",
+        help="number of the fuzzed cases; 0 means endless",
+        type=int,
+        default=0,
+    )
+    parser.add_argument(
+        "--format",
+        help="format to serialize the fuzzed cases to",
+        choices=[fmt.value for fmt in FORMATS],
+        default=serialized.Format.JSON.value,
+    )
+    parser.add_argument(
+        "--report_interval",
+        help="interval between the reports of the rate, in seconds",
+        type=float,
+        default=5.0,
+    )
+    parser.add_argument(
+        "--generate_only",
+        help=(
+            "if set, only generate and serialize the cases without loading them "
+            "with the SDK, to measure the generator itself"
+        ),
+        action="store_true",
+    )
+    args = parser.parse_args()
+
+    seed = int(args.seed)
+    start = int(args.start)
+    count = int(args.count)
+    for name, value in (("--seed", seed), ("--start", start), ("--count", count)):
+        if value < 0:
+            print(
+                f"Expected {name} to be non-negative, but got {value}",
+                file=sys.stderr,
+            )
+            return 1
+
+    fmt = serialized.Format(args.format)
+
+    (
+        symbol_table,
+        constraints_by_class,
+    ) = common.load_symbol_table_and_infer_constraints_for_schema(
+        model_path=pathlib.Path(args.model_path)
+    )
+
+    fuzzer = Fuzzer(
+        symbol_table=symbol_table, constraints_by_class=constraints_by_class
+    )
+
+    outcome_counts = {
+        outcome: 0 for outcome in serialized.ExpectedOutcome
+    }  # type: Dict[serialized.ExpectedOutcome, int]
+    skipped = 0
+    failures = 0
+
+    fuzzed_cases = fuzzer.stream(seed=seed, start=start)  # type: Iterator[FuzzedCase]
+    if count != 0:
+        # We must not pull a case beyond the count as every case is generated
+        # anew from the stream.
+        fuzzed_cases = itertools.islice(fuzzed_cases, count)
+
+    meter = RateMeter()
+    try:
+        for fuzzed_case in fuzzed_cases:
+            data = serialize(
+                fuzzed_case=fuzzed_case, fmt=fmt, symbol_table=symbol_table
+            )
+
+            if data is None:
+                skipped += 1
+
+            elif not args.generate_only:
+                try:
+                    outcome = observe(
+                        data=data, fmt=fmt, container_class=fuzzed_case.container_class
+                    )
+                    outcome_counts[outcome] += 1
+                except Exception as exception:  # pylint: disable=broad-except
+                    failures += 1
+                    print(
+                        f"Failed to load the {fuzzed_case.describe()} "
+                        f"(reproduce with --seed {seed} --start {fuzzed_case.index} "
+                        f"--count 1): {exception!r}",
+                        file=sys.stderr,
+                    )
+
+            meter.tick()
+
+            if meter.report_due(args.report_interval):
+                print(f"{meter.report()}.")
+
+    except KeyboardInterrupt:
+        print("Interrupted.", file=sys.stderr)
+
+    outcomes_str = ", ".join(
+        f"{outcome_counts[outcome]} {outcome.value.lower()}"
+        for outcome in serialized.ExpectedOutcome
+    )
+    print(
+        f"Generated {meter.count} cases at {meter.rate():.1f} cases/s: "
+        f"{outcomes_str}, {skipped} not representable in {fmt.value}, "
+        f"{failures} failed."
+    )
+
+    return 1 if failures > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
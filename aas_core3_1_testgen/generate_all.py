@@ -1,38 +1,459 @@
 """Generate all the test data."""
 
 import argparse
+import contextlib
+import hashlib
 import pathlib
 import sys
+from typing import AbstractSet, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import aas_core_codegen.naming
+from typing_extensions import assert_never
 
 import aas_core3_1_testgen.generate_json
 import aas_core3_1_testgen.generate_rdf
 import aas_core3_1_testgen.generate_xml
+from aas_core3_1_testgen import (
+    cataloging,
+    common,
+    generation,
+    minimizing,
+    serialized,
+    snapshotting,
+    validation,
+    writing,
+)
+
+
+def _entry_for_case(
+    test_case: generation.CaseUnion,
+    relative_path: pathlib.PurePosixPath,
+    fmt: serialized.Format,
+    expected_outcome: serialized.ExpectedOutcome,
+    data: bytes,
+) -> cataloging.Entry:
+    """Describe the ``test_case`` serialized as ``data`` for the catalog."""
+    assert test_case.__class__.__name__.startswith("Case")
+
+    example_name = getattr(test_case, "example_name", None)
+    if example_name is None:
+        example_name = getattr(test_case, "name", None)
+
+    return cataloging.Entry(
+        relative_path=relative_path,
+        fmt=fmt,
+        container_class=test_case.container_class.name,
+        class_name=test_case.cls.name,
+        kind=test_case.__class__.__name__[len("Case") :],
+        property_name=test_case.concerned_property_name(),
+        example_name=example_name,
+        expected_outcome=expected_outcome,
+        sha256=hashlib.sha256(data).hexdigest(),
+    )
+
+
+def _verify_inline(
+    relative_path: pathlib.PurePosixPath,
+    fmt: serialized.Format,
+    expected_outcome: serialized.ExpectedOutcome,
+    data: bytes,
+    description: str,
+) -> None:
+    """Verify the serialized case in memory before it is yielded."""
+    error = validation.check_case(
+        relative_path=relative_path,
+        fmt=fmt,
+        expected_outcome=expected_outcome,
+        data=data,
+    )
+    if error is not None:
+        raise AssertionError(
+            f"The {description} serialized to {relative_path} "
+            f"is expected to be {expected_outcome.value}: {error}"
+        )
+
+
+def iterate(
+    model_path: pathlib.Path,
+    formats: Sequence[serialized.Format] = (
+        serialized.Format.JSON,
+        serialized.Format.XML,
+        serialized.Format.RDF,
+    ),
+    minimizer: Optional[minimizing.Minimizer] = None,
+    catalog: Optional[cataloging.CatalogWriter] = None,
+    class_names: Optional[AbstractSet[str]] = None,
+    snapshot_path: Optional[pathlib.Path] = None,
+    verify_inline: bool = False,
+    check_direct: bool = False,
+) -> Iterator[serialized.SerializedCase]:
+    """
+    Iterate over all the test cases serialized in the given ``formats``.
+
+    The cases are generated only once and serialized in memory to each of the
+    formats. The consumers can thus verify the data in-process without writing it
+    to and re-reading it from the disk.
+
+    If ``minimizer`` is given, the negative cases derived from the maximal cases
+    are minimized before the serialization.
+
+    If ``catalog`` is given, every serialized case is recorded in it.
+
+    If ``class_names`` are given, only the cases of these concrete classes are
+    serialized, *e.g.*, the classes affected by a change of the meta-model as
+    determined by :py:mod:`impact_analysis`.
+
+    If ``snapshot_path`` is given, the cases are replayed from the snapshot
+    recorded by :py:mod:`snapshotting` instead of being generated.
+
+    If ``verify_inline`` is set, the JSON and XML cases are de-serialized and
+    verified in memory. The RDF cases are not verified since the SDK can not
+    de-serialize RDF.
+
+    If ``check_direct`` or ``verify_inline`` is set, the JSON cases serialized
+    directly from the model are checked to match their pre-serialized route.
+    """
+    (
+        symbol_table,
+        constraints_by_class,
+    ) = common.load_symbol_table_and_infer_constraints_for_schema(model_path=model_path)
+
+    test_cases: Iterator[generation.CaseUnion]
+    if snapshot_path is not None:
+        test_cases = (
+            test_case
+            for test_case in snapshotting.replay(
+                path=snapshot_path, model_path=model_path, symbol_table=symbol_table
+            )
+            if class_names is None or test_case.cls.name in class_names
+        )
+    else:
+        test_cases = generation.generate(
+            symbol_table=symbol_table,
+            constraints_by_class=constraints_by_class,
+            class_names=class_names,
+        )
+
+    for test_case in test_cases:
+        if minimizer is not None and isinstance(
+            test_case,
+            (
+                generation.CaseTypeViolation,
+                generation.CasePatternViolation,
+                generation.CaseMaxLengthViolation,
+                generation.CaseEnumViolation,
+            ),
+        ):
+            test_case = minimizer.minimize(case=test_case, symbol_table=symbol_table)
+
+        for fmt in formats:
+            serialization: Optional[
+                Tuple[pathlib.Path, serialized.ExpectedOutcome, bytes]
+            ]
+
+            if fmt is serialized.Format.JSON:
+                serialization = aas_core3_1_testgen.generate_json.serialize_case(
+                    test_case=test_case,
+                    symbol_table=symbol_table,
+                    check_direct=check_direct or verify_inline,
+                )
+            elif fmt is serialized.Format.XML:
+                serialization = aas_core3_1_testgen.generate_xml.serialize_case(
+                    test_case=test_case, symbol_table=symbol_table
+                )
+            elif fmt is serialized.Format.RDF:
+                serialization = aas_core3_1_testgen.generate_rdf.serialize_case(
+                    test_case=test_case, symbol_table=symbol_table
+                )
+            else:
+                assert_never(fmt)
+
+            if serialization is None:
+                continue
+
+            relative_pth, expected_outcome, data = serialization
+            relative_posix_pth = pathlib.PurePosixPath(relative_pth.as_posix())
+
+            if verify_inline and fmt is not serialized.Format.RDF:
+                _verify_inline(
+                    relative_path=relative_posix_pth,
+                    fmt=fmt,
+                    expected_outcome=expected_outcome,
+                    data=data,
+                    description=f"case {test_case.describe()}",
+                )
+
+            if catalog is not None:
+                catalog.write(
+                    _entry_for_case(
+                        test_case=test_case,
+                        relative_path=relative_posix_pth,
+                        fmt=fmt,
+                        expected_outcome=expected_outcome,
+                        data=data,
+                    )
+                )
+
+            yield relative_posix_pth, fmt, expected_outcome, data
+
+    if serialized.Format.JSON in formats:
+        class_name_by_model_type = {
+            str(aas_core_codegen.naming.json_model_type(cls.name)): cls.name
+            for cls in symbol_table.concrete_classes
+        }
+
+        for (
+            relative_pth,
+            expected_outcome,
+            data,
+        ) in aas_core3_1_testgen.generate_json.serialize_model_type_cases(
+            symbol_table=symbol_table
+        ):
+            relative_posix_pth = pathlib.PurePosixPath(relative_pth.as_posix())
+
+            # These cases are not generated from the cases of :py:mod:`generation`,
+            # so we read the cause and the class from the path,
+            # ``Json/{container}/Unexpected/{kind}/{cause}/{class}/``.
+            class_name = class_name_by_model_type[relative_posix_pth.parts[5]]
+
+            if class_names is not None and class_name not in class_names:
+                continue
+
+            if verify_inline:
+                _verify_inline(
+                    relative_path=relative_posix_pth,
+                    fmt=serialized.Format.JSON,
+                    expected_outcome=expected_outcome,
+                    data=data,
+                    description=(
+                        "JSON-specific case with a missing or invalid modelType"
+                    ),
+                )
+
+            if catalog is not None:
+                catalog.write(
+                    cataloging.Entry(
+                        relative_path=relative_posix_pth,
+                        fmt=serialized.Format.JSON,
+                        container_class=(
+                            "Environment"
+                            if relative_posix_pth.parts[1] == "ContainedInEnvironment"
+                            else class_name
+                        ),
+                        class_name=class_name,
+                        kind=relative_posix_pth.parts[4],
+                        property_name=None,
+                        example_name=None,
+                        expected_outcome=expected_outcome,
+                        sha256=hashlib.sha256(data).hexdigest(),
+                    )
+                )
+
+            yield relative_posix_pth, serialized.Format.JSON, expected_outcome, data
+
+
+def _delete_stale_files(
+    test_data_dir: pathlib.Path,
+    catalog_path: pathlib.Path,
+    class_names: AbstractSet[str],
+) -> List[str]:
+    """
+    Delete the files of the ``class_names`` recorded in the catalog at ``catalog_path``.
+
+    :return: relative POSIX paths of the deleted files
+    """
+    result = []  # type: List[str]
+
+    for class_name in sorted(class_names):
+        for entry in cataloging.select(path=catalog_path, class_name=class_name):
+            name = entry.relative_path.as_posix()
+
+            pth = test_data_dir / name
+            if pth.exists():
+                pth.unlink()
+
+            result.append(name)
+
+    return result
 
 
 def main() -> int:
     """Execute the main routine."""
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--model_path", help="path to the meta-model", required=True)
-    parser.add_argument(
+    output_group = parser.add_mutually_exclusive_group(required=True)
+    output_group.add_argument(
         "--test_data_dir",
         help="path to the directory where the generated data resides",
-        required=True,
+    )
+    output_group.add_argument(
+        "--archive_path",
+        help=(
+            "path to a single .zip, .tar or .tar.gz archive "
+            "where the generated data is written to"
+        ),
+    )
+    output_group.add_argument(
+        "--content_addressed_dir",
+        help=(
+            "path to the directory of a content-addressed store where each distinct "
+            "generated payload is stored only once"
+        ),
+    )
+    parser.add_argument(
+        "--fsync",
+        help=(
+            "if set, synchronize the files written to --test_data_dir "
+            "with the disk once at the end"
+        ),
+        action="store_true",
+    )
+    parser.add_argument(
+        "--minimize",
+        help=(
+            "if set, shrink the negative cases derived from the maximal cases "
+            "while keeping their failures in the SDK"
+        ),
+        action="store_true",
+    )
+    parser.add_argument(
+        "--catalog_path",
+        help=(
+            "if set, record the generated cases in an indexed SQLite catalog "
+            "at this path"
+        ),
+    )
+    parser.add_argument(
+        "--class_names",
+        help=(
+            "if set, generate only the cases of these concrete classes, "
+            "e.g., as reported by impact_analysis --names_only; if --catalog_path "
+            "exists, the recorded cases of these classes are replaced, i.e., "
+            "their files are deleted from --test_data_dir, and the catalog and "
+            "the manifest are updated in place"
+        ),
+        nargs="+",
+    )
+    parser.add_argument(
+        "--verify_inline",
+        help=(
+            "if set, verify the cases in memory during the generation "
+            "instead of re-reading the written files afterwards"
+        ),
+        action="store_true",
+    )
+    parser.add_argument(
+        "--snapshot_path",
+        help=(
+            "if set, replay the cases from the snapshot at this path "
+            "instead of generating them"
+        ),
     )
     args = parser.parse_args()
 
     model_path = pathlib.Path(args.model_path)
-    test_data_dir = pathlib.Path(args.test_data_dir)
 
-    aas_core3_1_testgen.generate_json.generate(
-        model_path=model_path, test_data_dir=test_data_dir
+    sink: writing.Sink
+    if args.test_data_dir is not None:
+        sink = writing.DirectorySink(
+            directory=pathlib.Path(args.test_data_dir), fsync=args.fsync
+        )
+    elif args.content_addressed_dir is not None:
+        sink = writing.ContentAddressedSink(
+            directory=pathlib.Path(args.content_addressed_dir)
+        )
+    else:
+        archive_path = pathlib.Path(args.archive_path)
+        if not writing.ArchiveReader.is_supported(archive_path):
+            print(
+                f"Expected --archive_path to end with .zip, .tar or .tar.gz, "
+                f"but got: {archive_path}",
+                file=sys.stderr,
+            )
+            return 1
+
+        sink = writing.ArchiveSink(path=archive_path)
+
+    minimizer = minimizing.Minimizer() if args.minimize else None
+
+    class_names = set(args.class_names) if args.class_names is not None else None
+
+    catalog_path = (
+        pathlib.Path(args.catalog_path) if args.catalog_path is not None else None
     )
-    aas_core3_1_testgen.generate_rdf.generate(
-        model_path=model_path, test_data_dir=test_data_dir
+
+    # If only some classes are regenerated, we replace their cases as recorded in
+    # the previous catalog, and keep the cases of all the other classes.
+    replaced_class_names = (
+        class_names if catalog_path is not None and catalog_path.exists() else None
     )
-    aas_core3_1_testgen.generate_xml.generate(
-        model_path=model_path, test_data_dir=test_data_dir
+
+    test_data_dir = (
+        pathlib.Path(args.test_data_dir) if args.test_data_dir is not None else None
     )
 
+    stale_names = []  # type: List[str]
+    if replaced_class_names is not None and test_data_dir is not None:
+        assert catalog_path is not None
+        stale_names = _delete_stale_files(
+            test_data_dir=test_data_dir,
+            catalog_path=catalog_path,
+            class_names=replaced_class_names,
+        )
+
+    digest_by_name = dict()  # type: Dict[str, str]
+
+    with contextlib.ExitStack() as exit_stack:
+        catalog = (
+            exit_stack.enter_context(
+                cataloging.CatalogWriter(
+                    path=catalog_path, replaced_class_names=replaced_class_names
+                )
+            )
+            if catalog_path is not None
+            else None
+        )
+
+        exit_stack.enter_context(sink)
+
+        for relative_pth, _, _, data in iterate(
+            model_path=model_path,
+            minimizer=minimizer,
+            catalog=catalog,
+            class_names=class_names,
+            snapshot_path=(
+                pathlib.Path(args.snapshot_path)
+                if args.snapshot_path is not None
+                else None
+            ),
+            verify_inline=args.verify_inline,
+        ):
+            sink.write(relative_pth, data)
+
+            if replaced_class_names is not None and test_data_dir is not None:
+                digest_by_name[relative_pth.as_posix()] = hashlib.sha256(
+                    data
+                ).hexdigest()
+
+    if minimizer is not None:
+        print(minimizer.statistics.report())
+
+    if isinstance(sink, writing.ContentAddressedSink):
+        print(sink.statistics.report())
+
+    if test_data_dir is not None:
+        if (
+            replaced_class_names is not None
+            and (test_data_dir / writing.MANIFEST).exists()
+        ):
+            writing.update_manifest(
+                test_data_dir=test_data_dir,
+                removed_names=stale_names,
+                digest_by_name=digest_by_name,
+            )
+        else:
+            writing.write_manifest(test_data_dir=test_data_dir)
+
     return 0
 
 
@@ -11,9 +11,12 @@ from typing import (
     OrderedDict,
     List,
     Any,
+    Iterator,
     MutableMapping,
     Sequence,
     Optional,
+    Tuple,
+    TYPE_CHECKING,
 )
 
 import aas_core_codegen.common
@@ -23,10 +26,21 @@ from aas_core_codegen.common import Identifier
 from icontract import ensure, require
 from typing_extensions import assert_never
 
-from aas_core3_1 import jsonization as aasjsonization, verification as aasverification
-from aas_core3_1_testgen import common, generation
+from aas_core3_1_testgen import (
+    common,
+    generation,
+    lazy_importing,
+    serialized,
+    validation,
+    writing,
+)
 from aas_core3_1_testgen.codegened import preserialization
 
+if TYPE_CHECKING:
+    import aas_core3_1.jsonization as aas_jsonization
+else:
+    aas_jsonization = lazy_importing.lazy_import("aas_core3_1.jsonization")
+
 
 # NOTE (mristin):
 # We explicitly decouple the path generation code from XML and other formats since it
@@ -480,20 +494,25 @@ def dereference(
     return cursor
 
 
-def _generate_unserializables_without_model_type(
-    symbol_table: intermediate.SymbolTable, test_data_dir: pathlib.Path
-) -> None:
-    """Generate the special cases where the required ``modelType`` is missing."""
+def _generate_minimal_cases_with_model_type(
+    symbol_table: intermediate.SymbolTable,
+) -> List[generation.CaseMinimal]:
+    """Generate the minimal cases of the classes serialized with ``modelType``."""
     environment_cls = symbol_table.must_find_concrete_class(Identifier("Environment"))
 
-    for cls in symbol_table.concrete_classes:
-        if not cls.serialization.with_model_type:
-            continue
+    return [
+        generation.generate_minimal_case(cls=cls, environment_cls=environment_cls)
+        for cls in symbol_table.concrete_classes
+        if cls.serialization.with_model_type
+    ]
 
-        minimal_case = generation.generate_minimal_case(
-            cls=cls, environment_cls=environment_cls
-        )
 
+def _generate_unserializables_without_model_type(
+    symbol_table: intermediate.SymbolTable,
+    minimal_cases: Sequence[generation.CaseMinimal],
+) -> Iterator[Tuple[pathlib.Path, bytes]]:
+    """Generate the special cases where the required ``modelType`` is missing."""
+    for minimal_case in minimal_cases:
         serializer_without_model_type = _SerializerWithoutModelType(
             symbol_table=symbol_table,
             target_instance=minimal_case.preserialized_instance,
@@ -520,29 +539,15 @@ def _generate_unserializables_without_model_type(
             instance=minimal_case.preserialized_container
         )
 
-        pth = test_data_dir / relative_pth
-
-        parent = pth.parent
-        parent.mkdir(parents=True, exist_ok=True)
-
-        with pth.open("wt") as fid:
-            json.dump(jsonable, fid, indent=2, sort_keys=True)
+        yield relative_pth, _dump(jsonable)
 
 
 def _generate_unserializables_with_invalid_model_type(
-    symbol_table: intermediate.SymbolTable, test_data_dir: pathlib.Path
-) -> None:
+    symbol_table: intermediate.SymbolTable,
+    minimal_cases: Sequence[generation.CaseMinimal],
+) -> Iterator[Tuple[pathlib.Path, bytes]]:
     """Generate the special cases where the required ``modelType`` is invalid."""
-    environment_cls = symbol_table.must_find_concrete_class(Identifier("Environment"))
-
-    for cls in symbol_table.concrete_classes:
-        if not cls.serialization.with_model_type:
-            continue
-
-        minimal_case = generation.generate_minimal_case(
-            cls=cls, environment_cls=environment_cls
-        )
-
+    for minimal_case in minimal_cases:
         serializer_with_invalid_model_type = _SerializerWithInvalidModelType(
             symbol_table=symbol_table,
             target_instance=minimal_case.preserialized_instance,
@@ -569,51 +574,148 @@ def _generate_unserializables_with_invalid_model_type(
             instance=minimal_case.preserialized_container
         )
 
-        pth = test_data_dir / relative_pth
+        yield relative_pth, _dump(jsonable)
 
-        parent = pth.parent
-        parent.mkdir(parents=True, exist_ok=True)
 
-        with pth.open("wt") as fid:
-            json.dump(jsonable, fid, indent=2, sort_keys=True)
+def _dump(jsonable: Any) -> bytes:
+    """Serialize the ``jsonable`` to the bytes of a test data file."""
+    return json.dumps(jsonable, indent=2, sort_keys=True).encode("utf-8")
 
 
-def generate(model_path: pathlib.Path, test_data_dir: pathlib.Path) -> None:
-    """Generate the JSON files."""
-    (
-        symbol_table,
-        constraints_by_class,
-    ) = common.load_symbol_table_and_infer_constraints_for_schema(model_path=model_path)
+def _expected_outcome(relative_path: pathlib.Path) -> serialized.ExpectedOutcome:
+    """
+    Determine the expected outcome of the case at ``relative_path``.
+
+    >>> _expected_outcome(
+    ...     pathlib.Path(
+    ...         "Json/ContainedInEnvironment/Unexpected/Invalid/MaxLengthViolation/"
+    ...         "Property/idShort.json"
+    ...     )
+    ... )
+    <ExpectedOutcome.INVALID: 'Invalid'>
+    """
+    if relative_path.parts[2] == "Expected":
+        return serialized.ExpectedOutcome.EXPECTED
 
-    serializer = _Serializer(symbol_table=symbol_table)
+    assert relative_path.parts[2] == "Unexpected", f"{relative_path=}"
+    kind = KindOfNegative(relative_path.parts[3])
 
-    for test_case in generation.generate(
-        symbol_table=symbol_table, constraints_by_class=constraints_by_class
-    ):
-        relative_pth = _relative_path(test_case=test_case)
-        jsonable = serializer.serialize_instance(
-            instance=test_case.preserialized_container
+    if kind is KindOfNegative.UNSERIALIZABLE:
+        return serialized.ExpectedOutcome.UNSERIALIZABLE
+    elif kind is KindOfNegative.INVALID:
+        return serialized.ExpectedOutcome.INVALID
+    else:
+        assert_never(kind)
+        raise AssertionError("Unexpected execution path")
+
+
+def serialize_preserialized_container(
+    preserialized_container: preserialization.Instance,
+    symbol_table: intermediate.SymbolTable,
+) -> bytes:
+    """Serialize the ``preserialized_container`` to the bytes of a test data file."""
+    return _dump(
+        _Serializer(symbol_table=symbol_table).serialize_instance(
+            instance=preserialized_container
         )
+    )
+
+
+def serialize_case(
+    test_case: generation.CaseUnion,
+    symbol_table: intermediate.SymbolTable,
+    check_direct: bool = False,
+) -> Tuple[pathlib.Path, serialized.ExpectedOutcome, bytes]:
+    """
+    Serialize the ``test_case`` to JSON along its relative path and outcome.
 
-        pth = test_data_dir / relative_pth
+    If the case is fully represented by its model container, the container is
+    serialized directly with the SDK, skipping the pre-serialization. If
+    ``check_direct`` is set, such direct serialization is checked to match
+    byte-by-byte the serialization of the pre-serialized container.
+    """
+    relative_pth = _relative_path(test_case=test_case)
 
-        parent = pth.parent
-        parent.mkdir(parents=True, exist_ok=True)
+    if test_case.container is not None:
+        # The keys are sorted in the dump, so the order of the properties in
+        # the SDK does not matter.
+        data = _dump(aas_jsonization.to_jsonable(test_case.container))
 
-        with pth.open("wt") as fid:
-            json.dump(jsonable, fid, indent=2, sort_keys=True)
+        if check_direct:
+            preserialized_data = serialize_preserialized_container(
+                preserialized_container=test_case.preserialized_container,
+                symbol_table=symbol_table,
+            )
 
+            if data != preserialized_data:
+                raise AssertionError(
+                    f"The direct serialization of the {test_case.describe()} "
+                    f"to {relative_pth} differs from the serialization "
+                    f"of its pre-serialized container:\n"
+                    f"{data.decode('utf-8')}\n\n"
+                    f"versus:\n"
+                    f"{preserialized_data.decode('utf-8')}"
+                )
+    else:
+        data = serialize_preserialized_container(
+            preserialized_container=test_case.preserialized_container,
+            symbol_table=symbol_table,
+        )
+
+    return relative_pth, _expected_outcome(relative_pth), data
+
+
+def serialize_model_type_cases(
+    symbol_table: intermediate.SymbolTable,
+) -> Iterator[Tuple[pathlib.Path, serialized.ExpectedOutcome, bytes]]:
+    """Serialize the JSON-specific cases of a missing or an invalid ``modelType``."""
     # NOTE (mristin):
     # We generate here explicitly cases for missing modelType property. This is
     # JSON-specific, so we generate it outside the general :py:mod:`generation`
     # module.
-    _generate_unserializables_without_model_type(
-        symbol_table=symbol_table, test_data_dir=test_data_dir
-    )
+    #
+    # The minimal cases are generated only once and shared between the missing and
+    # the invalid ``modelType``.
+    minimal_cases = _generate_minimal_cases_with_model_type(symbol_table=symbol_table)
 
-    _generate_unserializables_with_invalid_model_type(
-        symbol_table=symbol_table, test_data_dir=test_data_dir
-    )
+    for relative_pth, data in _generate_unserializables_without_model_type(
+        symbol_table=symbol_table, minimal_cases=minimal_cases
+    ):
+        yield relative_pth, serialized.ExpectedOutcome.UNSERIALIZABLE, data
+
+    for relative_pth, data in _generate_unserializables_with_invalid_model_type(
+        symbol_table=symbol_table, minimal_cases=minimal_cases
+    ):
+        yield relative_pth, serialized.ExpectedOutcome.UNSERIALIZABLE, data
+
+
+def generate_to_sink(
+    model_path: pathlib.Path, sink: writing.Sink, verify_inline: bool = False
+) -> None:
+    """
+    Generate the JSON files and write them to the ``sink``.
+
+    The cases are generated and serialized by :py:func:`generate_all.iterate`.
+
+    If ``verify_inline`` is set, the serialized cases are de-serialized and verified
+    in memory before they are written. The cases serialized directly from the model
+    are also checked to match their pre-serialized route.
+    """
+    # We import here since :py:mod:`generate_all` dispatches to this module.
+    import aas_core3_1_testgen.generate_all  # pylint: disable=import-outside-toplevel,cyclic-import
+
+    for relative_pth, _, _, data in aas_core3_1_testgen.generate_all.iterate(
+        model_path=model_path,
+        formats=(serialized.Format.JSON,),
+        verify_inline=verify_inline,
+    ):
+        sink.write(relative_pth, data)
+
+
+def generate(model_path: pathlib.Path, test_data_dir: pathlib.Path) -> None:
+    """Generate the JSON files in ``test_data_dir``."""
+    with writing.DirectorySink(directory=test_data_dir) as sink:
+        generate_to_sink(model_path=model_path, sink=sink)
 
 
 def main() -> None:
@@ -625,98 +727,42 @@ def main() -> None:
         help="path to the directory where the generated data resides",
         required=True,
     )
+    parser.add_argument(
+        "--verify_inline",
+        help=(
+            "if set, verify the cases in memory during the generation "
+            "instead of re-reading the written files afterwards"
+        ),
+        action="store_true",
+    )
+    parser.add_argument(
+        "--workers",
+        help=(
+            "number of processes to validate the generated files with; "
+            "defaults to the number of processors"
+        ),
+        type=int,
+    )
     args = parser.parse_args()
 
     model_path = pathlib.Path(args.model_path)
     test_data_dir = pathlib.Path(args.test_data_dir)
 
-    generate(model_path=model_path, test_data_dir=test_data_dir)
+    if args.verify_inline:
+        with writing.DirectorySink(directory=test_data_dir) as sink:
+            generate_to_sink(model_path=model_path, sink=sink, verify_inline=True)
 
-    # NOTE (mristin):
-    # We currently verify only the instances contained in an Environment for simplicity.
-    # If time permits in the future, we will also validate the self-contained instances,
-    # but we need to leverage either reflection or code generation to that end.
-
-    expected_dir = test_data_dir / "Json" / "ContainedInEnvironment" / "Expected"
-    expected_paths = sorted(expected_dir.glob("**/*.json"))
-    if len(expected_paths) == 0:
-        raise AssertionError(f"Unexpected no positive examples in {expected_dir}")
-
-    for pth in expected_paths:
-        with pth.open("rt", encoding="utf-8") as fid:
-            jsonable = json.load(fid)
-
-        try:
-            environment = aasjsonization.environment_from_jsonable(jsonable=jsonable)
-        except aasjsonization.DeserializationException as exception:
-            raise AssertionError(  # pylint: disable=raise-missing-from
-                f"Failed to de-serialize an expected instance from {pth}: {exception}"
-            )
-
-        errors = list(aasverification.verify(environment))
-        if len(errors) != 0:
-            errors_joined = "\n".join(str(error) for error in errors)
-            raise AssertionError(
-                f"Failed to verify an expected instance from {pth}:\n{errors_joined}"
-            )
-
-    unserializable_dir = (
-        test_data_dir
-        / "Json"
-        / "ContainedInEnvironment"
-        / "Unexpected"
-        / "Unserializable"
-    )
-
-    unserializable_paths = sorted(unserializable_dir.glob("**/*.json"))
-    if len(unserializable_paths) == 0:
-        raise AssertionError(
-            f"Unexpected no paths to unserializable instances "
-            f"from {unserializable_dir}"
-        )
-
-    for pth in unserializable_paths:
-        with pth.open("rt", encoding="utf-8") as fid:
-            jsonable = json.load(fid)
-
-        caught = None  # type: Optional[aasjsonization.DeserializationException]
-        try:
-            _ = aasjsonization.environment_from_jsonable(jsonable=jsonable)
-        except aasjsonization.DeserializationException as exception:
-            caught = exception
+        return
 
-        if caught is None:
-            raise AssertionError(
-                f"Expected a de-serialization error from {pth}, but caught none"
-            )
+    generate(model_path=model_path, test_data_dir=test_data_dir)
 
-    invalid_dir = (
-        test_data_dir / "Json" / "ContainedInEnvironment" / "Unexpected" / "Invalid"
+    errors = validation.validate_tree(
+        test_data_dir=test_data_dir,
+        fmt=serialized.Format.JSON,
+        workers=args.workers,
     )
-
-    invalid_paths = sorted(invalid_dir.glob("**/*.json"))
-    if len(invalid_paths) == 0:
-        raise AssertionError(
-            f"Unexpected no paths to invalid instances in {invalid_dir}"
-        )
-
-    for pth in invalid_paths:
-        with pth.open("rt", encoding="utf-8") as fid:
-            jsonable = json.load(fid)
-
-        try:
-            environment = aasjsonization.environment_from_jsonable(jsonable=jsonable)
-        except aasjsonization.DeserializationException as exception:
-            raise AssertionError(  # pylint: disable=raise-missing-from
-                f"Failed to de-serialize an invalid, but de-serializable "
-                f"instance from {pth}: {exception}"
-            )
-
-        errors = list(aasverification.verify(environment))
-        if len(errors) == 0:
-            raise AssertionError(
-                f"Expected a verification error from {pth}, but got none"
-            )
+    if len(errors) != 0:
+        raise AssertionError(validation.report(errors))
 
 
 if __name__ == "__main__":
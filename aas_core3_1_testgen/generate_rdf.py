@@ -8,6 +8,7 @@ import urllib.parse
 from typing import (
     List,
     Optional,
+    Tuple,
     Union,
 )
 
@@ -19,7 +20,8 @@ from aas_core_codegen import intermediate
 from aas_core_codegen.common import Identifier, Stripped
 from icontract import ensure, require
 
-from aas_core3_1_testgen import common, generation
+import aas_core3_1.types as aas_types
+from aas_core3_1_testgen import common, generation, serialized, writing
 from aas_core3_1_testgen.codegened import preserialization
 
 _INDENT = "    "
@@ -469,89 +471,173 @@ def _serialize_property(
     raise AssertionError("Unexpected execution path")
 
 
-def generate(model_path: pathlib.Path, test_data_dir: pathlib.Path) -> None:
-    """Generate the XML files."""
-    (
-        symbol_table,
-        constraints_by_class,
-    ) = common.load_symbol_table_and_infer_constraints_for_schema(model_path=model_path)
+@require(
+    lambda preserialized_environment: (
+        preserialized_environment.class_name == "Environment"
+    )
+)
+def serialize_preserialized_environment(
+    preserialized_environment: preserialization.Instance,
+    symbol_table: intermediate.SymbolTable,
+) -> bytes:
+    """Serialize the ``preserialized_environment`` to the bytes of RDF turtle."""
+    text = _serialize_environment(
+        instance=preserialized_environment, symbol_table=symbol_table
+    )
+
+    return f"{text}\n".encode("utf-8")
+
+
+def serialize_environment(
+    environment: aas_types.Environment, symbol_table: intermediate.SymbolTable
+) -> bytes:
+    """Serialize the ``environment`` to the bytes of RDF turtle."""
+    preserialized_environment, _ = preserialization.preserialize(environment)
+
+    return serialize_preserialized_environment(
+        preserialized_environment=preserialized_environment,
+        symbol_table=symbol_table,
+    )
+
+
+def serialize_submodel_element(
+    element: aas_types.SubmodelElement, symbol_table: intermediate.SymbolTable
+) -> Stripped:
+    """
+    Serialize the ``element`` as a statement of RDF turtle in a submodel.
+
+    The statement is not indented. It corresponds to one item of
+    the submodel elements as they appear in :py:func:`serialize_environment`.
+    """
+    submodel_cls = symbol_table.must_find_concrete_class(Identifier("Submodel"))
+
+    preserialized_element, _ = preserialization.preserialize(element)
+
+    return _serialize_property(
+        prop=submodel_cls.properties_by_name[Identifier("submodel_elements")],
+        value=preserialization.ListOfInstances(values=[preserialized_element]),
+        symbol_table=symbol_table,
+    )
+
+
+def _expected_outcome(test_case: generation.CaseUnion) -> serialized.ExpectedOutcome:
+    """Determine what a consumer should observe when loading the ``test_case``."""
+    if test_case.expected:
+        return serialized.ExpectedOutcome.EXPECTED
+
+    # We follow here the distinction between unserializable and invalid cases made
+    # in the other formats. RDF does not split the paths by these kinds, though.
+    if isinstance(
+        test_case,
+        (
+            generation.CaseTypeViolation,
+            generation.CaseRequiredViolation,
+            generation.CaseNullViolation,
+            generation.CaseUnexpectedAdditionalProperty,
+            generation.CaseEnumViolation,
+        ),
+    ):
+        return serialized.ExpectedOutcome.UNSERIALIZABLE
 
+    return serialized.ExpectedOutcome.INVALID
+
+
+def serialize_case(
+    test_case: generation.CaseUnion, symbol_table: intermediate.SymbolTable
+) -> Optional[Tuple[pathlib.Path, serialized.ExpectedOutcome, bytes]]:
+    """
+    Serialize the ``test_case`` to RDF along its relative path and outcome.
+
+    Return None if the case can not be represented in RDF.
+    """
     identifiable_cls = symbol_table.must_find_abstract_class(Identifier("Identifiable"))
 
     environment_cls = symbol_table.must_find_concrete_class(Identifier("Environment"))
 
-    for test_case in generation.generate(
-        symbol_table=symbol_table, constraints_by_class=constraints_by_class
+    # NOTE (mristin, 2023-03-15):
+    # We can not represent ``null`` in RDF.
+    if isinstance(test_case, generation.CaseNullViolation):
+        return None
+
+    if (
+        isinstance(test_case, generation.CaseMinLengthViolation)
+        and test_case.min_value == 1
+        and isinstance(
+            intermediate.beneath_optional(test_case.prop.type_annotation),
+            intermediate.ListTypeAnnotation,
+        )
     ):
         # NOTE (mristin, 2023-03-15):
-        # We can not represent ``null`` in RDF.
-        if isinstance(test_case, generation.CaseNullViolation):
-            continue
-
-        if (
-            isinstance(test_case, generation.CaseMinLengthViolation)
-            and test_case.min_value == 1
-            and isinstance(
-                intermediate.beneath_optional(test_case.prop.type_annotation),
-                intermediate.ListTypeAnnotation,
-            )
-        ):
-            # NOTE (mristin, 2023-03-15):
-            # RDF can not easily represent empty lists, so we skip these negative
-            # cases where an empty list is the only fulfilling example.
-            continue
-
-        if isinstance(test_case, generation.CaseUnexpectedAdditionalProperty):
-            # NOTE (mristin, 2023-03-15):
-            # We need typing information to generate properties of an instance in RDF.
-            # Thus, we can not generate an additional property for which we do not know
-            # the type in advance.
-            continue
-
-        if isinstance(test_case, generation.CaseTypeViolation):
-            # NOTE (mristin, 2023-03-15):
-            # Type violations are hard to generate right in RDF. We omit them at this
-            # moment due to lack of time.
-            continue
-
-        if (
-            isinstance(test_case, generation.CaseRequiredViolation)
-            and test_case.cls.is_subclass_of(identifiable_cls)
-            and test_case.property_name == "id"
-        ):
-            # NOTE (mristin, 2023-03-15):
-            # We skip cases where the identifiable is missing the ID as this case can
-            # not be represented in RDF at all.
-            continue
+        # RDF can not easily represent empty lists, so we skip these negative
+        # cases where an empty list is the only fulfilling example.
+        return None
 
-        if test_case.container_class != environment_cls:
-            # NOTE (mristin, 2023-03-15):
-            # We can only flatten and serialize an instance of an Environment.
-            # While theoretically we could also handle any list of identifiables,
-            # we simply skip these edge cases due to lack of time at the moment.
-            continue
+    if isinstance(test_case, generation.CaseUnexpectedAdditionalProperty):
+        # NOTE (mristin, 2023-03-15):
+        # We need typing information to generate properties of an instance in RDF.
+        # Thus, we can not generate an additional property for which we do not know
+        # the type in advance.
+        return None
 
-        relative_pth = _relative_path(test_case=test_case)
+    if isinstance(test_case, generation.CaseTypeViolation):
+        # NOTE (mristin, 2023-03-15):
+        # Type violations are hard to generate right in RDF. We omit them at this
+        # moment due to lack of time.
+        return None
+
+    if (
+        isinstance(test_case, generation.CaseRequiredViolation)
+        and test_case.cls.is_subclass_of(identifiable_cls)
+        and test_case.property_name == "id"
+    ):
+        # NOTE (mristin, 2023-03-15):
+        # We skip cases where the identifiable is missing the ID as this case can
+        # not be represented in RDF at all.
+        return None
 
-        pth = test_data_dir / relative_pth
+    if test_case.container_class != environment_cls:
+        # NOTE (mristin, 2023-03-15):
+        # We can only flatten and serialize an instance of an Environment.
+        # While theoretically we could also handle any list of identifiables,
+        # we simply skip these edge cases due to lack of time at the moment.
+        return None
 
-        parent = pth.parent
-        if not parent.exists():
-            parent.mkdir(parents=True)
+    relative_pth = _relative_path(test_case=test_case)
 
-        try:
-            text = _serialize_environment(
-                instance=test_case.preserialized_container, symbol_table=symbol_table
-            )
-        except Exception as exception:
-            raise RuntimeError(
-                f"Failed to serialize the container "
-                f"for the case {test_case.__class__.__name__} to {pth}"
-            ) from exception
-
-        with pth.open("wt", encoding="utf-8") as fid:
-            fid.write(text)
-            fid.write("\n")
+    try:
+        data = serialize_preserialized_environment(
+            preserialized_environment=test_case.preserialized_container,
+            symbol_table=symbol_table,
+        )
+    except Exception as exception:
+        raise RuntimeError(
+            f"Failed to serialize the container "
+            f"for the case {test_case.__class__.__name__} to {relative_pth}"
+        ) from exception
+
+    return relative_pth, _expected_outcome(test_case=test_case), data
+
+
+def generate_to_sink(model_path: pathlib.Path, sink: writing.Sink) -> None:
+    """
+    Generate the RDF files and write them to the ``sink``.
+
+    The cases are generated and serialized by :py:func:`generate_all.iterate`.
+    """
+    # We import here since :py:mod:`generate_all` dispatches to this module.
+    import aas_core3_1_testgen.generate_all  # pylint: disable=import-outside-toplevel,cyclic-import
+
+    for relative_pth, _, _, data in aas_core3_1_testgen.generate_all.iterate(
+        model_path=model_path,
+        formats=(serialized.Format.RDF,),
+    ):
+        sink.write(relative_pth, data)
+
+
+def generate(model_path: pathlib.Path, test_data_dir: pathlib.Path) -> None:
+    """Generate the RDF files in ``test_data_dir``."""
+    with writing.DirectorySink(directory=test_data_dir) as sink:
+        generate_to_sink(model_path=model_path, sink=sink)
 
 
 def main() -> None:
@@ -8,6 +8,7 @@ import re
 from typing import (
     List,
     Optional,
+    Tuple,
 )
 from xml.dom import minidom
 
@@ -16,9 +17,9 @@ import aas_core_codegen.naming
 from aas_core_codegen import intermediate
 from aas_core_codegen.common import Identifier
 from icontract import ensure, require
-from aas_core3_1 import xmlization as aasxmlization, verification as aasverification
+from typing_extensions import assert_never
 
-from aas_core3_1_testgen import common, generation
+from aas_core3_1_testgen import common, generation, serialized, validation, writing
 from aas_core3_1_testgen.codegened import preserialization
 
 _XML_1_0_TEXT_RE = re.compile(
@@ -506,45 +507,111 @@ class _Serializer:
         return sequence
 
 
-def generate(model_path: pathlib.Path, test_data_dir: pathlib.Path) -> None:
-    """Generate the XML files."""
-    (
-        symbol_table,
-        constraints_by_class,
-    ) = common.load_symbol_table_and_infer_constraints_for_schema(model_path=model_path)
+def _expected_outcome(relative_path: pathlib.Path) -> serialized.ExpectedOutcome:
+    """
+    Determine the expected outcome of the case at ``relative_path``.
+
+    >>> _expected_outcome(
+    ...     pathlib.Path(
+    ...         "Xml/ContainedInEnvironment/Unexpected/Unserializable/"
+    ...         "RequiredViolation/property/valueType.xml"
+    ...     )
+    ... )
+    <ExpectedOutcome.UNSERIALIZABLE: 'Unserializable'>
+    """
+    if relative_path.parts[2] == "Expected":
+        return serialized.ExpectedOutcome.EXPECTED
 
-    serializer = _Serializer(symbol_table=symbol_table)
+    assert relative_path.parts[2] == "Unexpected", f"{relative_path=}"
+    kind = KindOfNegative(relative_path.parts[3])
 
-    for test_case in generation.generate(
-        symbol_table=symbol_table, constraints_by_class=constraints_by_class
-    ):
-        # NOTE (mristin, 2023-03-15):
-        # We can not represent ``null`` in XML.
-        if isinstance(test_case, generation.CaseNullViolation):
-            continue
+    if kind is KindOfNegative.UNSERIALIZABLE:
+        return serialized.ExpectedOutcome.UNSERIALIZABLE
+    elif kind is KindOfNegative.INVALID:
+        return serialized.ExpectedOutcome.INVALID
+    else:
+        assert_never(kind)
+        raise AssertionError("Unexpected execution path")
 
-        relative_pth = _relative_path(test_case=test_case)
 
-        pth = test_data_dir / relative_pth
+def serialize_preserialized_container(
+    preserialized_container: preserialization.Instance,
+    container_class: intermediate.ConcreteClass,
+    symbol_table: intermediate.SymbolTable,
+) -> Optional[bytes]:
+    """
+    Serialize the ``preserialized_container`` to the bytes of a test data file.
 
-        if not _conforms_to_xml_1_0(test_case.preserialized_container):
-            # NOTE (mristin, 2022-09-01):
-            # The test case can not be represented in XML 1.0, so we have to skip it.
-            continue
+    Return None if the container can not be represented in XML 1.0.
+    """
+    if not _conforms_to_xml_1_0(preserialized_container):
+        # NOTE (mristin, 2022-09-01):
+        # The test case can not be represented in XML 1.0, so we have to skip it.
+        return None
 
-        parent = pth.parent
-        if not parent.exists():
-            parent.mkdir(parents=True)
+    element_name = aas_core_codegen.naming.xml_class_name(container_class.name)
 
-        element_name = aas_core_codegen.naming.xml_class_name(
-            test_case.container_class.name
-        )
+    element = _Serializer(symbol_table=symbol_table).serialize_to_root_element(
+        instance=preserialized_container, element_name=element_name
+    )
 
-        element = serializer.serialize_to_root_element(
-            instance=test_case.preserialized_container, element_name=element_name
-        )
+    data = element.toprettyxml().encode("utf-8")  # type: bytes
+    return data
+
+
+def serialize_case(
+    test_case: generation.CaseUnion, symbol_table: intermediate.SymbolTable
+) -> Optional[Tuple[pathlib.Path, serialized.ExpectedOutcome, bytes]]:
+    """
+    Serialize the ``test_case`` to XML along its relative path and outcome.
+
+    Return None if the case can not be represented in XML.
+    """
+    # NOTE (mristin, 2023-03-15):
+    # We can not represent ``null`` in XML.
+    if isinstance(test_case, generation.CaseNullViolation):
+        return None
+
+    data = serialize_preserialized_container(
+        preserialized_container=test_case.preserialized_container,
+        container_class=test_case.container_class,
+        symbol_table=symbol_table,
+    )
+
+    if data is None:
+        return None
+
+    relative_pth = _relative_path(test_case=test_case)
+
+    return relative_pth, _expected_outcome(relative_pth), data
+
+
+def generate_to_sink(
+    model_path: pathlib.Path, sink: writing.Sink, verify_inline: bool = False
+) -> None:
+    """
+    Generate the XML files and write them to the ``sink``.
+
+    The cases are generated and serialized by :py:func:`generate_all.iterate`.
+
+    If ``verify_inline`` is set, the serialized cases are de-serialized and verified
+    in memory before they are written.
+    """
+    # We import here since :py:mod:`generate_all` dispatches to this module.
+    import aas_core3_1_testgen.generate_all  # pylint: disable=import-outside-toplevel,cyclic-import
+
+    for relative_pth, _, _, data in aas_core3_1_testgen.generate_all.iterate(
+        model_path=model_path,
+        formats=(serialized.Format.XML,),
+        verify_inline=verify_inline,
+    ):
+        sink.write(relative_pth, data)
 
-        pth.write_text(element.toprettyxml(), encoding="utf-8")
+
+def generate(model_path: pathlib.Path, test_data_dir: pathlib.Path) -> None:
+    """Generate the XML files in ``test_data_dir``."""
+    with writing.DirectorySink(directory=test_data_dir) as sink:
+        generate_to_sink(model_path=model_path, sink=sink)
 
 
 def main() -> None:
@@ -556,88 +623,42 @@ def main() -> None:
         help="path to the directory where the generated data resides",
         required=True,
     )
+    parser.add_argument(
+        "--verify_inline",
+        help=(
+            "if set, verify the cases in memory during the generation "
+            "instead of re-reading the written files afterwards"
+        ),
+        action="store_true",
+    )
+    parser.add_argument(
+        "--workers",
+        help=(
+            "number of processes to validate the generated files with; "
+            "defaults to the number of processors"
+        ),
+        type=int,
+    )
     args = parser.parse_args()
 
     model_path = pathlib.Path(args.model_path)
     test_data_dir = pathlib.Path(args.test_data_dir)
 
-    generate(model_path=model_path, test_data_dir=test_data_dir)
-
-    # NOTE (mristin):
-    # We currently verify only the instances contained in an Environment for simplicity.
-    # If time permits in the future, we will also validate the self-contained instances,
-    # but we need to leverage either reflection or code generation to that end.
-
-    expected_dir = test_data_dir / "Xml" / "ContainedInEnvironment" / "Expected"
-    expected_paths = sorted(expected_dir.glob("**/*.xml"))
-    if len(expected_paths) == 0:
-        raise AssertionError(f"Unexpected no positive examples in {expected_dir}")
-
-    for pth in expected_paths:
-        try:
-            environment = aasxmlization.environment_from_file(path=pth)
-        except aasxmlization.DeserializationException as exception:
-            raise AssertionError(  # pylint: disable=raise-missing-from
-                f"Failed to de-serialize an expected instance from {pth}: {exception}"
-            )
-
-        errors = list(aasverification.verify(environment))
-        if len(errors) != 0:
-            errors_joined = "\n".join(str(error) for error in errors)
-            raise AssertionError(
-                f"Failed to verify an expected instance from {pth}:\n{errors_joined}"
-            )
-
-    unserializable_dir = (
-        test_data_dir
-        / "Xml"
-        / "ContainedInEnvironment"
-        / "Unexpected"
-        / "Unserializable"
-    )
+    if args.verify_inline:
+        with writing.DirectorySink(directory=test_data_dir) as sink:
+            generate_to_sink(model_path=model_path, sink=sink, verify_inline=True)
 
-    unserializable_paths = sorted(unserializable_dir.glob("**/*.xml"))
-    if len(unserializable_paths) == 0:
-        raise AssertionError(
-            f"Unexpected no paths to unserializable instances "
-            f"from {unserializable_dir}"
-        )
+        return
 
-    for pth in unserializable_paths:
-        caught = None  # type: Optional[aasxmlization.DeserializationException]
-        try:
-            _ = aasxmlization.environment_from_file(path=pth)
-        except aasxmlization.DeserializationException as exception:
-            caught = exception
-
-        if caught is None:
-            raise AssertionError(
-                f"Expected a de-serialization error from {pth}, but caught none"
-            )
+    generate(model_path=model_path, test_data_dir=test_data_dir)
 
-    invalid_dir = (
-        test_data_dir / "Xml" / "ContainedInEnvironment" / "Unexpected" / "Invalid"
+    errors = validation.validate_tree(
+        test_data_dir=test_data_dir,
+        fmt=serialized.Format.XML,
+        workers=args.workers,
     )
-
-    invalid_paths = sorted(invalid_dir.glob("**/*.xml"))
-    if len(invalid_paths) == 0:
-        raise AssertionError(
-            f"Unexpected no paths to invalid instances in {invalid_dir}"
-        )
-
-    for pth in invalid_paths:
-        try:
-            environment = aasxmlization.environment_from_file(path=pth)
-        except aasxmlization.DeserializationException as exception:
-            raise AssertionError(  # pylint: disable=raise-missing-from
-                f"Failed to de-serialize an expected instance from {pth}: {exception}"
-            )
-
-        errors = list(aasverification.verify(environment))
-        if len(errors) == 0:
-            raise AssertionError(
-                f"Expected a verification error from {pth}, but got none"
-            )
+    if len(errors) != 0:
+        raise AssertionError(validation.report(errors))
 
 
 if __name__ == "__main__":
@@ -2,6 +2,9 @@
 import copy
 import inspect
 from typing import (
+    AbstractSet,
+    Any,
+    Dict,
     Union,
     MutableMapping,
     Iterator,
@@ -10,6 +13,7 @@ from typing import (
     List,
     Optional,
     Set,
+    TypeVar,
     cast,
 )
 
@@ -29,22 +33,128 @@ from aas_core3_1_testgen.frozen_examples import (
 )
 
 
+CaseT = TypeVar("CaseT", bound="Case")
+
+
 class Case(DBC):
     """Represent an abstract test case."""
 
+    #: Model container of the case, if the case is fully represented by it.
+    #:
+    #: This is None if the case has been made by mutating the pre-serialization,
+    #: *e.g.*, by setting an invalid value which can not be represented in the model.
+    #: Otherwise, the pre-serialization is postponed until it is needed so that
+    #: the case can be serialized directly from the model.
+    container: Optional[aas_types.Class]
+
+    @require(
+        lambda preserialized_container, container: (preserialized_container is not None)
+        ^ (container is not None)
+    )
     def __init__(
         self,
         container_class: intermediate.ConcreteClass,
-        preserialized_container: preserialization.Instance,
+        preserialized_container: Optional[preserialization.Instance],
         expected: bool,
         cls: intermediate.ConcreteClass,
+        container: Optional[aas_types.Class] = None,
     ) -> None:
         """Initialize with the given values."""
         self.container_class = container_class
-        self.preserialized_container = preserialized_container
+        self.container = container
         self.expected = expected
         self.cls = cls
 
+        self._preserialized_container = preserialized_container
+        self._instance_to_preserialized = (
+            None
+        )  # type: Optional[MutableMapping[aas_types.Class, preserialization.Instance]]
+
+    def _preserialize(
+        self,
+    ) -> MutableMapping[aas_types.Class, preserialization.Instance]:
+        """Pre-serialize the model container, if not already done."""
+        if self._instance_to_preserialized is None:
+            assert self.container is not None, (
+                "Expected the model container to be set if the case has been "
+                "constructed without the pre-serialized container"
+            )
+
+            (
+                self._preserialized_container,
+                self._instance_to_preserialized,
+            ) = preserialization.preserialize(self.container)
+
+        return self._instance_to_preserialized
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Drop the model container from the pickled state once pre-serialized.
+
+        The pre-serialized container fully represents the case, so the model
+        container and its mapping to the pre-serialization would only double
+        the size of a snapshot.
+        """
+        state = self.__dict__.copy()
+        if self._preserialized_container is not None:
+            state["container"] = None
+            state["_instance_to_preserialized"] = None
+
+        return state
+
+    @property
+    def preserialized_container(self) -> preserialization.Instance:
+        """Retrieve the pre-serialized container, pre-serializing it if needed."""
+        if self._preserialized_container is None:
+            self._preserialize()
+
+        assert self._preserialized_container is not None
+        return self._preserialized_container
+
+    def with_preserialized_container(
+        self: "CaseT", preserialized_container: preserialization.Instance
+    ) -> "CaseT":
+        """Copy the case with its container replaced by ``preserialized_container``."""
+        result = copy.copy(self)
+        result.container = None
+        result._preserialized_container = preserialized_container
+        result._instance_to_preserialized = None
+        return result
+
+    def concerned_property_name(self) -> Optional[Identifier]:
+        """Retrieve the name of the property the case is concerned with, if any."""
+        # The cases refer to the property either by its name or by the property
+        # itself.
+        property_name = getattr(self, "property_name", None)
+        if property_name is not None:
+            assert isinstance(property_name, str)
+            return Identifier(property_name)
+
+        prop = getattr(self, "prop", None)
+        if prop is not None:
+            assert isinstance(prop, intermediate.Property)
+            return prop.name
+
+        return None
+
+    def describe(self) -> str:
+        """Describe the case in a human-readable form for the error messages."""
+        details = [
+            f"class {self.cls.name}",
+            f"container class {self.container_class.name}",
+        ]
+
+        property_name = self.concerned_property_name()
+        if property_name is not None:
+            details.append(f"property {property_name}")
+
+        for attribute in ("example_name", "name"):
+            value = getattr(self, attribute, None)
+            if value is not None:
+                details.append(f"{attribute.replace('_', ' ')} {value}")
+
+        return f"{self.__class__.__name__} ({', '.join(details)})"
+
 
 class Replica:
     """
@@ -89,8 +199,6 @@ class CaseMinimal(Case):
     def __init__(
         self,
         container_class: intermediate.ConcreteClass,
-        preserialized_container: preserialization.Instance,
-        preserialized_instance: preserialization.Instance,
         cls: intermediate.ConcreteClass,
         replica: "Replica",
     ) -> None:
@@ -98,13 +206,27 @@ class CaseMinimal(Case):
         Case.__init__(
             self,
             container_class=container_class,
-            preserialized_container=preserialized_container,
+            preserialized_container=None,
             expected=True,
             cls=cls,
+            container=replica.container,
         )
-        self.preserialized_instance = preserialized_instance
         self.replica = replica
 
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Keep the model container in the pickled state.
+
+        The replica refers to the model container anyway, and the mapping to
+        the pre-serialization is needed for :py:attr:`preserialized_instance`.
+        """
+        return self.__dict__.copy()
+
+    @property
+    def preserialized_instance(self) -> preserialization.Instance:
+        """Retrieve the pre-serialized instance, pre-serializing it if needed."""
+        return self._preserialize()[self.replica.instance]
+
 
 class CaseMaximal(Case):
     """Represent a maximal test case."""
@@ -112,8 +234,6 @@ class CaseMaximal(Case):
     def __init__(
         self,
         container_class: intermediate.ConcreteClass,
-        preserialized_container: preserialization.Instance,
-        preserialized_instance: preserialization.Instance,
         cls: intermediate.ConcreteClass,
         replica: "Replica",
     ) -> None:
@@ -121,13 +241,27 @@ class CaseMaximal(Case):
         Case.__init__(
             self,
             container_class=container_class,
-            preserialized_container=preserialized_container,
+            preserialized_container=None,
             expected=True,
             cls=cls,
+            container=replica.container,
         )
-        self.preserialized_instance = preserialized_instance
         self.replica = replica
 
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Keep the model container in the pickled state.
+
+        The replica refers to the model container anyway, and the mapping to
+        the pre-serialization is needed for :py:attr:`preserialized_instance`.
+        """
+        return self.__dict__.copy()
+
+    @property
+    def preserialized_instance(self) -> preserialization.Instance:
+        """Retrieve the pre-serialized instance, pre-serializing it if needed."""
+        return self._preserialize()[self.replica.instance]
+
 
 class CaseTypeViolation(Case):
     """Represent a test case where a property has invalid type."""
@@ -329,7 +463,7 @@ class CasePositiveValueExample(Case):
     def __init__(
         self,
         container_class: intermediate.ConcreteClass,
-        preserialized_container: preserialization.Instance,
+        container: aas_types.Class,
         cls: intermediate.ConcreteClass,
         data_type_def_literal: intermediate.EnumerationLiteral,
         example_name: str,
@@ -338,9 +472,10 @@ class CasePositiveValueExample(Case):
         Case.__init__(
             self,
             container_class=container_class,
-            preserialized_container=preserialized_container,
+            preserialized_container=None,
             expected=True,
             cls=cls,
+            container=container,
         )
         self.data_type_def_literal = data_type_def_literal
         self.example_name = example_name
@@ -375,7 +510,7 @@ class CasePositiveMinMaxExample(Case):
     def __init__(
         self,
         container_class: intermediate.ConcreteClass,
-        preserialized_container: preserialization.Instance,
+        container: aas_types.Class,
         cls: intermediate.ConcreteClass,
         data_type_def_literal: intermediate.EnumerationLiteral,
         example_name: str,
@@ -384,9 +519,10 @@ class CasePositiveMinMaxExample(Case):
         Case.__init__(
             self,
             container_class=container_class,
-            preserialized_container=preserialized_container,
+            preserialized_container=None,
             expected=True,
             cls=cls,
+            container=container,
         )
         self.data_type_def_literal = data_type_def_literal
         self.example_name = example_name
@@ -458,7 +594,7 @@ class CasePositiveManual(Case):
     def __init__(
         self,
         container_class: intermediate.ConcreteClass,
-        preserialized_container: preserialization.Instance,
+        container: aas_types.Class,
         cls: intermediate.ConcreteClass,
         name: str,
     ) -> None:
@@ -466,9 +602,10 @@ class CasePositiveManual(Case):
         Case.__init__(
             self,
             container_class=container_class,
-            preserialized_container=preserialized_container,
+            preserialized_container=None,
             expected=True,
             cls=cls,
+            container=container,
         )
         self.name = name
 
@@ -705,15 +842,8 @@ def generate_minimal_case(
             fixing.assert_instance_valid(environment)
             fixing.assert_instance_at_path_in_environment(environment, instance, path)
 
-            (
-                preserialized_container,
-                instance_to_preserialized,
-            ) = preserialization.preserialize(environment)
-
             return CaseMinimal(
                 container_class=environment_cls,
-                preserialized_container=preserialized_container,
-                preserialized_instance=instance_to_preserialized[instance],
                 cls=cls,
                 replica=Replica(container=environment, instance=instance, path=path),
             )
@@ -723,16 +853,12 @@ def generate_minimal_case(
             fixing.fix(instance)
             fixing.assert_instance_valid(instance)
 
-            preserialized_instance, _ = preserialization.preserialize(instance)
-
             # NOTE (mristin, 2023-03-10):
             # The instance is self-contained, so the container is also
             # the instance.
 
             return CaseMinimal(
                 container_class=cls,
-                preserialized_container=preserialized_instance,
-                preserialized_instance=preserialized_instance,
                 cls=cls,
                 replica=Replica(container=instance, instance=instance, path=[]),
             )
@@ -743,10 +869,10 @@ def generate_minimal_case(
 
 
 @require(lambda environment_cls: environment_cls.name == "Environment")
-def _generate_maximal_case(
+def generate_maximal_case(
     cls: intermediate.ConcreteClass, environment_cls: intermediate.ConcreteClass
 ) -> CaseMaximal:
-    """Generate the example of a minimal instance ready for serialization."""
+    """Generate the example of a maximal instance ready for serialization."""
     try:
         instance = None  # type: Optional[aas_types.Class]
 
@@ -770,15 +896,8 @@ def _generate_maximal_case(
             fixing.assert_instance_valid(environment)
             fixing.assert_instance_at_path_in_environment(environment, instance, path)
 
-            (
-                preserialized_container,
-                instance_to_preserialized,
-            ) = preserialization.preserialize(environment)
-
             return CaseMaximal(
                 container_class=environment_cls,
-                preserialized_container=preserialized_container,
-                preserialized_instance=instance_to_preserialized[instance],
                 cls=cls,
                 replica=Replica(container=environment, instance=instance, path=path),
             )
@@ -789,15 +908,11 @@ def _generate_maximal_case(
 
             fixing.assert_instance_valid(instance)
 
-            preserialized_instance, _ = preserialization.preserialize(instance)
-
             # NOTE (mristin, 2023-03-10):
             # The instance is self-contained, so the container is also
             # the instance.
             return CaseMaximal(
                 container_class=cls,
-                preserialized_container=preserialized_instance,
-                preserialized_instance=preserialized_instance,
                 cls=cls,
                 replica=Replica(container=instance, instance=instance, path=[]),
             )
@@ -1443,13 +1558,9 @@ def _generate_cases_for_value_and_value_types(
             replica.instance.value_type = literal
             replica.instance.value = example_value
 
-            preserialized_container, _ = preserialization.preserialize(
-                replica.container
-            )
-
             yield CasePositiveValueExample(
                 container_class=minimal_case.container_class,
-                preserialized_container=preserialized_container,
+                container=replica.container,
                 cls=minimal_case.cls,
                 data_type_def_literal=data_type_def_xsd_enum.literals_by_value[
                     literal.value
@@ -1510,13 +1621,9 @@ def _generate_cases_for_min_max_of_range(
             replica.instance.min = example_value
             replica.instance.max = example_value
 
-            preserialized_container, _ = preserialization.preserialize(
-                replica.container
-            )
-
             yield CasePositiveMinMaxExample(
                 container_class=minimal_case.container_class,
-                preserialized_container=preserialized_container,
+                container=replica.container,
                 cls=minimal_case.cls,
                 data_type_def_literal=data_type_def_xsd_enum.literals_by_value[
                     literal.value
@@ -1636,21 +1743,19 @@ class _AdditionalForSubmodelElementList:
         )
 
     @staticmethod
-    def _preserialize_to_positive_manual_case(
+    def _to_positive_manual_case(
         replica: Replica,
         name: str,
         environment_cls: EnvironmentClass,
         submodel_element_list_cls: SubmodelElementListClass,
     ) -> CasePositiveManual:
         """Translate ``replica`` into a positive manual case."""
-        preserialized_container, _ = preserialization.preserialize(replica.container)
-
         assert isinstance(replica.container, aas_types.Environment)
         assert isinstance(replica.instance, aas_types.SubmodelElementList)
 
         return CasePositiveManual(
             container_class=environment_cls,
-            preserialized_container=preserialized_container,
+            container=replica.container,
             cls=submodel_element_list_cls,
             name=name,
         )
@@ -1692,7 +1797,7 @@ class _AdditionalForSubmodelElementList:
 
         replica.instance.value[0].semantic_id = None
 
-        return static._preserialize_to_positive_manual_case(
+        return static._to_positive_manual_case(
             replica=replica,
             name=_test_name_from_function_name(),
             environment_cls=environment_cls,
@@ -1714,7 +1819,7 @@ class _AdditionalForSubmodelElementList:
 
         replica.instance.semantic_id_list_element = None
 
-        return static._preserialize_to_positive_manual_case(
+        return static._to_positive_manual_case(
             replica=replica,
             name=_test_name_from_function_name(),
             environment_cls=environment_cls,
@@ -2010,21 +2115,19 @@ class _AdditionalForReference:
         return Replica(container=environment, instance=reference, path=path)
 
     @staticmethod
-    def _preserialize_to_positive_manual_case(
+    def _to_positive_manual_case(
         replica: Replica,
         name: str,
         environment_cls: EnvironmentClass,
         reference_cls: ReferenceClass,
     ) -> CasePositiveManual:
         """Translate ``replica`` into a positive manual case."""
-        preserialized_container, _ = preserialization.preserialize(replica.container)
-
         assert isinstance(replica.container, aas_types.Environment)
         assert isinstance(replica.instance, aas_types.Reference)
 
         return CasePositiveManual(
             container_class=environment_cls,
-            preserialized_container=preserialized_container,
+            container=replica.container,
             cls=reference_cls,
             name=name,
         )
@@ -2336,7 +2439,7 @@ class _AdditionalForReference:
             )
         ]
 
-        return static._preserialize_to_positive_manual_case(
+        return static._to_positive_manual_case(
             replica=replica,
             name=_test_name_from_function_name(),
             environment_cls=environment_cls,
@@ -2365,7 +2468,7 @@ class _AdditionalForReference:
             )
         ]
 
-        return static._preserialize_to_positive_manual_case(
+        return static._to_positive_manual_case(
             replica=replica,
             name=_test_name_from_function_name(),
             environment_cls=environment_cls,
@@ -2398,7 +2501,7 @@ class _AdditionalForReference:
             ),
         ]
 
-        return static._preserialize_to_positive_manual_case(
+        return static._to_positive_manual_case(
             replica=replica,
             name=_test_name_from_function_name(),
             environment_cls=environment_cls,
@@ -2431,7 +2534,7 @@ class _AdditionalForReference:
             ),
         ]
 
-        return static._preserialize_to_positive_manual_case(
+        return static._to_positive_manual_case(
             replica=replica,
             name=_test_name_from_function_name(),
             environment_cls=environment_cls,
@@ -2460,7 +2563,7 @@ class _AdditionalForReference:
             ),
         ]
 
-        return static._preserialize_to_positive_manual_case(
+        return static._to_positive_manual_case(
             replica=replica,
             name=_test_name_from_function_name(),
             environment_cls=environment_cls,
@@ -2489,7 +2592,7 @@ class _AdditionalForReference:
             aas_types.Key(type=aas_types.KeyTypes.PROPERTY, value="123"),
         ]
 
-        return static._preserialize_to_positive_manual_case(
+        return static._to_positive_manual_case(
             replica=replica,
             name=_test_name_from_function_name(),
             environment_cls=environment_cls,
@@ -2654,13 +2757,30 @@ class _AdditionalForReference:
         # endregion
 
 
-def generate(
+def _with_base(
+    base: Union[CaseMinimal, CaseMaximal], cases: Iterator[CaseUnion]
+) -> Iterator[Tuple[Optional[Union[CaseMinimal, CaseMaximal]], CaseUnion]]:
+    """Pair each of the ``cases`` with the ``base`` it has been derived from."""
+    for case in cases:
+        yield base, case
+
+
+def generate_with_bases(
     symbol_table: intermediate.SymbolTable,
     constraints_by_class: MutableMapping[
         intermediate.ClassUnion, infer_for_schema.ConstraintsByProperty
     ],
-) -> Iterator[CaseUnion]:
-    """Generate the test cases."""
+    class_names: Optional[AbstractSet[str]] = None,
+) -> Iterator[Tuple[Optional[Union[CaseMinimal, CaseMaximal]], CaseUnion]]:
+    """
+    Generate the test cases along the minimal or maximal case they mutate.
+
+    The base is None for the minimal and maximal cases themselves, and for
+    the cases which are not derived from them.
+
+    If ``class_names`` are given, only the cases of these concrete classes are
+    generated.
+    """
     frozen_examples_pattern.assert_all_pattern_verification_functions_covered_and_not_more(
         symbol_table=symbol_table, constraints_by_class=constraints_by_class
     )
@@ -2701,68 +2821,129 @@ def generate(
         if not isinstance(our_type, intermediate.ConcreteClass):
             continue
 
+        if class_names is not None and our_type.name not in class_names:
+            continue
+
         minimal_case = generate_minimal_case(
             cls=our_type, environment_cls=environment_cls
         )
 
-        yield minimal_case
+        yield None, minimal_case
 
-        maximal_case = _generate_maximal_case(
+        maximal_case = generate_maximal_case(
             cls=our_type, environment_cls=environment_cls
         )
-        yield maximal_case
+        yield None, maximal_case
 
-        yield from _generate_type_violations(maximal_case=maximal_case)
+        yield from _with_base(
+            maximal_case, _generate_type_violations(maximal_case=maximal_case)
+        )
 
-        yield from _generate_positive_and_negative_pattern_examples(
-            maximal_case=maximal_case,
-            constraints_by_property=constraints_by_class[our_type],
+        yield from _with_base(
+            maximal_case,
+            _generate_positive_and_negative_pattern_examples(
+                maximal_case=maximal_case,
+                constraints_by_property=constraints_by_class[our_type],
+            ),
         )
 
-        yield from _generate_required_violations(minimal_case=minimal_case)
+        yield from _with_base(
+            minimal_case, _generate_required_violations(minimal_case=minimal_case)
+        )
 
-        yield from _generate_null_violations(minimal_case=minimal_case)
+        yield from _with_base(
+            minimal_case, _generate_null_violations(minimal_case=minimal_case)
+        )
 
-        yield from _generate_length_violations(
-            maximal_case=maximal_case,
-            constraints_by_property=constraints_by_class[our_type],
+        yield from _with_base(
+            maximal_case,
+            _generate_length_violations(
+                maximal_case=maximal_case,
+                constraints_by_property=constraints_by_class[our_type],
+            ),
         )
 
-        yield from _generate_enum_violations(maximal_case=maximal_case)
+        yield from _with_base(
+            maximal_case, _generate_enum_violations(maximal_case=maximal_case)
+        )
 
-        yield from _generate_unexpected_additional_properties(minimal_case=minimal_case)
+        yield from _with_base(
+            minimal_case,
+            _generate_unexpected_additional_properties(minimal_case=minimal_case),
+        )
 
-        yield from _generate_date_time_utc_violation_on_february_29th(
-            minimal_case=minimal_case,
-            date_time_utc_constrained_primitive=date_time_utc_constrained_primitive,
+        yield from _with_base(
+            minimal_case,
+            _generate_date_time_utc_violation_on_february_29th(
+                minimal_case=minimal_case,
+                date_time_utc_constrained_primitive=date_time_utc_constrained_primitive,
+            ),
         )
 
-        yield from _generate_violation_of_set_constraint_on_primitive_property(
-            minimal_case=minimal_case,
-            constraints_by_property=constraints_by_class[our_type],
+        yield from _with_base(
+            minimal_case,
+            _generate_violation_of_set_constraint_on_primitive_property(
+                minimal_case=minimal_case,
+                constraints_by_property=constraints_by_class[our_type],
+            ),
         )
 
-        yield from _generate_violation_of_set_constraint_on_enum_property(
-            minimal_case=minimal_case,
-            constraints_by_property=constraints_by_class[our_type],
+        yield from _with_base(
+            minimal_case,
+            _generate_violation_of_set_constraint_on_enum_property(
+                minimal_case=minimal_case,
+                constraints_by_property=constraints_by_class[our_type],
+            ),
         )
 
         if our_type in class_set_with_value_and_value_type:
-            yield from _generate_cases_for_value_and_value_types(
-                minimal_case=minimal_case, data_type_def_xsd_enum=data_type_def_xsd_enum
+            yield from _with_base(
+                minimal_case,
+                _generate_cases_for_value_and_value_types(
+                    minimal_case=minimal_case,
+                    data_type_def_xsd_enum=data_type_def_xsd_enum,
+                ),
             )
 
         if our_type is range_cls:
-            yield from _generate_cases_for_min_max_of_range(
-                minimal_case=minimal_case, data_type_def_xsd_enum=data_type_def_xsd_enum
+            yield from _with_base(
+                minimal_case,
+                _generate_cases_for_min_max_of_range(
+                    minimal_case=minimal_case,
+                    data_type_def_xsd_enum=data_type_def_xsd_enum,
+                ),
             )
 
         if our_type is submodel_element_list_cls:
-            yield from _AdditionalForSubmodelElementList.generate_cases(
+            for case in _AdditionalForSubmodelElementList.generate_cases(
                 environment_cls=environment_cls,
                 submodel_element_list_cls=submodel_element_list_cls,
-            )
+            ):
+                yield None, case
 
-    yield from _AdditionalForReference.generate_cases(
-        environment_cls=environment_cls, reference_cls=reference_cls
-    )
+    if class_names is None or reference_cls.name in class_names:
+        for case in _AdditionalForReference.generate_cases(
+            environment_cls=environment_cls, reference_cls=reference_cls
+        ):
+            yield None, case
+
+
+def generate(
+    symbol_table: intermediate.SymbolTable,
+    constraints_by_class: MutableMapping[
+        intermediate.ClassUnion, infer_for_schema.ConstraintsByProperty
+    ],
+    class_names: Optional[AbstractSet[str]] = None,
+) -> Iterator[CaseUnion]:
+    """
+    Generate the test cases.
+
+    If ``class_names`` are given, only the cases of these concrete classes are
+    generated.
+    """
+    for _, case in generate_with_bases(
+        symbol_table=symbol_table,
+        constraints_by_class=constraints_by_class,
+        class_names=class_names,
+    ):
+        yield case
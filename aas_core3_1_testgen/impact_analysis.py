@@ -0,0 +1,467 @@
+"""
+Determine which concrete classes are affected by a change of the meta-model.
+
+We diff the two symbol tables type by type: the inheritances, the properties, the
+invariants, the inferred length, pattern and set constraints, and the enumeration
+literals. The changes are then propagated over the graph of the inheritances and
+the property types, and over the containers in which the cases are wrapped, so that
+only the cases of the affected classes need to be regenerated.
+"""
+import argparse
+import pathlib
+import sys
+from typing import Any, Dict, Iterator, List, MutableMapping, Sequence, Set
+
+import aas_core_codegen.parse.tree
+import networkx
+from aas_core_codegen import intermediate, infer_for_schema
+from aas_core_codegen.common import Identifier
+from typing_extensions import assert_never
+
+import aas_core3_1.types as aas_types
+from aas_core3_1_testgen import common
+from aas_core3_1_testgen.codegened import preserialization, wrapping
+
+#: Map the constraints inferred for the schema to the classes
+ConstraintsByClass = MutableMapping[
+    intermediate.ClassUnion, infer_for_schema.ConstraintsByProperty
+]
+
+
+def _our_types_in(
+    type_annotation: intermediate.TypeAnnotationUnion,
+) -> Iterator[intermediate.OurType]:
+    """Iterate over our types referenced in the ``type_annotation``."""
+    if isinstance(type_annotation, intermediate.PrimitiveTypeAnnotation):
+        return
+
+    elif isinstance(type_annotation, intermediate.OurTypeAnnotation):
+        yield type_annotation.our_type
+
+    elif isinstance(type_annotation, intermediate.ListTypeAnnotation):
+        yield from _our_types_in(type_annotation.items)
+
+    elif isinstance(type_annotation, intermediate.OptionalTypeAnnotation):
+        yield from _our_types_in(type_annotation.value)
+
+    else:
+        assert_never(type_annotation)
+
+
+def _describe_invariants(
+    invariants: Sequence[intermediate.Invariant], aspects: Dict[str, str]
+) -> None:
+    """Record the ``invariants`` among the ``aspects`` keyed by their bodies."""
+    for invariant in invariants:
+        body = aas_core_codegen.parse.tree.dump(invariant.body)
+        aspects[f"invariant {body}"] = (
+            invariant.description if invariant.description is not None else ""
+        )
+
+
+def _describe(
+    our_type: intermediate.OurType, constraints_by_class: ConstraintsByClass
+) -> Dict[str, str]:
+    """Describe the aspects of ``our_type`` which determine its test cases."""
+    aspects = dict()  # type: Dict[str, str]
+
+    if isinstance(our_type, intermediate.Enumeration):
+        for literal in our_type.literals:
+            aspects[f"literal {literal.name}"] = literal.value
+
+    elif isinstance(our_type, intermediate.ConstrainedPrimitive):
+        aspects["constrainee"] = our_type.constrainee.value
+        aspects["inheritances"] = ", ".join(
+            inheritance.name for inheritance in our_type.inheritances
+        )
+        _describe_invariants(our_type.invariants, aspects)
+
+    elif isinstance(our_type, (intermediate.AbstractClass, intermediate.ConcreteClass)):
+        aspects["inheritances"] = ", ".join(
+            inheritance.name for inheritance in our_type.inheritances
+        )
+
+        for prop in our_type.properties:
+            aspects[f"type of {prop.name}"] = str(prop.type_annotation)
+
+        _describe_invariants(our_type.invariants, aspects)
+
+        constraints_by_property = constraints_by_class.get(our_type, None)
+        if constraints_by_property is not None:
+            for (
+                prop,
+                len_constraint,
+            ) in constraints_by_property.len_constraints_by_property.items():
+                aspects[
+                    f"length of {prop.name}"
+                ] = f"{len_constraint.min_value}..{len_constraint.max_value}"
+
+            for (
+                prop,
+                pattern_constraints,
+            ) in constraints_by_property.patterns_by_property.items():
+                aspects[f"patterns of {prop.name}"] = ", ".join(
+                    repr(pattern_constraint.pattern)
+                    for pattern_constraint in pattern_constraints
+                )
+
+            for (
+                prop,
+                set_of_primitives_constraint,
+            ) in constraints_by_property.set_of_primitives_by_property.items():
+                aspects[f"set of primitives of {prop.name}"] = ", ".join(
+                    repr(literal.value)
+                    for literal in set_of_primitives_constraint.literals
+                )
+
+            for (
+                prop,
+                set_of_enumeration_literals_constraint,
+            ) in (
+                constraints_by_property.set_of_enumeration_literals_by_property.items()
+            ):
+                aspects[f"set of literals of {prop.name}"] = ", ".join(
+                    literal.name
+                    for literal in set_of_enumeration_literals_constraint.literals
+                )
+
+    else:
+        assert_never(our_type)
+
+    return aspects
+
+
+def diff(
+    old_symbol_table: intermediate.SymbolTable,
+    old_constraints_by_class: ConstraintsByClass,
+    new_symbol_table: intermediate.SymbolTable,
+    new_constraints_by_class: ConstraintsByClass,
+) -> Dict[str, List[str]]:
+    """
+    Compare our types of the old and the new symbol table.
+
+    :return: human-readable changes mapped by the names of the changed types
+    """
+    old_aspects_by_name = {
+        str(our_type.name): _describe(our_type, old_constraints_by_class)
+        for our_type in old_symbol_table.our_types
+    }
+
+    new_aspects_by_name = {
+        str(our_type.name): _describe(our_type, new_constraints_by_class)
+        for our_type in new_symbol_table.our_types
+    }
+
+    changes_by_name = dict()  # type: Dict[str, List[str]]
+
+    for name in sorted(set(old_aspects_by_name) | set(new_aspects_by_name)):
+        old_aspects = old_aspects_by_name.get(name, None)
+        new_aspects = new_aspects_by_name.get(name, None)
+
+        changes = []  # type: List[str]
+        if old_aspects is None:
+            changes.append("added")
+        elif new_aspects is None:
+            changes.append("removed")
+        else:
+            for aspect in sorted(set(old_aspects) | set(new_aspects)):
+                old_value = old_aspects.get(aspect, None)
+                new_value = new_aspects.get(aspect, None)
+
+                if old_value is None:
+                    changes.append(f"added {aspect}: {new_value}")
+                elif new_value is None:
+                    changes.append(f"removed {aspect}: {old_value}")
+                elif old_value != new_value:
+                    changes.append(f"changed {aspect}: {old_value} -> {new_value}")
+
+        if len(changes) > 0:
+            changes_by_name[name] = changes
+
+    return changes_by_name
+
+
+def _dependency_graph(symbol_table: intermediate.SymbolTable) -> networkx.DiGraph:
+    """
+    Build the graph where an edge points from a type to the types depending on it.
+
+    A type depends on its parents and on the types of its properties. Where a
+    property refers to a class, the instances of its concrete descendants can
+    appear as well.
+    """
+    graph = networkx.DiGraph()
+
+    for our_type in symbol_table.our_types:
+        graph.add_node(our_type.name)
+
+    for our_type in symbol_table.our_types:
+        if isinstance(our_type, intermediate.Enumeration):
+            continue
+
+        for inheritance in our_type.inheritances:
+            graph.add_edge(inheritance.name, our_type.name)
+
+        if isinstance(our_type, intermediate.ConstrainedPrimitive):
+            continue
+
+        for prop in our_type.properties:
+            for property_type in _our_types_in(prop.type_annotation):
+                graph.add_edge(property_type.name, our_type.name)
+
+                if isinstance(
+                    property_type,
+                    (intermediate.AbstractClass, intermediate.ConcreteClass),
+                ):
+                    for concrete_descendant in property_type.concrete_descendants:
+                        graph.add_edge(concrete_descendant.name, our_type.name)
+
+    return graph
+
+
+def _containers_by_class(
+    symbol_table: intermediate.SymbolTable,
+) -> Dict[str, List[str]]:
+    """
+    Map the concrete classes to the classes of their containers in an environment.
+
+    The containers are read from the environments of :py:mod:`wrapping`, the same
+    ones in which the cases are generated, from the environment down to the direct
+    container. The classes without a wrapping are left out.
+    """
+    result = dict()  # type: Dict[str, List[str]]
+
+    for our_type in symbol_table.our_types:
+        if not isinstance(our_type, intermediate.ConcreteClass):
+            continue
+
+        try:
+            environment, _, path = wrapping.minimal_in_environment(our_type.name)
+        except KeyError:
+            continue
+
+        _, instance_to_preserialized = preserialization.preserialize(environment)
+
+        containers = [environment]  # type: List[aas_types.Class]
+
+        something = environment  # type: Any
+        for segment in path[:-1]:
+            if isinstance(segment, int):
+                something = something[segment]
+            else:
+                something = getattr(something, segment)
+
+            if isinstance(something, aas_types.Class):
+                containers.append(something)
+
+        result[our_type.name] = [
+            str(instance_to_preserialized[container].class_name)
+            for container in containers
+        ]
+
+    return result
+
+
+def _types_of_container(
+    container_name: str, symbol_table: intermediate.SymbolTable
+) -> Set[str]:
+    """
+    Collect the names of the types which determine the container of a case.
+
+    The containers are created minimal, so they carry their required properties.
+    Hence the container depends on its ancestors and on the types reachable over
+    its required properties, but not on the types of its optional properties.
+    """
+    result = set()  # type: Set[str]
+
+    container = symbol_table.find_our_type(Identifier(container_name))
+    if container is None:
+        return result
+
+    stack = [container]  # type: List[intermediate.OurType]
+    while len(stack) > 0:
+        our_type = stack.pop()
+        if our_type.name in result:
+            continue
+
+        result.add(our_type.name)
+
+        if isinstance(our_type, intermediate.Enumeration):
+            continue
+
+        stack.extend(our_type.ancestors)
+
+        if isinstance(our_type, intermediate.ConstrainedPrimitive):
+            continue
+
+        for prop in our_type.properties:
+            if isinstance(prop.type_annotation, intermediate.OptionalTypeAnnotation):
+                continue
+
+            for property_type in _our_types_in(prop.type_annotation):
+                stack.append(property_type)
+
+                if isinstance(
+                    property_type,
+                    (intermediate.AbstractClass, intermediate.ConcreteClass),
+                ):
+                    stack.extend(property_type.concrete_descendants)
+
+    return result
+
+
+class Impact:
+    """Represent the impact of a meta-model change on the test cases."""
+
+    #: Human-readable changes mapped by the names of the changed types
+    changes_by_name: Dict[str, List[str]]
+
+    #: Names of the concrete classes in the new meta-model whose cases need to be
+    #: regenerated, sorted
+    affected_classes: List[str]
+
+    #: Names of the concrete classes only in the old meta-model whose cases need
+    #: to be removed, sorted
+    removed_classes: List[str]
+
+    def __init__(
+        self,
+        changes_by_name: Dict[str, List[str]],
+        affected_classes: List[str],
+        removed_classes: List[str],
+    ) -> None:
+        """Initialize with the given values."""
+        self.changes_by_name = changes_by_name
+        self.affected_classes = affected_classes
+        self.removed_classes = removed_classes
+
+
+def analyze(
+    old_symbol_table: intermediate.SymbolTable,
+    old_constraints_by_class: ConstraintsByClass,
+    new_symbol_table: intermediate.SymbolTable,
+    new_constraints_by_class: ConstraintsByClass,
+) -> Impact:
+    """Determine the concrete classes affected by the change of the meta-model."""
+    changes_by_name = diff(
+        old_symbol_table=old_symbol_table,
+        old_constraints_by_class=old_constraints_by_class,
+        new_symbol_table=new_symbol_table,
+        new_constraints_by_class=new_constraints_by_class,
+    )
+
+    affected = set()  # type: Set[str]
+
+    # The removed types are only in the old graph, while the added types are only
+    # in the new one.
+    for symbol_table in (old_symbol_table, new_symbol_table):
+        graph = _dependency_graph(symbol_table)
+
+        for name in changes_by_name:
+            if name in graph:
+                affected.add(name)
+                affected.update(networkx.descendants(graph, name))
+
+    # Only the types which determine the containers matter for the wrapping.
+    # For example, a change of a submodel element does not change how other
+    # submodel elements are wrapped in a submodel.
+    types_by_container = dict()  # type: Dict[str, Set[str]]
+    for name, containers in _containers_by_class(new_symbol_table).items():
+        for container in containers:
+            container_types = types_by_container.get(container, None)
+            if container_types is None:
+                container_types = _types_of_container(
+                    container, old_symbol_table
+                ) | _types_of_container(container, new_symbol_table)
+                types_by_container[container] = container_types
+
+            if any(
+                container_type in changes_by_name for container_type in container_types
+            ):
+                affected.add(name)
+                break
+
+    new_concrete_classes = {
+        str(our_type.name)
+        for our_type in new_symbol_table.our_types
+        if isinstance(our_type, intermediate.ConcreteClass)
+    }
+
+    old_concrete_classes = {
+        str(our_type.name)
+        for our_type in old_symbol_table.our_types
+        if isinstance(our_type, intermediate.ConcreteClass)
+    }
+
+    return Impact(
+        changes_by_name=changes_by_name,
+        affected_classes=sorted(affected & new_concrete_classes),
+        removed_classes=sorted(old_concrete_classes - new_concrete_classes),
+    )
+
+
+def main() -> int:
+    """Execute the main routine."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--old_model_path", help="path to the previous meta-model", required=True
+    )
+    parser.add_argument(
+        "--new_model_path", help="path to the current meta-model", required=True
+    )
+    parser.add_argument(
+        "--names_only",
+        help=(
+            "if set, print only the names of the affected and the removed classes, "
+            "e.g., to pass them on to --class_names of generate_all"
+        ),
+        action="store_true",
+    )
+    args = parser.parse_args()
+
+    (
+        old_symbol_table,
+        old_constraints_by_class,
+    ) = common.load_symbol_table_and_infer_constraints_for_schema(
+        model_path=pathlib.Path(args.old_model_path)
+    )
+
+    (
+        new_symbol_table,
+        new_constraints_by_class,
+    ) = common.load_symbol_table_and_infer_constraints_for_schema(
+        model_path=pathlib.Path(args.new_model_path)
+    )
+
+    impact = analyze(
+        old_symbol_table=old_symbol_table,
+        old_constraints_by_class=old_constraints_by_class,
+        new_symbol_table=new_symbol_table,
+        new_constraints_by_class=new_constraints_by_class,
+    )
+
+    if args.names_only:
+        # The cases of the removed classes need to be replaced as well, namely by
+        # no cases at all.
+        for name in sorted(set(impact.affected_classes) | set(impact.removed_classes)):
+            print(name)
+        return 0
+
+    for name, changes in impact.changes_by_name.items():
+        print(f"{name}:")
+        for change in changes:
+            print(f"  {change}")
+
+    print(
+        f"Affected concrete classes ({len(impact.affected_classes)}): "
+        f"{' '.join(impact.affected_classes)}"
+    )
+    print(
+        f"Removed concrete classes ({len(impact.removed_classes)}): "
+        f"{' '.join(impact.removed_classes)}"
+    )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
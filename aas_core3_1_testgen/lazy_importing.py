@@ -0,0 +1,32 @@
+"""Import modules lazily so that they are loaded only once they are used."""
+import importlib.util
+import sys
+import types
+
+
+def lazy_import(name: str) -> types.ModuleType:
+    """
+    Import the module ``name`` so that it is executed on the first attribute access.
+
+    If the module has been already imported, it is returned as-is.
+
+    Use this for the large modules of the SDK which are needed only in some code
+    paths. Annotate the variable with the real module under ``TYPE_CHECKING`` so
+    that the type checker still sees the attributes.
+    """
+    module = sys.modules.get(name, None)
+    if module is not None:
+        return module
+
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+
+    return module
@@ -0,0 +1,317 @@
+"""
+Shrink the containers of the negative cases derived from the maximal cases.
+
+The negative cases which mutate a maximal case carry the whole maximal container,
+although only the mutated property matters. We remove the optional properties and
+the items of the lists by delta debugging, and keep a removal only if the SDK still
+fails in the same way, *i.e.*, with the same de-serialization error or the same
+verification errors, both in JSON and in XML.
+"""
+import copy
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from aas_core_codegen import intermediate
+from aas_core_codegen.common import Identifier
+from typing_extensions import assert_never
+
+import aas_core3_1_testgen.generate_json
+import aas_core3_1_testgen.generate_xml
+from aas_core3_1_testgen import generation, lazy_importing, serialized, validation
+from aas_core3_1_testgen.codegened import preserialization
+
+# The generators import this module even if nothing is to be minimized, so we load
+# the verification of the SDK only once the first failure is determined.
+if TYPE_CHECKING:
+    import aas_core3_1.verification as aas_verification
+else:
+    aas_verification = lazy_importing.lazy_import("aas_core3_1.verification")
+
+#: Cases whose container is a mutated maximal container
+MinimizableCase = Union[
+    generation.CaseTypeViolation,
+    generation.CasePatternViolation,
+    generation.CaseMaxLengthViolation,
+    generation.CaseEnumViolation,
+]
+
+#: Formats in which the failure of a case needs to be kept
+ORACLE_FORMATS = (serialized.Format.JSON, serialized.Format.XML)
+
+#: Failure of the SDK as the outcome and the causes of the errors.
+#:
+#: We ignore the paths of the errors, as they change when the preceding items of
+#: a list are removed.
+Failure = Tuple[serialized.ExpectedOutcome, Tuple[str, ...]]
+
+T = TypeVar("T")
+
+
+def reduce(components: Sequence[T], test: Callable[[List[T]], bool]) -> List[T]:
+    """
+    Remove as many ``components`` as possible while the ``test`` passes.
+
+    The components are removed in chunks which are halved until single components
+    are tried, in the manner of delta debugging. The result is one-minimal: removing
+    any single of the kept components fails the ``test``.
+    """
+    kept = list(components)
+    chunk_size = max(len(kept) // 2, 1)
+
+    while len(kept) > 0:
+        removed_any = False
+
+        start = 0
+        while start < len(kept):
+            candidate = kept[:start] + kept[start + chunk_size :]
+            if test(candidate):
+                kept = candidate
+                removed_any = True
+            else:
+                start += chunk_size
+
+        if chunk_size == 1 and not removed_any:
+            break
+
+        chunk_size = max(chunk_size // 2, 1)
+
+    return kept
+
+
+def _failure_of(
+    data: bytes, fmt: serialized.Format, container_class: intermediate.ConcreteClass
+) -> Failure:
+    """Load the ``data`` with the SDK and capture how it fails, if at all."""
+    instance, cause = validation.deserialize_instance(
+        data=data, fmt=fmt, class_name=container_class.name
+    )
+    if instance is None:
+        assert cause is not None
+        return serialized.ExpectedOutcome.UNSERIALIZABLE, (cause,)
+
+    causes = tuple(
+        sorted(set(error.cause for error in aas_verification.verify(instance)))
+    )
+
+    if len(causes) == 0:
+        return serialized.ExpectedOutcome.EXPECTED, causes
+
+    return serialized.ExpectedOutcome.INVALID, causes
+
+
+def _minimize_instance(
+    instance: preserialization.Instance,
+    symbol_table: intermediate.SymbolTable,
+    still_fails: Callable[[], bool],
+) -> None:
+    """Remove the optional properties of ``instance`` and shrink its descendants."""
+    cls = symbol_table.must_find_concrete_class(Identifier(instance.class_name))
+
+    original_properties = instance.properties
+
+    optional_names = []  # type: List[str]
+    for name in original_properties:
+        prop = cls.properties_by_name.get(Identifier(name), None)
+        if prop is not None and isinstance(
+            prop.type_annotation, intermediate.OptionalTypeAnnotation
+        ):
+            optional_names.append(name)
+
+    optional_name_set = set(optional_names)
+
+    def set_properties(kept_names: Sequence[str]) -> None:
+        """Set the properties of the instance with only the ``kept_names`` optional."""
+        kept_name_set = set(kept_names)
+
+        properties = preserialization.Properties()
+        for name, value in original_properties.items():
+            if name in kept_name_set or name not in optional_name_set:
+                properties[name] = value
+
+        instance.properties = properties
+
+    def test(kept_names: List[str]) -> bool:
+        """Check that the failure is kept with only the ``kept_names`` optional."""
+        set_properties(kept_names)
+        return still_fails()
+
+    set_properties(reduce(optional_names, test))
+
+    for value in instance.properties.values():
+        if isinstance(value, preserialization.Instance):
+            _minimize_instance(
+                instance=value, symbol_table=symbol_table, still_fails=still_fails
+            )
+
+        elif isinstance(value, preserialization.ListOfInstances):
+            _minimize_list(
+                list_of_instances=value,
+                symbol_table=symbol_table,
+                still_fails=still_fails,
+            )
+
+
+def _minimize_list(
+    list_of_instances: preserialization.ListOfInstances,
+    symbol_table: intermediate.SymbolTable,
+    still_fails: Callable[[], bool],
+) -> None:
+    """Remove the items of ``list_of_instances`` and shrink the remaining ones."""
+
+    def test(kept_items: List[preserialization.Instance]) -> bool:
+        """Check that the failure is kept with only the ``kept_items``."""
+        list_of_instances.values = kept_items
+        return still_fails()
+
+    list_of_instances.values = reduce(list_of_instances.values, test)
+
+    for item in list_of_instances.values:
+        _minimize_instance(
+            instance=item, symbol_table=symbol_table, still_fails=still_fails
+        )
+
+
+class Statistics:
+    """Keep track of how much the cases have been shrunk."""
+
+    #: Number of the minimized cases
+    case_count: int
+
+    #: Number of the bytes of the original cases serialized as JSON
+    original_size: int
+
+    #: Number of the bytes of the minimized cases serialized as JSON
+    minimized_size: int
+
+    #: Number of the times the SDK has been asked whether a candidate still fails
+    test_count: int
+
+    def __init__(self) -> None:
+        """Initialize with zeros."""
+        self.case_count = 0
+        self.original_size = 0
+        self.minimized_size = 0
+        self.test_count = 0
+
+    def report(self) -> str:
+        """Report the statistics in a human-readable form."""
+        percentage = (
+            100.0 * (1.0 - self.minimized_size / self.original_size)
+            if self.original_size > 0
+            else 0.0
+        )
+
+        return (
+            f"Minimized {self.case_count} case(s) from {self.original_size} bytes "
+            f"to {self.minimized_size} bytes of JSON ({percentage:.1f}% smaller) "
+            f"with {self.test_count} test(s) against the SDK."
+        )
+
+
+class Minimizer:
+    """Shrink the negative cases while keeping their failures in the SDK."""
+
+    #: Statistics accumulated over all the minimized cases
+    statistics: Statistics
+
+    def __init__(self) -> None:
+        """Initialize with empty statistics."""
+        self.statistics = Statistics()
+
+    def minimize(
+        self, case: MinimizableCase, symbol_table: intermediate.SymbolTable
+    ) -> MinimizableCase:
+        """
+        Copy the ``case`` with a minimized container.
+
+        The ``case`` itself is left untouched.
+        """
+        preserialized_container = copy.deepcopy(case.preserialized_container)
+
+        def serialize(fmt: serialized.Format) -> Optional[bytes]:
+            """Serialize the current state of the container in the format ``fmt``."""
+            if fmt is serialized.Format.JSON:
+                return (
+                    aas_core3_1_testgen.generate_json.serialize_preserialized_container(
+                        preserialized_container=preserialized_container,
+                        symbol_table=symbol_table,
+                    )
+                )
+            elif fmt is serialized.Format.XML:
+                return (
+                    aas_core3_1_testgen.generate_xml.serialize_preserialized_container(
+                        preserialized_container=preserialized_container,
+                        container_class=case.container_class,
+                        symbol_table=symbol_table,
+                    )
+                )
+            elif fmt is serialized.Format.RDF:
+                raise AssertionError("Unexpected execution path")
+            else:
+                assert_never(fmt)
+                raise AssertionError("Unexpected execution path")
+
+        # The case might not be representable in XML at all, and the removals can
+        # not change that. We then keep only the failure in JSON.
+        failure_by_format = dict()  # type: Dict[serialized.Format, Failure]
+        original_size = 0
+        for fmt in ORACLE_FORMATS:
+            data = serialize(fmt)
+            if data is None:
+                continue
+
+            if fmt is serialized.Format.JSON:
+                original_size = len(data)
+
+            failure_by_format[fmt] = _failure_of(
+                data=data, fmt=fmt, container_class=case.container_class
+            )
+
+        if serialized.ExpectedOutcome.EXPECTED in (
+            outcome for outcome, _ in failure_by_format.values()
+        ):
+            # There is no failure to keep, so there is nothing to minimize against.
+            return case
+
+        def still_fails() -> bool:
+            """Check that the current state of the container fails as the original."""
+            self.statistics.test_count += 1
+
+            for fmt, failure in failure_by_format.items():
+                data = serialize(fmt)
+                if data is None:
+                    return False
+
+                if (
+                    _failure_of(
+                        data=data, fmt=fmt, container_class=case.container_class
+                    )
+                    != failure
+                ):
+                    return False
+
+            return True
+
+        _minimize_instance(
+            instance=preserialized_container,
+            symbol_table=symbol_table,
+            still_fails=still_fails,
+        )
+
+        minimized_data = serialize(serialized.Format.JSON)
+        assert minimized_data is not None
+
+        self.statistics.case_count += 1
+        self.statistics.original_size += original_size
+        self.statistics.minimized_size += len(minimized_data)
+
+        return case.with_preserialized_container(preserialized_container)
@@ -0,0 +1,32 @@
+"""Describe the test cases once they have been serialized to a concrete format."""
+import enum
+import pathlib
+from typing import Tuple
+
+
+class Format(enum.Enum):
+    """Define the formats in which we serialize the test cases."""
+
+    JSON = "Json"
+    XML = "Xml"
+    RDF = "Rdf"
+
+
+class ExpectedOutcome(enum.Enum):
+    """Define what a consumer should observe when loading a serialized case."""
+
+    #: The case de-serializes and verifies without errors.
+    EXPECTED = "Expected"
+
+    #: The case can not be de-serialized.
+    UNSERIALIZABLE = "Unserializable"
+
+    #: The case de-serializes, but fails the verification.
+    INVALID = "Invalid"
+
+
+#: Represent a serialized case as
+#: ``(relative path, format, expected outcome, content)``.
+#:
+#: The relative path is where the case resides in the test data directory.
+SerializedCase = Tuple[pathlib.PurePosixPath, Format, ExpectedOutcome, bytes]
@@ -0,0 +1,349 @@
+"""
+Record the stream of the generated cases in a snapshot and replay it.
+
+The generation of the cases takes minutes, while the serializers take only seconds
+to serialize them. A snapshot stores the cases together with their pre-serialized
+containers so that a new or a changed serializer can be iterated on without
+re-running the generation. The model containers are dropped wherever
+the pre-serialized containers suffice (see :py:meth:`generation.Case.__getstate__`).
+
+The snapshot is a gzip-compressed stream of pickles. It starts with the magic
+bytes and a header with the version of the snapshot schema and the SHA-256 digest
+of the meta-model, followed by one pickle per case. The objects of the symbol
+table are not pickled, but referred to by their names and resolved against the
+symbol table of the meta-model on replay.
+"""
+import argparse
+import gzip
+import hashlib
+import io
+import pathlib
+import pickle
+import sys
+import types
+from typing import (
+    Any,
+    BinaryIO,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+    Type,
+    cast,
+)
+
+from aas_core_codegen import intermediate
+
+from aas_core3_1_testgen import common, generation
+
+#: Version of the snapshot schema.
+#:
+#: Increment it whenever the case classes or the pre-serialization change their
+#: attributes so that the stale snapshots are rejected instead of mis-read.
+SCHEMA_VERSION = 2
+
+#: Magic bytes at the start of every snapshot
+MAGIC = b"AASCASES"
+
+# We fix the pickle protocol instead of using the highest one so that a snapshot
+# can be replayed by all the Python versions we support.
+_PICKLE_PROTOCOL = 4
+
+#: Reference to an object of the symbol table by its kind and names
+Reference = Tuple[str, ...]
+
+
+def model_sha256(model_path: pathlib.Path) -> str:
+    """Compute the SHA-256 digest of the meta-model at ``model_path``."""
+    return hashlib.sha256(model_path.read_bytes()).hexdigest()
+
+
+def _references(
+    symbol_table: intermediate.SymbolTable,
+) -> Iterator[Tuple[Any, Reference]]:
+    """Iterate over the objects of the symbol table referred to by the cases."""
+    for our_type in symbol_table.our_types:
+        yield our_type, ("our_type", our_type.name)
+
+        if isinstance(our_type, intermediate.Enumeration):
+            for literal in our_type.literals:
+                yield literal, ("literal", our_type.name, literal.name)
+
+        elif isinstance(
+            our_type, (intermediate.AbstractClass, intermediate.ConcreteClass)
+        ):
+            for prop in our_type.properties:
+                yield prop, ("property", our_type.name, prop.name)
+
+
+class _Pickler(pickle.Pickler):
+    """Pickle a case with the objects of the symbol table replaced by references."""
+
+    def __init__(
+        self, file: BinaryIO, reference_by_id: Dict[int, Tuple[Any, Reference]]
+    ) -> None:
+        """Initialize with the given values."""
+        super().__init__(file, protocol=_PICKLE_PROTOCOL)
+        self._reference_by_id = reference_by_id
+
+    def persistent_id(self, obj: Any) -> Optional[Reference]:
+        """Refer to ``obj`` by its names if it is an object of the symbol table."""
+        entry = self._reference_by_id.get(id(obj), None)
+        if entry is not None and entry[0] is obj:
+            return entry[1]
+
+        # Any other object of the symbol table would drag the whole symbol table
+        # into the snapshot, so we rather fail early.
+        if type(obj).__module__.startswith("aas_core_codegen."):
+            raise pickle.PicklingError(
+                f"Unexpected object of the symbol table in a case "
+                f"which can not be referred to: {obj!r}"
+            )
+
+        return None
+
+
+class _Unpickler(pickle.Unpickler):
+    """Unpickle a case resolving the references against the symbol table."""
+
+    def __init__(
+        self, file: BinaryIO, object_by_reference: Dict[Reference, Any]
+    ) -> None:
+        """Initialize with the given values."""
+        super().__init__(file)
+        self._object_by_reference = object_by_reference
+
+    def persistent_load(self, pid: Any) -> Any:
+        """Resolve the reference ``pid`` to the object of the symbol table."""
+        obj = self._object_by_reference.get(tuple(pid), None)
+        if obj is None:
+            raise pickle.UnpicklingError(
+                f"The reference could not be resolved in the symbol table: {pid!r}"
+            )
+
+        return obj
+
+
+class SnapshotWriter:
+    """Write the cases to a new snapshot one by one."""
+
+    #: Path to the snapshot
+    path: pathlib.Path
+
+    #: Number of the written cases
+    case_count: int
+
+    def __init__(
+        self,
+        path: pathlib.Path,
+        symbol_table: intermediate.SymbolTable,
+        model_sha256: str,
+    ) -> None:
+        """Create the snapshot at ``path`` and write its header."""
+        self.path = path
+        self.case_count = 0
+
+        self._reference_by_id = {
+            id(obj): (obj, reference) for obj, reference in _references(symbol_table)
+        }
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # The gzip header contains the modification time, so we need to fix it
+        # to get a reproducible snapshot.
+        self._raw_file = path.open("wb")
+        self._gzip_file = gzip.GzipFile(
+            filename="", mode="wb", fileobj=self._raw_file, mtime=0
+        )
+
+        self._gzip_file.write(MAGIC)
+        pickle.dump(
+            (SCHEMA_VERSION, model_sha256),
+            cast(BinaryIO, self._gzip_file),
+            protocol=_PICKLE_PROTOCOL,
+        )
+
+    def write(self, case: generation.CaseUnion) -> None:
+        """Pre-serialize the ``case``, if not already done, and record it."""
+        # We pre-serialize before pickling so that the replay does not need to.
+        _ = case.preserialized_container
+
+        # We pickle each case with a fresh memo so that the cases can be replayed
+        # one at a time without keeping the previous ones alive.
+        buffer = io.BytesIO()
+        _Pickler(buffer, reference_by_id=self._reference_by_id).dump(case)
+        self._gzip_file.write(buffer.getvalue())
+
+        self.case_count += 1
+
+    def close(self) -> None:
+        """Flush the snapshot and close it."""
+        self._gzip_file.close()
+        self._raw_file.close()
+
+    def __enter__(self) -> "SnapshotWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[types.TracebackType],
+    ) -> None:
+        self.close()
+
+
+class SnapshotReader:
+    """Replay the cases from a snapshot lazily."""
+
+    #: Path to the snapshot
+    path: pathlib.Path
+
+    #: Version of the snapshot schema as recorded in the header
+    schema_version: int
+
+    #: SHA-256 digest of the meta-model as recorded in the header
+    model_sha256: str
+
+    def __init__(
+        self, path: pathlib.Path, symbol_table: intermediate.SymbolTable
+    ) -> None:
+        """
+        Open the snapshot at ``path`` and read its header.
+
+        :raise: :py:class:`ValueError` if the snapshot is not a snapshot, or
+            if its schema version is not supported
+        """
+        self.path = path
+
+        self._object_by_reference = {
+            reference: obj for obj, reference in _references(symbol_table)
+        }
+
+        self._gzip_file = gzip.GzipFile(filename=str(path), mode="rb")
+
+        try:
+            magic = self._gzip_file.read(len(MAGIC))
+            if magic != MAGIC:
+                raise ValueError(
+                    f"Expected the snapshot to start with {MAGIC!r}, "
+                    f"but got {magic!r}: {path}"
+                )
+
+            schema_version, recorded_model_sha256 = pickle.load(
+                cast(BinaryIO, self._gzip_file)
+            )
+            if schema_version != SCHEMA_VERSION:
+                raise ValueError(
+                    f"Expected the snapshot schema version {SCHEMA_VERSION}, "
+                    f"but got {schema_version}; please re-create the snapshot: "
+                    f"{path}"
+                )
+        except:  # pylint: disable=bare-except
+            self._gzip_file.close()
+            raise
+
+        self.schema_version = schema_version
+        self.model_sha256 = recorded_model_sha256
+
+    def __iter__(self) -> Iterator[generation.CaseUnion]:
+        """Replay the cases one by one in the order they have been written."""
+        while len(self._gzip_file.peek(1)) > 0:
+            case = _Unpickler(
+                cast(BinaryIO, self._gzip_file),
+                object_by_reference=self._object_by_reference,
+            ).load()
+
+            assert isinstance(case, generation.Case)
+            yield cast(generation.CaseUnion, case)
+
+    def close(self) -> None:
+        """Close the snapshot."""
+        self._gzip_file.close()
+
+    def __enter__(self) -> "SnapshotReader":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[types.TracebackType],
+    ) -> None:
+        self.close()
+
+
+def replay(
+    path: pathlib.Path, model_path: pathlib.Path, symbol_table: intermediate.SymbolTable
+) -> Iterator[generation.CaseUnion]:
+    """
+    Replay lazily the cases from the snapshot at ``path``.
+
+    :raise: :py:class:`ValueError` if the snapshot has been created for a different
+        meta-model than the one at ``model_path``
+    """
+    with SnapshotReader(path=path, symbol_table=symbol_table) as reader:
+        if reader.model_sha256 != model_sha256(model_path):
+            raise ValueError(
+                f"The snapshot {path} has been created for a different meta-model "
+                f"than {model_path}; please re-create the snapshot"
+            )
+
+        yield from reader
+
+
+def write(
+    path: pathlib.Path,
+    cases: Iterable[generation.CaseUnion],
+    model_path: pathlib.Path,
+    symbol_table: intermediate.SymbolTable,
+) -> int:
+    """
+    Record the ``cases`` generated from the meta-model at ``model_path``.
+
+    :return: number of the written cases
+    """
+    with SnapshotWriter(
+        path=path, symbol_table=symbol_table, model_sha256=model_sha256(model_path)
+    ) as writer:
+        for case in cases:
+            writer.write(case)
+
+    return writer.case_count
+
+
+def main() -> int:
+    """Execute the main routine."""
+    parser = argparse.ArgumentParser(
+        description="Record the generated cases in a snapshot."
+    )
+    parser.add_argument("--model_path", help="path to the meta-model", required=True)
+    parser.add_argument(
+        "--snapshot_path", help="path to the snapshot to be written", required=True
+    )
+    args = parser.parse_args()
+
+    model_path = pathlib.Path(args.model_path)
+
+    (
+        symbol_table,
+        constraints_by_class,
+    ) = common.load_symbol_table_and_infer_constraints_for_schema(model_path=model_path)
+
+    case_count = write(
+        path=pathlib.Path(args.snapshot_path),
+        cases=generation.generate(
+            symbol_table=symbol_table, constraints_by_class=constraints_by_class
+        ),
+        model_path=model_path,
+        symbol_table=symbol_table,
+    )
+
+    print(f"Recorded {case_count} case(s) in {args.snapshot_path}.")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
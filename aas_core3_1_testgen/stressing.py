@@ -0,0 +1,642 @@
+"""
+Generate large valid environments to stress the de-serializers and verifiers.
+
+The environments come in a ladder of sizes, from 10 up to millions of submodel
+elements, so that the scaling curves of the SDKs can be measured. Every environment
+is generated deterministically from the path hash.
+"""
+import argparse
+import json
+import pathlib
+import sys
+import textwrap
+from typing import (
+    BinaryIO,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TYPE_CHECKING,
+)
+
+from aas_core_codegen import intermediate
+from icontract import ensure, require
+from typing_extensions import assert_never
+
+import aas_core3_1.types as aas_types
+from aas_core3_1_testgen import (
+    common,
+    fixing,
+    generate_rdf,
+    lazy_importing,
+    primitiving,
+    serialized,
+    writing,
+)
+from aas_core3_1_testgen.codegened import creation
+from aas_core3_1_testgen.frozen_examples import xs_value as frozen_examples_xs_value
+
+if TYPE_CHECKING:
+    import aas_core3_1.jsonization as aas_jsonization
+    import aas_core3_1.verification as aas_verification
+    import aas_core3_1.xmlization as aas_xmlization
+else:
+    aas_jsonization = lazy_importing.lazy_import("aas_core3_1.jsonization")
+    aas_verification = lazy_importing.lazy_import("aas_core3_1.verification")
+    aas_xmlization = lazy_importing.lazy_import("aas_core3_1.xmlization")
+
+
+class Shape:
+    """
+    Define the shape of a stress environment.
+
+    Each submodel contains ``elements_per_submodel`` top-level elements. Each
+    top-level element is a chain of ``depth - 1`` nested submodel element
+    collections which ends in a submodel element list of ``list_length``
+    properties. The shells refer to the submodels in a round-robin fashion.
+    """
+
+    @require(lambda aas_count: aas_count >= 1)
+    @require(lambda submodel_count: submodel_count >= 1)
+    @require(lambda elements_per_submodel: elements_per_submodel >= 1)
+    @require(lambda depth: depth >= 1)
+    @require(lambda list_length: list_length >= 1)
+    def __init__(
+        self,
+        aas_count: int,
+        submodel_count: int,
+        elements_per_submodel: int,
+        depth: int,
+        list_length: int,
+    ) -> None:
+        """Initialize with the given values."""
+        self.aas_count = aas_count
+        self.submodel_count = submodel_count
+        self.elements_per_submodel = elements_per_submodel
+        self.depth = depth
+        self.list_length = list_length
+
+    def element_count(self) -> int:
+        """Count all the submodel elements including the nested ones."""
+        return (
+            self.submodel_count
+            * self.elements_per_submodel
+            * (self.depth + self.list_length)
+        )
+
+    def describe(self) -> str:
+        """Describe the shape in a human-readable form."""
+        return (
+            f"{self.element_count()} submodel elements in {self.aas_count} shell(s) "
+            f"and {self.submodel_count} submodel(s) with "
+            f"{self.elements_per_submodel} top-level element(s) each, "
+            f"depth {self.depth} and list length {self.list_length}"
+        )
+
+
+#: Depth of the top-level elements in the ladder
+_LADDER_DEPTH = 3
+
+#: Length of the innermost lists in the ladder
+_LADDER_LIST_LENGTH = 7
+
+assert _LADDER_DEPTH + _LADDER_LIST_LENGTH == 10, (
+    "Each top-level element in the ladder needs to have exactly 10 submodel "
+    "elements so that the rungs have the exact powers of 10 as sizes."
+)
+
+
+@require(lambda exponent: exponent >= 1)
+@ensure(lambda exponent, result: result.element_count() == 10**exponent)
+def shape_for_exponent(exponent: int) -> Shape:
+    """Define the shape with ``10 ** exponent`` submodel elements for the ladder."""
+    # We split the top-level elements evenly between the submodels and
+    # the elements per submodel so that neither of them dominates at large sizes.
+    top_level_exponent = exponent - 1
+    submodel_exponent = top_level_exponent // 2
+
+    submodel_count = 10**submodel_exponent
+
+    return Shape(
+        aas_count=max(1, submodel_count // 10),
+        submodel_count=submodel_count,
+        elements_per_submodel=10 ** (top_level_exponent - submodel_exponent),
+        depth=_LADDER_DEPTH,
+        list_length=_LADDER_LIST_LENGTH,
+    )
+
+
+@require(lambda max_exponent: max_exponent >= 1)
+def ladder(max_exponent: int = 6) -> List[Shape]:
+    """Define the shapes with 10, 100, ..., ``10 ** max_exponent`` elements."""
+    return [shape_for_exponent(exponent) for exponent in range(1, max_exponent + 1)]
+
+
+_CONSISTENT_XS_VALUES_BY_VALUE_TYPE = (
+    dict()
+)  # type: Dict[aas_types.DataTypeDefXSD, List[str]]
+
+
+def _consistent_xs_values(value_type: aas_types.DataTypeDefXSD) -> List[str]:
+    """List the frozen positive examples of ``value_type`` accepted by the SDK."""
+    values = _CONSISTENT_XS_VALUES_BY_VALUE_TYPE.get(value_type, None)
+    if values is None:
+        # Some of the fuzzed positive examples are rejected by the SDK. The fixer
+        # would re-generate the value at the same path hash and thus get stuck on
+        # the same example, so we choose only among the accepted examples up front.
+        values = [
+            value
+            for value in frozen_examples_xs_value.BY_VALUE_TYPE[
+                value_type.value
+            ].positives.values()
+            if aas_verification.value_consistent_with_xsd_type(value, value_type)
+        ]
+        assert len(values) > 0, (
+            f"Expected at least one frozen positive example of {value_type.value} "
+            f"to be accepted by the SDK"
+        )
+
+        _CONSISTENT_XS_VALUES_BY_VALUE_TYPE[value_type] = values
+
+    return values
+
+
+def _generate_list_of_properties(
+    path_hash: common.CanHash, list_length: int
+) -> aas_types.SubmodelElementList:
+    """Generate a list of ``list_length`` properties sharing the value type."""
+    submodel_element_list = creation.minimal_submodel_element_list(path_hash)
+    submodel_element_list.type_value_list_element = (
+        aas_types.AASSubmodelElements.PROPERTY
+    )
+
+    value_type = primitiving.choose_value(
+        common.hash_path(path_hash, "value_type_list_element"),
+        list(aas_types.DataTypeDefXSD),
+    )
+    submodel_element_list.value_type_list_element = value_type
+
+    hash_for_value = common.hash_path(path_hash, "value")
+
+    value = []  # type: List[aas_types.SubmodelElement]
+    for i in range(list_length):
+        item_path_hash = common.hash_path(hash_for_value, i)
+
+        item = creation.minimal_property(item_path_hash)
+        item.value_type = value_type
+        item.value = primitiving.choose_value(
+            common.hash_path(item_path_hash, "value"),
+            _consistent_xs_values(value_type),
+        )
+
+        value.append(item)
+
+    submodel_element_list.value = value
+
+    return submodel_element_list
+
+
+@require(lambda depth: depth >= 1)
+def _generate_top_level_element(
+    path_hash: common.CanHash, id_short: str, depth: int, list_length: int
+) -> aas_types.SubmodelElement:
+    """Generate a chain of nested collections ending in a list of properties."""
+    if depth == 1:
+        element = _generate_list_of_properties(
+            path_hash, list_length
+        )  # type: aas_types.SubmodelElement
+    else:
+        collection = creation.minimal_submodel_element_collection(path_hash)
+
+        child_path_hash = common.hash_path(path_hash, ["value", 0])
+        collection.value = [
+            _generate_top_level_element(
+                child_path_hash,
+                id_short=fixing.generate_id_short(
+                    common.hash_path(child_path_hash, "id_short")
+                ),
+                depth=depth - 1,
+                list_length=list_length,
+            )
+        ]
+
+        element = collection
+
+    element.id_short = id_short
+    return element
+
+
+def _path_hash_for_environment(shape: Shape) -> common.CanHash:
+    """Compute the path hash of the environment so that it depends on the shape."""
+    return common.hash_path(
+        None,
+        [
+            "stress",
+            shape.aas_count,
+            shape.submodel_count,
+            shape.elements_per_submodel,
+            shape.depth,
+            shape.list_length,
+        ],
+    )
+
+
+def _path_hash_for_submodel(shape: Shape, index: int) -> common.CanHash:
+    """Compute the path hash of the submodel at ``index``."""
+    return common.hash_path(_path_hash_for_environment(shape), ["submodels", index])
+
+
+@require(lambda shape, submodel_index: 0 <= submodel_index < shape.submodel_count)
+def _iterate_top_level_elements(
+    shape: Shape, submodel_index: int
+) -> Iterator[aas_types.SubmodelElement]:
+    """
+    Generate and fix the top-level elements of the submodel at ``submodel_index``.
+
+    The elements are generated one at a time so that the caller can discard them
+    before the next one is generated.
+    """
+    hash_for_elements = common.hash_path(
+        _path_hash_for_submodel(shape, submodel_index), "submodel_elements"
+    )
+
+    for i in range(shape.elements_per_submodel):
+        element_path_hash = common.hash_path(hash_for_elements, i)
+
+        # We append the index so that the ID-shorts are unique regardless of
+        # the collisions in the hashes.
+        id_short = fixing.generate_id_short(
+            common.hash_path(element_path_hash, "id_short")
+        )
+
+        element = _generate_top_level_element(
+            element_path_hash,
+            id_short=f"{id_short}_{i}",
+            depth=shape.depth,
+            list_length=shape.list_length,
+        )
+
+        fixing.fix(element)
+
+        yield element
+
+
+def _generate_skeleton(shape: Shape) -> aas_types.Environment:
+    """
+    Generate the environment of the given ``shape`` without the submodel elements.
+
+    The skeleton is fixed and the shells already refer to the submodels.
+    """
+    path_hash = _path_hash_for_environment(shape)
+
+    environment = creation.minimal_environment(path_hash)
+
+    submodels = []  # type: List[aas_types.Submodel]
+    for i in range(shape.submodel_count):
+        submodel_path_hash = _path_hash_for_submodel(shape, i)
+
+        submodel = creation.minimal_submodel(submodel_path_hash)
+
+        # We append the index so that the identifiers are unique regardless of
+        # the collisions in the hashes.
+        submodel.id = (
+            f"{fixing.generate_urn(common.hash_path(submodel_path_hash, 'ID'))}:{i}"
+        )
+        submodels.append(submodel)
+
+    environment.submodels = submodels
+
+    hash_for_shells = common.hash_path(path_hash, "asset_administration_shells")
+
+    shells = []  # type: List[aas_types.AssetAdministrationShell]
+    for i in range(shape.aas_count):
+        shell_path_hash = common.hash_path(hash_for_shells, i)
+
+        shell = creation.minimal_asset_administration_shell(shell_path_hash)
+        shell.id = f"{fixing.generate_urn(common.hash_path(shell_path_hash, 'ID'))}:{i}"
+        shells.append(shell)
+
+    environment.asset_administration_shells = shells
+
+    fixing.fix(environment)
+
+    # The handyman replaces the references to the submodels with semi-random ones,
+    # so we set the references only after the fixing. They are valid by
+    # construction.
+    for i, submodel in enumerate(submodels):
+        shell = shells[i % shape.aas_count]
+
+        if shell.submodels is None:
+            shell.submodels = []
+
+        shell.submodels.append(
+            aas_types.Reference(
+                type=aas_types.ReferenceTypes.MODEL_REFERENCE,
+                keys=[
+                    aas_types.Key(type=aas_types.KeyTypes.SUBMODEL, value=submodel.id)
+                ],
+            )
+        )
+
+    return environment
+
+
+def generate_environment(shape: Shape) -> aas_types.Environment:
+    """
+    Generate a valid environment of the given ``shape`` in memory.
+
+    See :py:func:`write_environment` for the large shapes.
+    """
+    environment = _generate_skeleton(shape)
+    assert environment.submodels is not None
+
+    for i, submodel in enumerate(environment.submodels):
+        submodel.submodel_elements = list(_iterate_top_level_elements(shape, i))
+
+    return environment
+
+
+def serialize(
+    environment: aas_types.Environment,
+    fmt: serialized.Format,
+    symbol_table: intermediate.SymbolTable,
+) -> bytes:
+    """Serialize the ``environment`` in the given format."""
+    if fmt is serialized.Format.JSON:
+        return json.dumps(
+            aas_jsonization.to_jsonable(environment), indent=2, sort_keys=True
+        ).encode("utf-8")
+
+    elif fmt is serialized.Format.XML:
+        return aas_xmlization.to_str(environment).encode("utf-8")
+
+    elif fmt is serialized.Format.RDF:
+        return generate_rdf.serialize_environment(
+            environment=environment, symbol_table=symbol_table
+        )
+
+    else:
+        assert_never(fmt)
+        raise AssertionError("Unexpected execution path")
+
+
+def _serialize_submodel_element(
+    element: aas_types.SubmodelElement,
+    fmt: serialized.Format,
+    symbol_table: intermediate.SymbolTable,
+) -> str:
+    """Serialize ``element`` as it appears in a submodel, but without indentation."""
+    if fmt is serialized.Format.JSON:
+        return json.dumps(
+            aas_jsonization.to_jsonable(element), indent=2, sort_keys=True
+        )
+
+    elif fmt is serialized.Format.XML:
+        text = aas_xmlization.to_str(element)
+
+        # The namespace is declared only once on the root element of the document.
+        namespace_declaration = f' xmlns="{aas_xmlization.NAMESPACE}"'
+        assert namespace_declaration in text, (
+            f"Expected the namespace declaration {namespace_declaration!r} "
+            f"in the serialized element, but got: {text}"
+        )
+
+        return text.replace(namespace_declaration, "", 1)
+
+    elif fmt is serialized.Format.RDF:
+        return str(
+            generate_rdf.serialize_submodel_element(
+                element=element, symbol_table=symbol_table
+            )
+        )
+
+    else:
+        assert_never(fmt)
+        raise AssertionError("Unexpected execution path")
+
+
+#: Indentation of the submodel elements in the serialized environment
+_ELEMENT_INDENT_BY_FORMAT = {
+    serialized.Format.JSON: " " * 8,
+    serialized.Format.XML: "",
+    serialized.Format.RDF: " " * 4,
+}
+assert all(fmt in _ELEMENT_INDENT_BY_FORMAT for fmt in serialized.Format)
+
+#: Separator between the consecutive submodel elements in the serialized environment
+_ELEMENT_SEPARATOR_BY_FORMAT = {
+    serialized.Format.JSON: ",\n",
+    serialized.Format.XML: "",
+    serialized.Format.RDF: "\n",
+}
+assert all(fmt in _ELEMENT_SEPARATOR_BY_FORMAT for fmt in serialized.Format)
+
+
+def write_environment(
+    shape: Shape,
+    fmt: serialized.Format,
+    stream: BinaryIO,
+    symbol_table: intermediate.SymbolTable,
+) -> None:
+    """
+    Generate and write the environment of the given ``shape`` to the ``stream``.
+
+    The top-level submodel elements are generated, fixed, written and discarded
+    one at a time, so that the memory stays flat regardless of the size of
+    the environment. The output is equal to the :py:func:`serialize`-d
+    :py:func:`generate_environment`.
+    """
+    # We serialize the skeleton of the environment with a placeholder element in
+    # each submodel, and splice in the actual elements instead of the placeholders.
+    # Thus the streaming writer does not need to know the layout of the formats
+    # except for the indentation and the separators of the elements.
+    environment = _generate_skeleton(shape)
+    assert environment.submodels is not None
+
+    indent = _ELEMENT_INDENT_BY_FORMAT[fmt]
+    separator = _ELEMENT_SEPARATOR_BY_FORMAT[fmt].encode("utf-8")
+
+    placeholders = []  # type: List[str]
+    for i, submodel in enumerate(environment.submodels):
+        placeholder = aas_types.Property(
+            value_type=aas_types.DataTypeDefXSD.STRING,
+            id_short=f"streamingPlaceholder{i}",
+        )
+        submodel.submodel_elements = [placeholder]
+
+        placeholders.append(
+            textwrap.indent(
+                _serialize_submodel_element(
+                    element=placeholder, fmt=fmt, symbol_table=symbol_table
+                ),
+                indent,
+            )
+        )
+
+    text = serialize(
+        environment=environment, fmt=fmt, symbol_table=symbol_table
+    ).decode("utf-8")
+
+    position = 0
+    for i, placeholder_text in enumerate(placeholders):
+        start = text.find(placeholder_text, position)
+        assert start >= 0 and text.count(placeholder_text) == 1, (
+            f"Expected the placeholder of the submodel {i} to appear exactly once "
+            f"in the serialized skeleton, but it did not: {placeholder_text!r}"
+        )
+
+        stream.write(text[position:start].encode("utf-8"))
+
+        for j, element in enumerate(_iterate_top_level_elements(shape, i)):
+            if j > 0:
+                stream.write(separator)
+
+            stream.write(
+                textwrap.indent(
+                    _serialize_submodel_element(
+                        element=element, fmt=fmt, symbol_table=symbol_table
+                    ),
+                    indent,
+                ).encode("utf-8")
+            )
+
+        position = start + len(placeholder_text)
+
+    stream.write(text[position:].encode("utf-8"))
+
+
+_EXTENSION_BY_FORMAT = {
+    serialized.Format.JSON: "json",
+    serialized.Format.XML: "xml",
+    serialized.Format.RDF: "ttl",
+}
+assert all(fmt in _EXTENSION_BY_FORMAT for fmt in serialized.Format)
+
+
+@ensure(lambda result: not result.is_absolute())
+def relative_path(shape: Shape, fmt: serialized.Format) -> pathlib.PurePosixPath:
+    """Determine where the environment of the ``shape`` is written to."""
+    return pathlib.PurePosixPath(
+        f"{fmt.value}/Stress/environment{shape.element_count()}"
+        f".{_EXTENSION_BY_FORMAT[fmt]}"
+    )
+
+
+def iterate(
+    model_path: pathlib.Path,
+    shapes: Sequence[Shape],
+    formats: Sequence[serialized.Format] = (
+        serialized.Format.JSON,
+        serialized.Format.XML,
+        serialized.Format.RDF,
+    ),
+) -> Iterator[Tuple[Shape, pathlib.PurePosixPath, serialized.Format, bytes]]:
+    """
+    Iterate over the stress environments serialized in the given ``formats``.
+
+    Each environment is generated only once, serialized to all the formats, and
+    released before the next one is generated.
+    """
+    symbol_table, _ = common.load_symbol_table_and_infer_constraints_for_schema(
+        model_path=model_path
+    )
+
+    for shape in shapes:
+        environment = generate_environment(shape)
+
+        for fmt in formats:
+            yield (
+                shape,
+                relative_path(shape, fmt),
+                fmt,
+                serialize(environment=environment, fmt=fmt, symbol_table=symbol_table),
+            )
+
+
+def main() -> int:
+    """Execute the main routine."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--model_path", help="path to the meta-model", required=True)
+    parser.add_argument(
+        "--output_dir",
+        help="path to the directory where the stress environments are written to",
+        required=True,
+    )
+    parser.add_argument(
+        "--max_exponent",
+        help=(
+            "the largest environment in the ladder has 10 ** max_exponent "
+            "submodel elements"
+        ),
+        type=int,
+        default=6,
+    )
+    parser.add_argument(
+        "--formats",
+        help="formats to serialize the environments to",
+        nargs="+",
+        choices=[fmt.value for fmt in serialized.Format],
+        default=[fmt.value for fmt in serialized.Format],
+    )
+    parser.add_argument(
+        "--streaming",
+        help=(
+            "if set, write the environments element by element so that "
+            "the memory stays flat regardless of their size"
+        ),
+        action="store_true",
+    )
+    args = parser.parse_args()
+
+    max_exponent = int(args.max_exponent)
+    if max_exponent < 1:
+        print(
+            f"Expected --max_exponent to be at least 1, but got {max_exponent}",
+            file=sys.stderr,
+        )
+        return 1
+
+    formats = [serialized.Format(value) for value in args.formats]
+
+    output_dir = pathlib.Path(args.output_dir)
+    shapes = ladder(max_exponent=max_exponent)
+
+    if args.streaming:
+        symbol_table, _ = common.load_symbol_table_and_infer_constraints_for_schema(
+            model_path=pathlib.Path(args.model_path)
+        )
+
+        for shape in shapes:
+            for fmt in formats:
+                path = output_dir / relative_path(shape, fmt)
+                path.parent.mkdir(parents=True, exist_ok=True)
+
+                with path.open("wb") as fid:
+                    write_environment(
+                        shape=shape, fmt=fmt, stream=fid, symbol_table=symbol_table
+                    )
+
+            print(f"Generated {shape.describe()}.")
+
+        return 0
+
+    previous_shape = None  # type: Optional[Shape]
+    with writing.DirectorySink(directory=output_dir) as sink:
+        for shape, relative_pth, _, data in iterate(
+            model_path=pathlib.Path(args.model_path),
+            shapes=shapes,
+            formats=formats,
+        ):
+            if shape is not previous_shape:
+                print(f"Generated {shape.describe()}.")
+                previous_shape = shape
+
+            sink.write(relative_pth, data)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,613 @@
+"""Check that the serialized cases behave as expected when loaded with the SDK."""
+import concurrent.futures
+import functools
+import json
+import pathlib
+import re
+import types
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TYPE_CHECKING,
+)
+
+from icontract import ensure, require
+from typing_extensions import assert_never
+
+from aas_core3_1_testgen import lazy_importing, serialized
+
+# The SDK modules are large, and the generators import this module even if they
+# do not verify anything. Hence we load the SDK only once we actually check a case.
+if TYPE_CHECKING:
+    import aas_core3_1.types as aas_types
+    from aas_core3_1 import (
+        jsonization as aasjsonization,
+        verification as aasverification,
+        xmlization as aasxmlization,
+    )
+else:
+    aas_types = lazy_importing.lazy_import("aas_core3_1.types")
+    aasjsonization = lazy_importing.lazy_import("aas_core3_1.jsonization")
+    aasverification = lazy_importing.lazy_import("aas_core3_1.verification")
+    aasxmlization = lazy_importing.lazy_import("aas_core3_1.xmlization")
+
+
+def _snake_to_pascal(name: str) -> str:
+    """
+    Convert the snake-case ``name`` of the SDK to Pascal case.
+
+    >>> _snake_to_pascal("data_specification_iec_61360")
+    'DataSpecificationIec61360'
+    """
+    return "".join(part.capitalize() for part in name.split("_"))
+
+
+def _snake_to_camel(name: str) -> str:
+    """
+    Convert the snake-case ``name`` of the SDK to camel case.
+
+    >>> _snake_to_camel("data_specification_iec_61360")
+    'dataSpecificationIec61360'
+    """
+    pascal = _snake_to_pascal(name)
+    return pascal[0].lower() + pascal[1:]
+
+
+def _collect_from_module(
+    module: types.ModuleType, suffix: str
+) -> Mapping[str, Callable[..., "aas_types.Class"]]:
+    """
+    Collect the public de-serialization functions of the classes in ``module``.
+
+    :return: mapping snake-case class name to de-serialization function
+    """
+    result = dict()  # type: Dict[str, Callable[..., aas_types.Class]]
+
+    for name, value in vars(module).items():
+        if name.startswith("_") or not name.endswith(suffix):
+            continue
+
+        # The de-serialization functions of the enumerations share the suffix, so
+        # we keep only the functions which return a class. We can not look up
+        # the class by its name since the SDK spells acronyms in upper case
+        # (*e.g.*, ``SpecificAssetID``).
+        returned = getattr(value, "__annotations__", dict()).get("return", None)
+        if not (isinstance(returned, type) and issubclass(returned, aas_types.Class)):
+            continue
+
+        snake_name = name[: -len(suffix)]
+        result[snake_name] = value
+
+    return result
+
+
+@functools.lru_cache(maxsize=None)
+def from_jsonable_dispatch() -> Mapping[
+    str, Callable[["aasjsonization.Jsonable"], "aas_types.Class"]
+]:
+    """Map model type of a class to function to de-serialize it from a JSON-able."""
+    return {
+        _snake_to_pascal(snake_name): function
+        for snake_name, function in _collect_from_module(
+            aasjsonization, "_from_jsonable"
+        ).items()
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def from_str_dispatch() -> Mapping[str, Callable[[str], "aas_types.Class"]]:
+    """Map XML class name to function to de-serialize it from an XML text."""
+    return {
+        _snake_to_camel(snake_name): function
+        for snake_name, function in _collect_from_module(
+            aasxmlization, "_from_str"
+        ).items()
+    }
+
+
+@require(lambda fmt: fmt is not serialized.Format.RDF)
+def deserialize_instance(
+    data: bytes, fmt: serialized.Format, class_name: str
+) -> Tuple[Optional["aas_types.Class"], Optional[str]]:
+    """
+    De-serialize an instance of the meta-model class ``class_name`` from ``data``.
+
+    The meta-model names are converted to the JSON model types and the XML class
+    names the same way as the SDK names, *e.g.*, ``Data_specification_IEC_61360``
+    to ``DataSpecificationIec61360`` and ``dataSpecificationIec61360``.
+
+    :return: the instance, or the cause of the de-serialization error
+    """
+    try:
+        if fmt is serialized.Format.JSON:
+            from_jsonable = from_jsonable_dispatch()[_snake_to_pascal(class_name)]
+            return from_jsonable(json.loads(data)), None
+
+        elif fmt is serialized.Format.XML:
+            from_str = from_str_dispatch()[_snake_to_camel(class_name)]
+            return from_str(data.decode("utf-8")), None
+
+        elif fmt is serialized.Format.RDF:
+            raise AssertionError("Unexpected execution path")
+
+        else:
+            assert_never(fmt)
+            raise AssertionError("Unexpected execution path")
+
+    except aasjsonization.DeserializationException as exception:
+        return None, exception.cause
+
+    except aasxmlization.DeserializationException as exception:
+        return None, exception.cause
+
+
+def _check_instance(
+    load: Callable[[], "aas_types.Class"],
+    deserialization_exception_cls: Type[Exception],
+    expected_outcome: serialized.ExpectedOutcome,
+) -> Optional[str]:
+    """
+    Load the instance and check it against the ``expected_outcome``.
+
+    :return: error message, if any
+    """
+    instance = None  # type: Optional[aas_types.Class]
+    caught = None  # type: Optional[Exception]
+    try:
+        instance = load()
+    except deserialization_exception_cls as exception:
+        caught = exception
+
+    if expected_outcome is serialized.ExpectedOutcome.EXPECTED:
+        if caught is not None:
+            return f"Failed to de-serialize an expected instance: {caught}"
+
+        assert instance is not None
+        errors = list(aasverification.verify(instance))
+        if len(errors) != 0:
+            errors_joined = "\n".join(str(error) for error in errors)
+            return f"Failed to verify an expected instance:\n{errors_joined}"
+
+        return None
+
+    elif expected_outcome is serialized.ExpectedOutcome.UNSERIALIZABLE:
+        if caught is None:
+            return "Expected a de-serialization error, but caught none"
+
+        return None
+
+    elif expected_outcome is serialized.ExpectedOutcome.INVALID:
+        if caught is not None:
+            return (
+                f"Failed to de-serialize an invalid, but de-serializable "
+                f"instance: {caught}"
+            )
+
+        assert instance is not None
+        if next(iter(aasverification.verify(instance)), None) is None:
+            return "Expected a verification error, but got none"
+
+        return None
+
+    else:
+        assert_never(expected_outcome)
+        raise AssertionError("Unexpected execution path")
+
+
+@require(lambda class_name: class_name in from_jsonable_dispatch())
+def check_json_instance(
+    data: bytes, class_name: str, expected_outcome: serialized.ExpectedOutcome
+) -> Optional[str]:
+    """
+    Check that the instance of ``class_name`` serialized as JSON ``data`` meets
+    the outcome.
+
+    :return: error message, if any
+    """
+    jsonable = json.loads(data)
+    from_jsonable = from_jsonable_dispatch()[class_name]
+
+    return _check_instance(
+        load=lambda: from_jsonable(jsonable),
+        deserialization_exception_cls=aasjsonization.DeserializationException,
+        expected_outcome=expected_outcome,
+    )
+
+
+def check_json_environment(
+    data: bytes, expected_outcome: serialized.ExpectedOutcome
+) -> Optional[str]:
+    """
+    Check that the environment serialized as JSON ``data`` meets the outcome.
+
+    :return: error message, if any
+    """
+    return check_json_instance(
+        data=data, class_name="Environment", expected_outcome=expected_outcome
+    )
+
+
+@require(lambda xml_class_name: xml_class_name in from_str_dispatch())
+def check_xml_instance(
+    data: bytes, xml_class_name: str, expected_outcome: serialized.ExpectedOutcome
+) -> Optional[str]:
+    """
+    Check that the instance of ``xml_class_name`` serialized as XML ``data`` meets
+    the outcome.
+
+    :return: error message, if any
+    """
+    text = data.decode("utf-8")
+    from_str = from_str_dispatch()[xml_class_name]
+
+    return _check_instance(
+        load=lambda: from_str(text),
+        deserialization_exception_cls=aasxmlization.DeserializationException,
+        expected_outcome=expected_outcome,
+    )
+
+
+def check_xml_environment(
+    data: bytes, expected_outcome: serialized.ExpectedOutcome
+) -> Optional[str]:
+    """
+    Check that the environment serialized as XML ``data`` meets the outcome.
+
+    :return: error message, if any
+    """
+    return check_xml_instance(
+        data=data, xml_class_name="environment", expected_outcome=expected_outcome
+    )
+
+
+_TURTLE_TOKEN_RE = re.compile(
+    r"(?P<whitespace>[ \t\r\n]+)"
+    r'|(?P<prefix>@prefix[ \t]+(?P<declared>[A-Za-z]*):[ \t]*<[^<>"{}|^`\\\x00-\x20]*>'
+    r"[ \t]*\.)"
+    r'|(?P<iri><[^<>"{}|^`\\\x00-\x20]*>)'
+    r'|(?P<literal>"(?:[^"\\\n\r]|\\[tbnrf"\'\\])*"\^\^(?=[A-Za-z]*:))'
+    r"|(?P<name>(?P<used>[A-Za-z]*):[A-Za-z0-9_]*)"
+    r"|(?P<punctuation>[\[\];.])"
+)
+
+#: Tokens which can follow the tokens of each state of :py:func:`_check_turtle`
+_TURTLE_TRANSITIONS = {
+    ("subject", "iri"): "verb",
+    ("verb", "iri"): "object",
+    ("verb", "name"): "object",
+    ("object", "iri"): "separator",
+    ("object", "name"): "separator",
+    ("object", "literal"): "datatype",
+    ("datatype", "name"): "separator",
+    ("separator", ";"): "verb",
+}
+
+
+def _check_turtle(text: str) -> Optional[str]:
+    """
+    Check the ``text`` against the subset of Turtle emitted by :py:mod:`generate_rdf`.
+
+    The serializer emits the prefix declarations followed by the blocks of
+    ``<subject> <predicate> <object> ;`` statements terminated by a dot, where each
+    statement ends with a semicolon. The objects are IRIs, prefixed names, typed
+    short string literals, or blank nodes in brackets.
+
+    :return: error message, if any
+    """
+    declared = set()  # type: Set[str]
+    state = "subject"
+    depth = 0
+
+    cursor = 0
+    while cursor < len(text):
+        mtch = _TURTLE_TOKEN_RE.match(text, cursor)
+        if mtch is None:
+            return f"Unexpected character {text[cursor]!r} at offset {cursor}"
+
+        kind = mtch.lastgroup
+        assert kind is not None
+
+        if kind == "punctuation":
+            kind = mtch.group()
+
+        if kind == "whitespace":
+            pass
+
+        elif kind == "prefix":
+            if state != "subject" or depth != 0:
+                return f"Unexpected prefix declaration at offset {cursor}"
+            declared.add(mtch.group("declared"))
+
+        elif kind == "[" and state == "object":
+            depth += 1
+            state = "verb"
+
+        elif kind == "]" and state == "verb" and depth > 0:
+            depth -= 1
+            state = "separator"
+
+        elif kind == "." and state == "verb" and depth == 0:
+            state = "subject"
+
+        else:
+            next_state = _TURTLE_TRANSITIONS.get((state, kind), None)
+            if next_state is None:
+                return (
+                    f"Unexpected {mtch.group()!r} at offset {cursor} "
+                    f"while expecting a {state}"
+                )
+
+            if kind == "name" and mtch.group("used") not in declared:
+                return f"Undeclared prefix in {mtch.group()!r} at offset {cursor}"
+
+            state = next_state
+
+        cursor = mtch.end()
+
+    if state != "subject":
+        return f"Unexpected end of the document while expecting a {state}"
+
+    return None
+
+
+def check_rdf_well_formed(data: bytes) -> Optional[str]:
+    """
+    Check that the RDF ``data`` is a well-formed Turtle document.
+
+    The SDK can not de-serialize RDF, so we can not distinguish between the expected
+    outcomes. We only check the syntax of the Turtle we emit and that the used
+    prefixes are declared.
+
+    :return: error message, if any
+    """
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError as exception:
+        return f"Failed to decode the content as UTF-8: {exception}"
+
+    error = _check_turtle(text)
+    if error is not None:
+        return f"The content is not well-formed Turtle: {error}"
+
+    return None
+
+
+#: Map each format to the file extension of its serialized cases
+_EXTENSIONS = {
+    serialized.Format.JSON: ".json",
+    serialized.Format.XML: ".xml",
+    serialized.Format.RDF: ".ttl",
+}
+
+#: Represent a validation job as
+#: ``(test data directory, relative path, format, expected outcome)``.
+#:
+#: The expected outcome is None for RDF since we can not de-serialize it.
+Job = Tuple[
+    pathlib.Path,
+    pathlib.PurePath,
+    serialized.Format,
+    Optional[serialized.ExpectedOutcome],
+]
+
+
+def class_name_of(relative_path: pathlib.PurePath, fmt: serialized.Format) -> str:
+    """
+    Determine the class of the instance serialized at the ``relative_path``.
+
+    The ``relative_path`` is relative to the test data directory.
+
+    >>> class_name_of(
+    ...     pathlib.PurePosixPath(
+    ...         "Json/SelfContained/Unexpected/Invalid/MaxLengthViolation/"
+    ...         "EventPayload/topic.json"
+    ...     ),
+    ...     serialized.Format.JSON
+    ... )
+    'EventPayload'
+
+    >>> class_name_of(
+    ...     pathlib.PurePosixPath(
+    ...         "Xml/SelfContained/Expected/eventPayload/"
+    ...         "timeStampOverPatternExamples/fuzzed_01.xml"
+    ...     ),
+    ...     serialized.Format.XML
+    ... )
+    'eventPayload'
+
+    >>> class_name_of(
+    ...     pathlib.PurePosixPath(
+    ...         "Xml/ContainedInEnvironment/Expected/submodel/minimal.xml"
+    ...     ),
+    ...     serialized.Format.XML
+    ... )
+    'environment'
+    """
+    if relative_path.parts[1] == "ContainedInEnvironment":
+        if fmt is serialized.Format.JSON:
+            return "Environment"
+        elif fmt is serialized.Format.XML:
+            return "environment"
+        elif fmt is serialized.Format.RDF:
+            return "Environment"
+        else:
+            assert_never(fmt)
+
+    # The self-contained instances reside in the directory named after their class,
+    # which follows either the expected outcome or the cause of the negative case.
+    # The examples over patterns are nested one level deeper.
+    if relative_path.parts[2] == "Expected":
+        return relative_path.parts[3]
+
+    return relative_path.parts[5]
+
+
+def check_case(
+    relative_path: pathlib.PurePath,
+    fmt: serialized.Format,
+    expected_outcome: Optional[serialized.ExpectedOutcome],
+    data: bytes,
+) -> Optional[str]:
+    """
+    Check the serialized case stored at the ``relative_path``.
+
+    The ``relative_path`` is relative to the test data directory.
+
+    :return: error message, if any
+    """
+    if fmt is serialized.Format.JSON:
+        assert expected_outcome is not None
+        return check_json_instance(
+            data=data,
+            class_name=class_name_of(relative_path, fmt),
+            expected_outcome=expected_outcome,
+        )
+
+    elif fmt is serialized.Format.XML:
+        assert expected_outcome is not None
+        return check_xml_instance(
+            data=data,
+            xml_class_name=class_name_of(relative_path, fmt),
+            expected_outcome=expected_outcome,
+        )
+
+    elif fmt is serialized.Format.RDF:
+        return check_rdf_well_formed(data)
+
+    else:
+        assert_never(fmt)
+        raise AssertionError("Unexpected execution path")
+
+
+def _check_file(job: Job) -> Optional[str]:
+    """
+    Check the serialized case stored at the path of the ``job``.
+
+    This function needs to live at the module level so that it can be pickled and
+    sent to the worker processes.
+
+    :return: error message prefixed with the path, if any
+    """
+    test_data_dir, relative_path, fmt, expected_outcome = job
+
+    pth = test_data_dir / relative_path
+
+    error = check_case(
+        relative_path=relative_path,
+        fmt=fmt,
+        expected_outcome=expected_outcome,
+        data=pth.read_bytes(),
+    )
+
+    if error is None:
+        return None
+
+    return f"{pth}: {error}"
+
+
+def collect_jobs(test_data_dir: pathlib.Path, fmt: serialized.Format) -> List[Job]:
+    """
+    Collect the cases of the format ``fmt``, both contained and self-contained.
+
+    The jobs are sorted by path so that the validation is deterministic.
+
+    :raise: :py:class:`AssertionError` if no cases could be found for an outcome
+    """
+    extension = _EXTENSIONS[fmt]
+
+    jobs = []  # type: List[Job]
+
+    if fmt is serialized.Format.RDF:
+        # The RDF cases are not split by the expected outcome since there is no
+        # de-serializer which we could distinguish the outcomes with.
+        base_dir = test_data_dir / fmt.value / "ContainedInEnvironment"
+        for pth in sorted(base_dir.glob(f"**/*{extension}")):
+            jobs.append((test_data_dir, pth.relative_to(test_data_dir), fmt, None))
+
+        if len(jobs) == 0:
+            raise AssertionError(f"Unexpected no {extension} files in {base_dir}")
+
+        return jobs
+
+    for container in ("ContainedInEnvironment", "SelfContained"):
+        base_dir = test_data_dir / fmt.value / container
+
+        for expected_outcome, outcome_dir in (
+            (serialized.ExpectedOutcome.EXPECTED, base_dir / "Expected"),
+            (
+                serialized.ExpectedOutcome.UNSERIALIZABLE,
+                base_dir / "Unexpected" / "Unserializable",
+            ),
+            (serialized.ExpectedOutcome.INVALID, base_dir / "Unexpected" / "Invalid"),
+        ):
+            paths = sorted(outcome_dir.glob(f"**/*{extension}"))
+            if len(paths) == 0:
+                raise AssertionError(
+                    f"Unexpected no {extension} files in {outcome_dir}"
+                )
+
+            for pth in paths:
+                jobs.append(
+                    (
+                        test_data_dir,
+                        pth.relative_to(test_data_dir),
+                        fmt,
+                        expected_outcome,
+                    )
+                )
+
+    return jobs
+
+
+@ensure(lambda result: result == sorted(result))
+def validate_jobs(jobs: Sequence[Job], workers: Optional[int] = None) -> List[str]:
+    """
+    Check the ``jobs`` in a process pool and collect the errors.
+
+    If ``workers`` is 1, the jobs are checked in the current process.
+
+    :return: errors sorted by path
+    """
+    if workers == 1:
+        errors = [_check_file(job) for job in jobs]
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            # We chunk the jobs so that the inter-process communication does not
+            # dominate the run time, since most checks take only a millisecond.
+            errors = list(executor.map(_check_file, jobs, chunksize=64))
+
+    return sorted(error for error in errors if error is not None)
+
+
+def validate_tree(
+    test_data_dir: pathlib.Path,
+    fmt: serialized.Format,
+    workers: Optional[int] = None,
+) -> List[str]:
+    """
+    Check both the contained and the self-contained cases for the format ``fmt``.
+
+    The self-contained cases are de-serialized as instances of the class given
+    by their path (see :py:func:`class_name_of`), and the RDF cases are only
+    checked for well-formedness (see :py:func:`collect_jobs`).
+
+    :return: errors sorted by path
+    """
+    try:
+        jobs = collect_jobs(test_data_dir=test_data_dir, fmt=fmt)
+    except AssertionError as exception:
+        return [str(exception)]
+
+    return validate_jobs(jobs=jobs, workers=workers)
+
+
+def report(errors: Sequence[str]) -> str:
+    """Combine the ``errors`` into a single report."""
+    return f"Found {len(errors)} error(s):\n" + "\n".join(errors)
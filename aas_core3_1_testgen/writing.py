@@ -0,0 +1,519 @@
+"""Write the generated test data to a destination."""
+import abc
+import concurrent.futures
+import gzip
+import hashlib
+import io
+import os
+import pathlib
+import shutil
+import stat
+import tarfile
+import types
+import zipfile
+from typing import (
+    BinaryIO,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    cast,
+)
+
+from icontract import require, DBC
+
+
+class Sink(DBC):
+    """Accept the generated files and persist them at the destination."""
+
+    @abc.abstractmethod
+    @require(lambda relative_path: not relative_path.is_absolute())
+    def write(self, relative_path: pathlib.PurePath, data: bytes) -> None:
+        """Write ``data`` as the file at ``relative_path``."""
+        raise NotImplementedError()
+
+    def close(self) -> None:
+        """Flush everything to the destination and release the resources."""
+
+    def __enter__(self) -> "Sink":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[types.TracebackType],
+    ) -> None:
+        self.close()
+
+
+class DirectorySink(Sink):
+    """
+    Write the files to a directory on the local file system.
+
+    The directories are created only once and every file is written in a single
+    call through one buffered handle.
+    """
+
+    #: Directory where the files are written
+    directory: pathlib.Path
+
+    #: If set, synchronize the written files with the disk once on close
+    fsync: bool
+
+    def __init__(self, directory: pathlib.Path, fsync: bool = False) -> None:
+        """Initialize with the given values."""
+        self.directory = directory
+        self.fsync = fsync
+
+        self._created_directories = set()  # type: Set[pathlib.Path]
+
+        # We keep track of the written files only if we need to synchronize them
+        # one by one, *i.e.*, on systems which lack ``os.sync``.
+        self._written_paths = []  # type: List[pathlib.Path]
+
+    def write(self, relative_path: pathlib.PurePath, data: bytes) -> None:
+        """Write ``data`` as the file at ``relative_path``."""
+        pth = self.directory / relative_path
+
+        # Most of the files share a parent with the previously written files. We thus
+        # spare ourselves the calls to ``mkdir`` and ``stat`` for every single file.
+        parent = pth.parent
+        if parent not in self._created_directories:
+            parent.mkdir(parents=True, exist_ok=True)
+            self._created_directories.add(parent)
+
+        with pth.open("wb") as fid:
+            fid.write(data)
+
+        if self.fsync and not hasattr(os, "sync"):
+            self._written_paths.append(pth)
+
+    def close(self) -> None:
+        """Synchronize the written files with the disk, if requested."""
+        if not self.fsync:
+            return
+
+        if hasattr(os, "sync"):
+            os.sync()
+        else:
+            for pth in self._written_paths:
+                with pth.open("rb+") as fid:
+                    os.fsync(fid.fileno())
+
+            self._written_paths = []
+
+
+#: Timestamp of all the archive entries so that the archives are reproducible
+_ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+#: Permissions of all the archive entries
+_FILE_MODE = 0o644
+
+
+class ArchiveSink(Sink):
+    """
+    Write the files into a single zip or tar archive.
+
+    The kind of the archive is determined by the suffix of the path: ``.zip``,
+    ``.tar``, or ``.tar.gz``.
+
+    The entries are written in the order in which they are generated, which is
+    deterministic. All the entries share the same timestamp, owner and permissions
+    so that the same test data always results in the identical archive.
+    """
+
+    #: Path to the archive
+    path: pathlib.Path
+
+    @require(lambda path: ArchiveReader.is_supported(path))
+    def __init__(self, path: pathlib.Path) -> None:
+        """Initialize with the given values."""
+        self.path = path
+
+        self._written_names = set()  # type: Set[str]
+
+        self._zip_file = None  # type: Optional[zipfile.ZipFile]
+        self._tar_file = None  # type: Optional[tarfile.TarFile]
+        self._gzip_file = None  # type: Optional[gzip.GzipFile]
+        self._raw_file = None  # type: Optional[BinaryIO]
+
+        if path.name.endswith(".zip"):
+            self._zip_file = zipfile.ZipFile(
+                str(path), mode="w", compression=zipfile.ZIP_DEFLATED
+            )
+        elif path.name.endswith(".tar"):
+            self._tar_file = tarfile.open(
+                str(path), mode="w", format=tarfile.PAX_FORMAT
+            )
+        elif path.name.endswith(".tar.gz"):
+            # The gzip header contains the modification time, so we need to fix it
+            # to get a reproducible archive.
+            self._raw_file = path.open("wb")
+            self._gzip_file = gzip.GzipFile(
+                filename="", mode="wb", fileobj=self._raw_file, mtime=0
+            )
+            self._tar_file = tarfile.open(
+                fileobj=cast(BinaryIO, self._gzip_file),
+                mode="w",
+                format=tarfile.PAX_FORMAT,
+            )
+        else:
+            raise AssertionError(f"Unexpected archive path: {path}")
+
+    def write(self, relative_path: pathlib.PurePath, data: bytes) -> None:
+        """Write ``data`` as the entry at ``relative_path``."""
+        name = relative_path.as_posix()
+        if name in self._written_names:
+            raise ValueError(f"The entry has been already written: {name}")
+        self._written_names.add(name)
+
+        if self._zip_file is not None:
+            zip_info = zipfile.ZipInfo(filename=name, date_time=_ZIP_DATE_TIME)
+            zip_info.compress_type = zipfile.ZIP_DEFLATED
+            zip_info.create_system = 3
+            zip_info.external_attr = (stat.S_IFREG | _FILE_MODE) << 16
+
+            self._zip_file.writestr(zip_info, data)
+
+        elif self._tar_file is not None:
+            tar_info = tarfile.TarInfo(name=name)
+            tar_info.size = len(data)
+            tar_info.mtime = 0
+            tar_info.mode = _FILE_MODE
+            tar_info.uid = 0
+            tar_info.gid = 0
+            tar_info.uname = ""
+            tar_info.gname = ""
+
+            self._tar_file.addfile(tar_info, io.BytesIO(data))
+
+        else:
+            raise AssertionError("Unexpected write to a closed archive")
+
+    def close(self) -> None:
+        """Finalize the archive."""
+        if self._zip_file is not None:
+            self._zip_file.close()
+            self._zip_file = None
+
+        if self._tar_file is not None:
+            self._tar_file.close()
+            self._tar_file = None
+
+        if self._gzip_file is not None:
+            self._gzip_file.close()
+            self._gzip_file = None
+
+        if self._raw_file is not None:
+            self._raw_file.close()
+            self._raw_file = None
+
+
+class ArchiveReader:
+    """Read the entries of an archive written by :py:class:`ArchiveSink`."""
+
+    #: Path to the archive
+    path: pathlib.Path
+
+    @staticmethod
+    def is_supported(path: pathlib.Path) -> bool:
+        """Check that we know how to handle the archive at ``path``."""
+        return any(path.name.endswith(suffix) for suffix in (".zip", ".tar", ".tar.gz"))
+
+    @require(lambda path: ArchiveReader.is_supported(path))
+    def __init__(self, path: pathlib.Path) -> None:
+        """Open the archive at ``path`` for reading."""
+        self.path = path
+
+        self._zip_file = None  # type: Optional[zipfile.ZipFile]
+        self._tar_file = None  # type: Optional[tarfile.TarFile]
+
+        if path.name.endswith(".zip"):
+            self._zip_file = zipfile.ZipFile(str(path), mode="r")
+        else:
+            self._tar_file = tarfile.open(str(path), mode="r:*")
+
+    def names(self) -> List[str]:
+        """List the POSIX paths of the entries in the order of the archive."""
+        if self._zip_file is not None:
+            return self._zip_file.namelist()
+
+        assert self._tar_file is not None
+        return [member.name for member in self._tar_file.getmembers()]
+
+    def read(self, name: str) -> bytes:
+        """Read the content of the entry ``name``."""
+        if self._zip_file is not None:
+            return self._zip_file.read(name)
+
+        assert self._tar_file is not None
+        fileobj = self._tar_file.extractfile(name)
+        if fileobj is None:
+            raise KeyError(f"The entry is not a file: {name}")
+
+        with fileobj:
+            return fileobj.read()
+
+    def close(self) -> None:
+        """Release the archive."""
+        if self._zip_file is not None:
+            self._zip_file.close()
+            self._zip_file = None
+
+        if self._tar_file is not None:
+            self._tar_file.close()
+            self._tar_file = None
+
+    def __enter__(self) -> "ArchiveReader":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[types.TracebackType],
+    ) -> None:
+        self.close()
+
+
+class DedupStatistics:
+    """Count how much the content addressing saves."""
+
+    #: Number of written files
+    files: int
+
+    #: Number of distinct payloads among the written files
+    unique_payloads: int
+
+    #: Total size of all the written files in bytes
+    total_bytes: int
+
+    #: Size of the distinct payloads in bytes
+    unique_bytes: int
+
+    def __init__(self) -> None:
+        """Initialize with zeros."""
+        self.files = 0
+        self.unique_payloads = 0
+        self.total_bytes = 0
+        self.unique_bytes = 0
+
+    def ratio(self) -> float:
+        """Compute how many times fewer bytes we store than we would otherwise."""
+        if self.unique_bytes == 0:
+            return 1.0
+
+        return self.total_bytes / self.unique_bytes
+
+    def report(self) -> str:
+        """Render the statistics as a human-readable text."""
+        return (
+            f"Stored {self.unique_payloads} unique payload(s) "
+            f"for {self.files} file(s); "
+            f"{self.unique_bytes} byte(s) instead of {self.total_bytes} byte(s), "
+            f"a dedup ratio of {self.ratio():.2f}."
+        )
+
+
+def render_sha256sum(digest_by_name: Mapping[str, str]) -> str:
+    """Render the digests in the format of ``sha256sum``, sorted by the names."""
+    return "".join(
+        f"{digest}  {name}\n" for name, digest in sorted(digest_by_name.items())
+    )
+
+
+def parse_sha256sum(text: str) -> List[Tuple[str, str]]:
+    """Parse the pairs of names and digests from the ``sha256sum`` format."""
+    result = []  # type: List[Tuple[str, str]]
+
+    for line in text.splitlines():
+        digest, name = line.split("  ", 1)
+        result.append((name, digest))
+
+    return result
+
+
+#: Name of the index file in a content-addressed store which maps
+#: the relative paths to the digests of their payloads
+CONTENT_ADDRESSED_INDEX = "index.sha256"
+
+
+def _object_path(store_dir: pathlib.Path, digest: str) -> pathlib.Path:
+    """Determine the path where the payload with the ``digest`` is stored."""
+    return store_dir / "objects" / digest[:2] / digest[2:]
+
+
+class ContentAddressedSink(Sink):
+    """
+    Store each distinct payload only once, addressed by its SHA-256 digest.
+
+    The payloads live in ``objects/`` of the store directory. The tree itself is
+    recorded in :py:data:`CONTENT_ADDRESSED_INDEX` in the format of ``sha256sum``,
+    sorted by the relative paths. Use :py:func:`materialize_content_addressed` to
+    recreate the plain directory tree.
+    """
+
+    #: Directory of the store
+    directory: pathlib.Path
+
+    #: Statistics of the written files so far
+    statistics: DedupStatistics
+
+    def __init__(self, directory: pathlib.Path) -> None:
+        """Initialize with the given values."""
+        self.directory = directory
+        self.statistics = DedupStatistics()
+
+        self._digest_by_name = dict()  # type: Dict[str, str]
+        self._stored_objects = set()  # type: Set[pathlib.Path]
+        self._object_sink = DirectorySink(directory=directory)
+
+    def write(self, relative_path: pathlib.PurePath, data: bytes) -> None:
+        """Record ``data`` as the file at ``relative_path``."""
+        name = relative_path.as_posix()
+        if name in self._digest_by_name:
+            raise ValueError(f"The file has been already written: {name}")
+
+        digest = hashlib.sha256(data).hexdigest()
+        self._digest_by_name[name] = digest
+
+        self.statistics.files += 1
+        self.statistics.total_bytes += len(data)
+
+        object_pth = _object_path(store_dir=self.directory, digest=digest)
+        if object_pth in self._stored_objects:
+            return
+
+        self._stored_objects.add(object_pth)
+        self.statistics.unique_payloads += 1
+        self.statistics.unique_bytes += len(data)
+
+        # The objects from the previous runs remain valid since they are addressed
+        # by their content.
+        if not object_pth.exists():
+            self._object_sink.write(object_pth.relative_to(self.directory), data)
+
+    def close(self) -> None:
+        """Write the index of the tree."""
+        self._object_sink.write(
+            pathlib.PurePath(CONTENT_ADDRESSED_INDEX),
+            render_sha256sum(self._digest_by_name).encode("utf-8"),
+        )
+        self._object_sink.close()
+
+
+def read_content_addressed_index(store_dir: pathlib.Path) -> List[Tuple[str, str]]:
+    """Read the pairs of relative POSIX paths and digests from the index."""
+    return parse_sha256sum(
+        (store_dir / CONTENT_ADDRESSED_INDEX).read_text(encoding="utf-8")
+    )
+
+
+def materialize_content_addressed(
+    store_dir: pathlib.Path, target_dir: pathlib.Path
+) -> None:
+    """
+    Recreate the plain tree of files from the store in ``target_dir``.
+
+    The files are hard-linked to the objects where the file system allows it, and
+    copied otherwise.
+    """
+    created_directories = set()  # type: Set[pathlib.Path]
+
+    for name, digest in read_content_addressed_index(store_dir=store_dir):
+        object_pth = _object_path(store_dir=store_dir, digest=digest)
+        pth = target_dir / name
+
+        parent = pth.parent
+        if parent not in created_directories:
+            parent.mkdir(parents=True, exist_ok=True)
+            created_directories.add(parent)
+
+        try:
+            os.link(object_pth, pth)
+        except OSError:
+            shutil.copyfile(object_pth, pth)
+
+
+#: Name of the manifest in the test data directory which records the SHA-256
+#: digests of the generated files
+MANIFEST = "manifest.sha256"
+
+#: Directories of the test data directory which hold the generated files
+GENERATED_DIRECTORIES = ("Json", "Rdf", "Xml")
+
+
+def _digest_file(pth: pathlib.Path) -> str:
+    """Compute the SHA-256 digest of the file at ``pth``."""
+    return hashlib.sha256(pth.read_bytes()).hexdigest()
+
+
+def digest_files(
+    directory: pathlib.Path, names: Sequence[str], workers: Optional[int] = None
+) -> Dict[str, str]:
+    """
+    Compute the SHA-256 digests of the files ``names`` relative to ``directory``.
+
+    :return: mapping of the names to the digests
+    """
+    # Both reading the files and hashing release the GIL, so threads suffice and
+    # spare us the cost of sending the contents between processes.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        digests = list(executor.map(_digest_file, (directory / name for name in names)))
+
+    return dict(zip(names, digests))
+
+
+def list_generated_files(test_data_dir: pathlib.Path) -> List[str]:
+    """List the relative POSIX paths of the generated files, sorted."""
+    return sorted(
+        pth.relative_to(test_data_dir).as_posix()
+        for directory in GENERATED_DIRECTORIES
+        for pth in (test_data_dir / directory).glob("**/*")
+        if pth.is_file()
+    )
+
+
+def write_manifest(test_data_dir: pathlib.Path, workers: Optional[int] = None) -> None:
+    """Record the digests of the generated files in :py:data:`MANIFEST`."""
+    digest_by_name = digest_files(
+        directory=test_data_dir,
+        names=list_generated_files(test_data_dir=test_data_dir),
+        workers=workers,
+    )
+
+    (test_data_dir / MANIFEST).write_bytes(
+        render_sha256sum(digest_by_name).encode("utf-8")
+    )
+
+
+def update_manifest(
+    test_data_dir: pathlib.Path,
+    removed_names: Iterable[str],
+    digest_by_name: Mapping[str, str],
+) -> None:
+    """
+    Update :py:data:`MANIFEST` with the digests of the re-written files in place.
+
+    The ``removed_names`` are dropped before the ``digest_by_name`` are recorded.
+    Unlike :py:func:`write_manifest`, the unchanged files are not digested again.
+    """
+    manifest = read_manifest(test_data_dir=test_data_dir)
+
+    for name in removed_names:
+        manifest.pop(name, None)
+
+    manifest.update(digest_by_name)
+
+    (test_data_dir / MANIFEST).write_bytes(render_sha256sum(manifest).encode("utf-8"))
+
+
+def read_manifest(test_data_dir: pathlib.Path) -> Dict[str, str]:
+    """Read the digests of the generated files from :py:data:`MANIFEST`."""
+    return dict(parse_sha256sum((test_data_dir / MANIFEST).read_text(encoding="utf-8")))
@@ -0,0 +1,67 @@
+"""
+Benchmark the memoized fixing of the wrapper environments.
+
+Every minimal and maximal instance is wrapped in an environment and fixed
+for a number of rounds. The duration per environment and the hit rates of
+the memo are reported.
+"""
+import argparse
+import sys
+import time
+
+from aas_core3_1_testgen import fixing
+from aas_core3_1_testgen.codegened import wrapping
+
+
+def main() -> int:
+    """Execute the main routine."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--rounds",
+        help="number of times every environment is fixed",
+        type=int,
+        default=3,
+    )
+    args = parser.parse_args()
+
+    rounds = int(args.rounds)
+
+    environments = [
+        in_environment(class_name)[0]
+        for _ in range(rounds)
+        for in_environment in [
+            wrapping.minimal_in_environment,
+            wrapping.maximal_in_environment,
+        ]
+        for class_name in wrapping._CLASS_NAME_TO_MINIMAL_IN_ENVIRONMENT
+    ]
+
+    start = time.perf_counter()
+    for environment in environments:
+        # Some of the environments can not be fixed by the handyman, and need to
+        # be customized in the generation instead, so we ignore the errors.
+        try:
+            fixing.fix(environment)
+        except AssertionError:
+            pass
+    duration = time.perf_counter() - start
+
+    print(
+        f"Fixing took {duration / len(environments) * 1e6:.1f} us/environment "
+        f"over {len(environments)} environments."
+    )
+
+    statistics = fixing.memo_statistics()
+    for class_name in sorted(set(statistics.hits) | set(statistics.misses)):
+        print(
+            f"{class_name}: {statistics.hits[class_name]} hits, "
+            f"{statistics.misses[class_name]} misses, "
+            f"hit rate {statistics.hit_rate(class_name):.2f}"
+        )
+    print(f"Overall hit rate: {statistics.hit_rate():.2f}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
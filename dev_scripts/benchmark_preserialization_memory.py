@@ -0,0 +1,74 @@
+"""
+Measure the memory taken by the pre-serialized instances.
+
+All the minimal and maximal instances are wrapped in environments, and the
+environments are pre-serialized and kept alive, similar to how the cases are
+generated. The traced peak memory, the number of allocated blocks and the peak
+resident set size of the process are reported.
+"""
+import argparse
+import resource
+import sys
+import time
+import tracemalloc
+from typing import List
+
+from aas_core3_1_testgen.codegened import preserialization, wrapping
+
+
+def main() -> int:
+    """Execute the main routine."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--rounds",
+        help="number of times every environment is pre-serialized",
+        type=int,
+        default=20,
+    )
+    args = parser.parse_args()
+
+    rounds = int(args.rounds)
+
+    environments = [
+        in_environment(class_name)[0]
+        for in_environment in [
+            wrapping.minimal_in_environment,
+            wrapping.maximal_in_environment,
+        ]
+        for class_name in wrapping._CLASS_NAME_TO_MINIMAL_IN_ENVIRONMENT
+    ]
+
+    preserialized = []  # type: List[preserialization.Instance]
+
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    for _ in range(rounds):
+        for environment in environments:
+            preserialized_environment, _ = preserialization.preserialize(environment)
+            preserialized.append(preserialized_environment)
+
+    duration = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    blocks = sum(
+        statistic.count
+        for statistic in tracemalloc.take_snapshot().statistics("filename")
+    )
+    tracemalloc.stop()
+
+    # The maximum resident set size is reported in kilobytes on Linux.
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    print(
+        f"Pre-serialized {len(preserialized)} environments "
+        f"in {duration * 1000:.1f} ms."
+    )
+    print(f"Traced peak: {peak / 1024 / 1024:.1f} MiB")
+    print(f"Live allocated blocks: {blocks}")
+    print(f"Peak RSS: {max_rss / 1024:.1f} MiB")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,190 @@
+"""
+Benchmark writing the test data with and without the shared output sink.
+
+The workload replays the files of an existing test data directory so that the layout
+of the directories corresponds to the real one. If ``strace`` is available, each
+mode runs in a separate process under ``strace -c -f`` and the syscall counts are
+reported. Otherwise, we fall back to counting the file operations through the audit
+hooks of the interpreter.
+"""
+import argparse
+import collections
+import pathlib
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from typing import List, Mapping, MutableMapping, Tuple, Any
+
+from aas_core3_1_testgen import writing
+
+#: Syscalls which we report on
+_REPORTED_SYSCALLS = [
+    "mkdir",
+    "mkdirat",
+    "stat",
+    "newfstatat",
+    "statx",
+    "openat",
+    "write",
+    "close",
+    "fsync",
+    "sync",
+]
+
+
+def _load_workload(test_data_dir: pathlib.Path) -> List[Tuple[pathlib.Path, str]]:
+    """Load the relative paths and the content of all the test data files."""
+    workload = []  # type: List[Tuple[pathlib.Path, str]]
+    for pth in sorted(test_data_dir.glob("**/*")):
+        if not pth.is_file():
+            continue
+
+        workload.append(
+            (pth.relative_to(test_data_dir), pth.read_text(encoding="utf-8"))
+        )
+
+    return workload
+
+
+def _write_legacy(
+    workload: List[Tuple[pathlib.Path, str]], output_dir: pathlib.Path
+) -> None:
+    """Write the files as the generators did before introducing the sinks."""
+    for relative_pth, text in workload:
+        pth = output_dir / relative_pth
+        parent = pth.parent
+
+        if relative_pth.parts[0] == "Json":
+            parent.mkdir(parents=True, exist_ok=True)
+        elif not parent.exists():
+            parent.mkdir(parents=True)
+
+        with pth.open("wt", encoding="utf-8") as fid:
+            fid.write(text)
+
+
+def _write_through_sink(
+    workload: List[Tuple[pathlib.Path, str]], output_dir: pathlib.Path, fsync: bool
+) -> None:
+    """Write the files through the shared output sink."""
+    with writing.DirectorySink(directory=output_dir, fsync=fsync) as sink:
+        for relative_pth, text in workload:
+            sink.write(relative_pth, text.encode("utf-8"))
+
+
+def _run_mode(mode: str, test_data_dir: pathlib.Path) -> None:
+    """Run a single benchmark mode in this process and report the measurements."""
+    workload = _load_workload(test_data_dir=test_data_dir)
+
+    counts = collections.Counter()  # type: MutableMapping[str, int]
+
+    def audit_hook(event: str, _: Tuple[Any, ...]) -> None:
+        if event in ("open", "os.mkdir"):
+            counts[event] += 1
+
+    output_dir = pathlib.Path(tempfile.mkdtemp(prefix="aas-core3.1-testgen-bench-"))
+    try:
+        sys.addaudithook(audit_hook)
+
+        start = time.perf_counter()
+        if mode == "legacy":
+            _write_legacy(workload=workload, output_dir=output_dir)
+        elif mode == "sink":
+            _write_through_sink(workload=workload, output_dir=output_dir, fsync=False)
+        elif mode == "sink-fsync":
+            _write_through_sink(workload=workload, output_dir=output_dir, fsync=True)
+        else:
+            raise ValueError(f"Unexpected mode: {mode!r}")
+        duration = time.perf_counter() - start
+
+        # The audit hooks can not be removed, so we simply copy the counts before
+        # the clean-up below adds its own events.
+        counts_copy = dict(counts)
+    finally:
+        shutil.rmtree(output_dir)
+
+    print(
+        f"{mode}: wrote {len(workload)} files in {duration:.2f} seconds; "
+        f"open events: {counts_copy.get('open', 0)}, "
+        f"mkdir events: {counts_copy.get('os.mkdir', 0)}"
+    )
+
+
+_STRACE_LINE_RE = re.compile(
+    r"^\s*[0-9.]+\s+[0-9.]+\s+[0-9]+\s+(?P<calls>[0-9]+)\s+([0-9]+\s+)?(?P<name>\w+)$"
+)
+
+
+def _parse_strace_summary(text: str) -> Mapping[str, int]:
+    """Parse the calls per syscall from the summary of ``strace -c``."""
+    calls = dict()  # type: MutableMapping[str, int]
+    for line in text.splitlines():
+        mtch = _STRACE_LINE_RE.match(line)
+        if mtch is not None:
+            calls[mtch.group("name")] = int(mtch.group("calls"))
+
+    return calls
+
+
+def main() -> int:
+    """Execute the main routine."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--test_data_dir",
+        help="path to the test data to be replayed",
+        default=str(pathlib.Path(__file__).parent.parent / "test_data"),
+    )
+    parser.add_argument(
+        "--mode",
+        help="if set, run only this mode in the current process",
+        choices=["legacy", "sink", "sink-fsync"],
+    )
+    args = parser.parse_args()
+
+    test_data_dir = pathlib.Path(args.test_data_dir)
+
+    if args.mode is not None:
+        _run_mode(mode=args.mode, test_data_dir=test_data_dir)
+        return 0
+
+    strace = shutil.which("strace")
+    if strace is None:
+        print(
+            "strace is not available; reporting the audit events instead.",
+            file=sys.stderr,
+        )
+
+    for mode in ["legacy", "sink", "sink-fsync"]:
+        command = [
+            sys.executable,
+            __file__,
+            "--test_data_dir",
+            str(test_data_dir),
+            "--mode",
+            mode,
+        ]
+
+        if strace is None:
+            subprocess.check_call(command)
+            continue
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            summary_pth = pathlib.Path(tmp_dir) / "strace.txt"
+            subprocess.check_call(
+                [strace, "-c", "-f", "-o", str(summary_pth)] + command
+            )
+            calls = _parse_strace_summary(summary_pth.read_text(encoding="utf-8"))
+
+        reported = ", ".join(
+            f"{name}: {calls[name]}" for name in _REPORTED_SYSCALLS if name in calls
+        )
+        print(f"{mode} syscalls: {reported}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -36,9 +36,106 @@ assert PrimitiveValueTuple == get_args(PrimitiveValueUnion)"""
         ),
         Stripped(
             f"""\
+class _Schema:
+{I}\"\"\"
+{I}Represent the names of the properties in the order of their insertion.
+
+{I}The schemas are interned so that all the instances with the same properties
+{I}share the same schema.
+{I}\"\"\"
+
+{I}__slots__ = ("names", "index_by_name", "_successors")
+
+{I}def __init__(self, names: Tuple[str, ...]) -> None:
+{II}\"\"\"Initialize with the given values.\"\"\"
+{II}self.names = names
+{II}self.index_by_name = {{
+{III}name: i for i, name in enumerate(names)
+{II}}}  # type: Dict[str, int]
+{II}self._successors = dict()  # type: Dict[str, _Schema]
+
+{I}def appended(self, name: str) -> "_Schema":
+{II}\"\"\"Retrieve the schema with ``name`` appended to our names.\"\"\"
+{II}successor = self._successors.get(name, None)
+{II}if successor is None:
+{III}successor = _schema_for(self.names + (name,))
+{III}self._successors[name] = successor
+
+{II}return successor
+
+{I}def removed(self, name: str) -> "_Schema":
+{II}\"\"\"Retrieve the schema with ``name`` removed from our names.\"\"\"
+{II}return _schema_for(tuple(other for other in self.names if other != name))
+
+{I}def __deepcopy__(self, memo: Dict[int, Any]) -> "_Schema":
+{II}return self
+
+{I}def __reduce__(self) -> Tuple[Any, Tuple[Tuple[str, ...]]]:
+{II}return _schema_for, (self.names,)"""
+        ),
+        Stripped("_SCHEMAS = dict()  # type: Dict[Tuple[str, ...], _Schema]"),
+        Stripped(
+            f"""\
+def _schema_for(names: Tuple[str, ...]) -> _Schema:
+{I}\"\"\"Retrieve the interned schema for the ``names``.\"\"\"
+{I}schema = _SCHEMAS.get(names, None)
+{I}if schema is None:
+{II}schema = _Schema(names)
+{II}_SCHEMAS[names] = schema
+
+{I}return schema"""
+        ),
+        Stripped("_EMPTY_SCHEMA = _schema_for(())"),
+        Stripped(
+            f"""\
+class Properties(MutableMapping[str, Optional[ValueUnion]]):
+{I}\"\"\"
+{I}Map names of the properties to their pre-serialized values.
+
+{I}The properties are iterated over in the order of their insertion. The names
+{I}are kept in a schema shared among the instances, while the values are kept
+{I}in a list.
+{I}\"\"\"
+
+{I}__slots__ = ("_schema", "_values")
+
+{I}def __init__(self) -> None:
+{II}\"\"\"Initialize empty.\"\"\"
+{II}self._schema = _EMPTY_SCHEMA
+{II}self._values = []  # type: List[Optional[ValueUnion]]
+
+{I}def __getitem__(self, name: str) -> Optional[ValueUnion]:
+{II}return self._values[self._schema.index_by_name[name]]
+
+{I}def __setitem__(self, name: str, value: Optional[ValueUnion]) -> None:
+{II}index = self._schema.index_by_name.get(name, None)
+{II}if index is None:
+{III}self._schema = self._schema.appended(name)
+{III}self._values.append(value)
+{II}else:
+{III}self._values[index] = value
+
+{I}def __delitem__(self, name: str) -> None:
+{II}index = self._schema.index_by_name[name]
+{II}self._schema = self._schema.removed(name)
+{II}del self._values[index]
+
+{I}def __contains__(self, name: object) -> bool:
+{II}return name in self._schema.index_by_name
+
+{I}def __iter__(self) -> Iterator[str]:
+{II}return iter(self._schema.names)
+
+{I}def __len__(self) -> int:
+{II}return len(self._values)"""
+        ),
+        Stripped(
+            f"""\
 class Instance:
 {I}\"\"\"Represent an instance of a class.\"\"\"
 
+{I}__slots__ = ("properties", "class_name")
+
 {I}#: Pre-serialized properties of the instance.
 {I}#:
 {I}#: Our default pre-serialization is to *omit* properties which are set to ``None``.
@@ -46,14 +143,12 @@ class Instance:
 {I}#: ``null`` JSON values. We leave it therefore open for the downstream client
 {I}#: to define properties as ``null`` (by setting them to ``None``) even though
 {I}#: our pre-serializer simply omits them.
-{I}properties: OrderedDict[str, Optional[ValueUnion]]
+{I}properties: Properties
 
 {I}#: Class name according to aas-core-meta format, *not* as a Python class
 {I}class_name: Identifier
 
-{I}def __init__(
-{II}self, properties: OrderedDict[str, Optional[ValueUnion]], class_name: Identifier
-{I}) -> None:
+{I}def __init__(self, properties: Properties, class_name: Identifier) -> None:
 {II}\"\"\"
 {II}Initialize with the given values.
 
@@ -68,6 +163,8 @@ class Instance:
 class ListOfInstances:
 {I}\"\"\"Represent a list of instances.\"\"\"
 
+{I}__slots__ = ("values",)
+
 {I}def __init__(self, values: List[Instance]) -> None:
 {II}\"\"\"Initialize with the given values.\"\"\"
 {II}self.values = values"""
@@ -119,13 +216,7 @@ def dump(value: ValueUnion) -> str:
 
 def _generate_transform(cls: intermediate.ConcreteClass) -> Stripped:
     """Generate the pre-serialization method."""
-    blocks = [
-        Stripped(
-            """\
-properties = collections.OrderedDict(
-)  # type: OrderedDict[str, Optional[ValueUnion]]"""
-        )
-    ]  # type: List[Stripped]
+    blocks = [Stripped("properties = Properties()")]  # type: List[Stripped]
 
     for prop in cls.properties:
         type_anno = intermediate.beneath_optional(prop.type_annotation)
@@ -295,11 +386,12 @@ import collections
 import json
 from typing import (
 {I}Any,
+{I}Dict,
 {I}get_args,
+{I}Iterator,
 {I}List,
 {I}MutableMapping,
 {I}Optional,
-{I}OrderedDict,
 {I}Tuple,
 {I}Union
 )
@@ -218,6 +218,85 @@ def {function_name}(
     )
 
 
+def _generate_in_cached_environment() -> Stripped:
+    """Generate the helper which caches the wrapper skeletons per route."""
+    return Stripped(
+        f"""\
+class _Placeholder:
+{I}\"\"\"Mark the place of the target instance in a wrapper skeleton.\"\"\"
+
+{I}def __deepcopy__(self, memo: Dict[int, Any]) -> "_Placeholder":
+{II}return self
+
+
+_PLACEHOLDER = _Placeholder()
+
+_Route = Callable[
+{I}[Callable[[common.CanHash], Any]],
+{I}Tuple[aas_types.Environment, Any, List[Union[str, int]]]
+]
+
+#: Environment with the placeholder, path hash of the target and path to it
+_Skeleton = Tuple[aas_types.Environment, common.CanHash, List[Union[str, int]]]
+
+#: Wrapper skeletons by route
+_SKELETONS = dict()  # type: Dict[_Route, _Skeleton]
+
+
+def _in_cached_environment(
+{I}route: _Route,
+{I}creation_function: Callable[[common.CanHash], T]
+) -> Tuple[
+{I}aas_types.Environment,
+{I}T,
+{I}List[Union[str, int]]
+]:
+{I}\"\"\"
+{I}Create the target instance with ``creation_function`` in a copy of the skeleton.
+
+{I}The skeleton of the ``route`` is created only once. We deep-copy it for each
+{I}call, and replace the placeholder with the target instance. The path hashes
+{I}are the same as if the ``route`` were called with ``creation_function``.
+{I}\"\"\"
+{I}skeleton = _SKELETONS.get(route, None)
+{I}if skeleton is None:
+{II}recorded_path_hashes = []  # type: List[common.CanHash]
+
+{II}def record(path_hash: common.CanHash) -> Any:
+{III}recorded_path_hashes.append(path_hash.copy())
+{III}return _PLACEHOLDER
+
+{II}environment, _, path = route(record)
+{II}assert len(recorded_path_hashes) == 1
+{II}assert len(path) > 0
+
+{II}skeleton = (environment, recorded_path_hashes[0], path)
+{II}_SKELETONS[route] = skeleton
+
+{I}environment_skeleton, path_hash, path = skeleton
+
+{I}environment = copy.deepcopy(environment_skeleton)
+{I}instance = creation_function(path_hash.copy())
+
+{I}container = environment  # type: Any
+{I}for segment in path[:-1]:
+{II}if isinstance(segment, int):
+{III}container = container[segment]
+{II}else:
+{III}container = getattr(container, segment)
+
+{I}last_segment = path[-1]
+{I}if isinstance(last_segment, int):
+{II}assert container[last_segment] is _PLACEHOLDER
+{II}container[last_segment] = instance
+{I}else:
+{II}assert getattr(container, last_segment) is _PLACEHOLDER
+{II}setattr(container, last_segment, instance)
+
+{I}return environment, instance, list(path)"""
+    )
+
+
 def _generate_minimal_cls_in_environment(
     cls: intermediate.ConcreteClass,
 ) -> Stripped:
@@ -247,7 +326,8 @@ def {function_name}() -> Tuple[
 {II}That means it can be serialized as-is, but probably violates one or
 {II}more meta-model constraints.
 {I}\"\"\"
-{I}return {generation_function}(
+{I}return _in_cached_environment(
+{II}route={generation_function},
 {II}creation_function={minimal_function}
 {I})"""
     )
@@ -340,7 +420,8 @@ def {function_name}() -> Tuple[
 {II}That means it can be serialized as-is, but probably violates one or
 {II}more meta-model constraints.
 {I}\"\"\"
-{I}return {generation_function}(
+{I}return _in_cached_environment(
+{II}route={generation_function},
 {II}creation_function={maximal_function}
 {I})"""
     )
@@ -431,16 +512,22 @@ Create instances wrapped in environment.
         warning,
         Stripped(
             f"""\
+import copy
 from typing import (
+{I}Any,
 {I}Callable,
+{I}Dict,
 {I}List,
 {I}Tuple,
+{I}TypeVar,
 {I}Union
 )
 
 from aas_core3_1_testgen import common
 from aas_core3_1_testgen.codegened import creation
-from aas_core3_1 import types as aas_types"""
+from aas_core3_1 import types as aas_types
+
+T = TypeVar("T")"""
         ),
     ]
 
@@ -487,6 +574,8 @@ from aas_core3_1 import types as aas_types"""
             )
         )
 
+    blocks.append(_generate_in_cached_environment())
+
     # endregion
 
     # region Minimal in environment
@@ -1,9 +1,10 @@
 """Generate examples for all the pattern verification functions."""
 import argparse
+import json
 import pathlib
 import re
 import warnings
-from typing import Set
+from typing import List, Set
 
 import hypothesis
 import hypothesis.errors
@@ -38,39 +39,38 @@ def main() -> None:
             verification_function.pattern, fullmatch=True
         )
 
-        print(
-            f"For verification function {verification_function.name} "
-            f"with pattern {verification_function.pattern}:"
-        )
-        print("  positives = [")
+        positives = []  # type: List[List[str]]
         for i in range(10):
             text = strategy.example()
-            print(f"    ('fuzzed_{(i + 1):02d}', {text!r}),")
-        print("  ]")
-        print()
-
-        print("  negatives = [")
+            positives.append([f"fuzzed_{(i + 1):02d}", text])
 
         strategy = hypothesis.strategies.text()
         pattern_re = re.compile(verification_function.pattern)
         observed = set()  # type: Set[str]
 
-        count = 0
+        negatives = []  # type: List[List[str]]
         for _ in range(1000):
             text = strategy.example()
             if text in observed:
                 continue
 
             if pattern_re.match(text) is None:
-                print(f"    ('negatively_fuzzed_{(count + 1):02d}', {text!r}),")
-                count += 1
+                negatives.append(
+                    [f"negatively_fuzzed_{(len(negatives) + 1):02d}", text]
+                )
                 observed.add(text)
 
-            if count == 10:
+            if len(negatives) == 10:
                 break
 
-        print("  ]")
-        print()
+        # We print one line in the format of frozen_examples/pattern.jsonl so that
+        # the examples can be merged into the file directly.
+        print(
+            json.dumps(
+                [verification_function.pattern, positives, negatives],
+                separators=(",", ":"),
+            )
+        )
 
 
 if __name__ == "__main__":
@@ -24,6 +24,8 @@ from typing import Optional, List, Callable, AnyStr, Sequence
 # exactly that meta-model version.
 import aas_core_meta.v3
 
+import aas_core3_1_testgen.writing
+
 AAS_CORE_META_DEPENDENCY_RE = re.compile(
     r"aas-core-meta@git\+https://github.com/aas-core-works/aas-core-meta@([a-fA-F0-9]+)#egg=aas-core-meta"
 )
@@ -61,6 +63,16 @@ def _make_sure_no_changed_files(
     return None
 
 
+def _read_aas_core_codegen_revision_from_setup_py(our_repo: pathlib.Path) -> str:
+    """Read the revision of aas-core-codegen pinned in setup.py."""
+    text = (our_repo / "setup.py").read_text(encoding="utf-8")
+
+    match = AAS_CORE_CODEGEN_DEPENDENCY_RE.search(text)
+    assert match is not None, "Expected aas-core-codegen to be pinned in setup.py"
+
+    return match.group(1)
+
+
 def _update_setup_py(
     our_repo: pathlib.Path, aas_core_meta_revision: str, aas_core_codegen_revision: str
 ) -> None:
@@ -344,10 +356,15 @@ def _run_tests_in_parallel(our_repo: pathlib.Path) -> Optional[int]:
     return None
 
 
-def _generate_test_data(our_repo: pathlib.Path) -> Optional[int]:
+def _generate_test_data(
+    our_repo: pathlib.Path, catalog_path: Optional[pathlib.Path]
+) -> Optional[int]:
     """
     Run generate scripts in parallel.
 
+    If ``catalog_path`` is given, all the test data is generated in a single run
+    instead, and recorded in the catalog for the next incremental update.
+
     Return an error code, if any.
     """
     # NOTE (mristin, 2024-04-16):
@@ -360,6 +377,30 @@ def _generate_test_data(our_repo: pathlib.Path) -> Optional[int]:
     shutil.rmtree(test_data_dir / "Rdf")
     shutil.rmtree(test_data_dir / "Xml")
 
+    if catalog_path is not None:
+        print(f"Generating the test data and the catalog {catalog_path}...")
+        start = time.perf_counter()
+
+        subprocess.check_call(
+            [
+                sys.executable,
+                "-m",
+                "aas_core3_1_testgen.generate_all",
+                "--model_path",
+                aas_core_meta.v3.__file__,
+                "--test_data_dir",
+                str(test_data_dir),
+                "--catalog_path",
+                str(catalog_path),
+            ],
+            cwd=str(our_repo),
+        )
+
+        duration = time.perf_counter() - start
+        print(f"Generating the data took: {duration:.2f} seconds.")
+
+        return None
+
     scripts = [
         our_repo / "aas_core3_1_testgen" / name
         for name in ("generate_json.py", "generate_rdf.py", "generate_xml.py")
@@ -403,9 +444,72 @@ def _generate_test_data(our_repo: pathlib.Path) -> Optional[int]:
     duration = time.perf_counter() - start
     print(f"Generating the data took: {duration:.2f} seconds.")
 
+    aas_core3_1_testgen.writing.write_manifest(test_data_dir=test_data_dir)
+    print(f"Updated {test_data_dir / aas_core3_1_testgen.writing.MANIFEST}.")
+
     return None
 
 
+def _regenerate_affected_test_data(
+    our_repo: pathlib.Path,
+    previous_model_path: pathlib.Path,
+    catalog_path: pathlib.Path,
+) -> None:
+    """
+    Regenerate only the cases of the classes affected by the meta-model change.
+
+    The stale files of these classes are looked up in the catalog of the previous
+    generation and deleted first. The catalog and the manifest are updated in
+    place, so that the files of the unaffected classes are not digested again.
+    """
+    test_data_dir = our_repo / "test_data"
+
+    class_names = subprocess.check_output(
+        [
+            sys.executable,
+            "-m",
+            "aas_core3_1_testgen.impact_analysis",
+            "--old_model_path",
+            str(previous_model_path),
+            "--new_model_path",
+            aas_core_meta.v3.__file__,
+            "--names_only",
+        ],
+        cwd=str(our_repo),
+        encoding="utf-8",
+    ).split()
+
+    if len(class_names) == 0:
+        print("No classes are affected by the change of the meta-model.")
+        return
+
+    print(
+        f"Regenerating the test data of {len(class_names)} affected class(es): "
+        f"{' '.join(class_names)}"
+    )
+    start = time.perf_counter()
+
+    subprocess.check_call(
+        [
+            sys.executable,
+            "-m",
+            "aas_core3_1_testgen.generate_all",
+            "--model_path",
+            aas_core_meta.v3.__file__,
+            "--test_data_dir",
+            str(test_data_dir),
+            "--catalog_path",
+            str(catalog_path),
+            "--class_names",
+            *class_names,
+        ],
+        cwd=str(our_repo),
+    )
+
+    duration = time.perf_counter() - start
+    print(f"Regenerating the data took: {duration:.2f} seconds.")
+
+
 def _create_branch_commit_and_push(
     our_repo: pathlib.Path, aas_core_meta_revision: str, aas_core_codegen_revision: str
 ) -> None:
@@ -475,6 +579,15 @@ def main() -> int:
         help="Git branch expected in this repository",
         default="main",
     )
+    parser.add_argument(
+        "--catalog_path",
+        help=(
+            "path to the catalog of the generated test data; if it exists and "
+            "aas-core-codegen is not updated, only the cases of the classes "
+            "affected by the change of the meta-model are regenerated, "
+            "otherwise everything is regenerated and recorded in the catalog"
+        ),
+    )
 
     args = parser.parse_args()
 
@@ -486,6 +599,10 @@ def main() -> int:
 
     expected_our_branch = str(args.expected_our_branch)
 
+    catalog_path = (
+        pathlib.Path(args.catalog_path) if args.catalog_path is not None else None
+    )
+
     # region aas-core-meta repo
 
     if not aas_core_meta_repo.exists():
@@ -590,35 +707,66 @@ def main() -> int:
         if exit_code is not None:
             return exit_code
 
+    previous_aas_core_codegen_revision = _read_aas_core_codegen_revision_from_setup_py(
+        our_repo=our_repo
+    )
+
+    # The re-generation of the code can change the serialization of any class, so
+    # we can regenerate only the affected cases if merely the meta-model changed.
+    incremental = (
+        catalog_path is not None
+        and catalog_path.exists()
+        and (
+            previous_aas_core_codegen_revision.startswith(aas_core_codegen_revision)
+            or aas_core_codegen_revision.startswith(previous_aas_core_codegen_revision)
+        )
+    )
+
     _update_setup_py(
         our_repo=our_repo,
         aas_core_meta_revision=aas_core_meta_revision,
         aas_core_codegen_revision=aas_core_codegen_revision,
     )
 
-    _uninstall_and_install_aas_core_meta(
-        our_repo=our_repo, aas_core_meta_revision=aas_core_meta_revision
-    )
+    # We need to keep the previous meta-model to analyze the impact of the change
+    # after the new one has been installed in its place.
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        previous_model_path = pathlib.Path(tmp_dir) / "v3.py"
+        shutil.copy(aas_core_meta.v3.__file__, previous_model_path)
 
-    _uninstall_and_install_aas_core_codegen(
-        our_repo=our_repo, aas_core_codegen_revision=aas_core_codegen_revision
-    )
+        _uninstall_and_install_aas_core_meta(
+            our_repo=our_repo, aas_core_meta_revision=aas_core_meta_revision
+        )
 
-    _copy_python_sdk_and_schemas_from_aas_core_codegen(
-        aas_core_codegen_repo=aas_core_codegen_repo,
-        our_repo=our_repo,
-        aas_core_codegen_revision=aas_core_codegen_revision,
-    )
+        _uninstall_and_install_aas_core_codegen(
+            our_repo=our_repo, aas_core_codegen_revision=aas_core_codegen_revision
+        )
 
-    exit_code = _generate_code(our_repo=our_repo)
-    if exit_code is not None:
-        return exit_code
+        _copy_python_sdk_and_schemas_from_aas_core_codegen(
+            aas_core_codegen_repo=aas_core_codegen_repo,
+            our_repo=our_repo,
+            aas_core_codegen_revision=aas_core_codegen_revision,
+        )
 
-    _reformat_code(our_repo=our_repo)
+        exit_code = _generate_code(our_repo=our_repo)
+        if exit_code is not None:
+            return exit_code
 
-    exit_code = _generate_test_data(our_repo=our_repo)
-    if exit_code is not None:
-        return exit_code
+        _reformat_code(our_repo=our_repo)
+
+        if incremental:
+            assert catalog_path is not None
+            _regenerate_affected_test_data(
+                our_repo=our_repo,
+                previous_model_path=previous_model_path,
+                catalog_path=catalog_path,
+            )
+        else:
+            exit_code = _generate_test_data(
+                our_repo=our_repo, catalog_path=catalog_path
+            )
+            if exit_code is not None:
+                return exit_code
 
     exit_code = _run_tests_in_parallel(our_repo=our_repo)
     if exit_code is not None:
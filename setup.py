@@ -56,6 +56,6 @@ setup(
     },
     # fmt: on
     py_modules=["aas_core3_1_testgen"],
-    package_data={"aas_core3_1_testgen": ["py.typed"]},
+    package_data={"aas_core3_1_testgen": ["py.typed", "frozen_examples/*.jsonl"]},
     data_files=[(".", ["LICENSE", "README.rst"])],
 )
@@ -0,0 +1,220 @@
+"""Provide common functionality for the tests."""
+import difflib
+import functools
+import hashlib
+import io
+import os.path
+import pathlib
+import unittest.mock
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    MutableMapping,
+    Sequence,
+    Tuple,
+)
+
+import aas_core_meta.v3
+from aas_core_codegen import infer_for_schema, intermediate
+
+import aas_core3_1_testgen.common
+import aas_core3_1_testgen.generate_all
+from aas_core3_1_testgen import serialized, writing
+
+
+def recorded_test_data_dir() -> pathlib.Path:
+    """Determine the directory of the recorded test data and make sure it exists."""
+    repo_root = pathlib.Path(os.path.realpath(__file__)).parent.parent
+    result = repo_root / "test_data"
+    if not result.exists():
+        raise FileNotFoundError(
+            f"Directory with the test data does not exist: {result}"
+        )
+
+    if not result.is_dir():
+        raise NotADirectoryError(f"The test data dir is not a directory: {result}")
+
+    return result
+
+
+@functools.lru_cache(maxsize=None)
+def generated_cases() -> Tuple[serialized.SerializedCase, ...]:
+    """
+    Generate the cases in all the formats once per test session.
+
+    The tests of the individual formats share the result so that the meta-model is
+    loaded and the cases are generated only once. The JSON cases serialized directly
+    from the model are checked against their pre-serialized route in the same pass.
+    """
+    return tuple(
+        aas_core3_1_testgen.generate_all.iterate(
+            model_path=pathlib.Path(aas_core_meta.v3.__file__), check_direct=True
+        )
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def load_symbol_table_and_constraints() -> Tuple[
+    intermediate.SymbolTable,
+    MutableMapping[intermediate.ClassUnion, infer_for_schema.ConstraintsByProperty],
+]:
+    """
+    Load the meta-model and infer its constraints once per test session.
+
+    The tests must not modify the result since it is shared among them.
+    """
+    return (
+        aas_core3_1_testgen.common.load_symbol_table_and_infer_constraints_for_schema(
+            model_path=pathlib.Path(aas_core_meta.v3.__file__)
+        )
+    )
+
+
+def generated_files(fmt: serialized.Format) -> Dict[str, bytes]:
+    """Map the relative POSIX paths of the generated ``fmt`` files to their content."""
+    return {
+        relative_pth.as_posix(): data
+        for relative_pth, a_fmt, _, data in generated_cases()
+        if a_fmt is fmt
+    }
+
+
+class _MemorySink(writing.Sink):
+    """Collect the written files in memory."""
+
+    def __init__(self) -> None:
+        """Initialize with no files."""
+        self.files = dict()  # type: Dict[str, bytes]
+
+    def write(self, relative_path: pathlib.PurePath, data: bytes) -> None:
+        """Keep ``data`` as the file at ``relative_path``."""
+        self.files[relative_path.as_posix()] = data
+
+
+def assert_generated_matches_recorded(fmt: serialized.Format) -> None:
+    """Compare the files generated in the format ``fmt`` against the recorded ones."""
+    _assert_files_match_recorded(fmt=fmt, got_files=generated_files(fmt=fmt))
+
+
+def assert_generate_to_sink_writes_generated_files(
+    fmt: serialized.Format,
+    generate_to_sink: Callable[[pathlib.Path, writing.Sink], None],
+) -> None:
+    """
+    Check that the ``generate_to_sink`` of the format ``fmt`` writes its cases.
+
+    The entry point is a thin wrapper around
+    :py:func:`aas_core3_1_testgen.generate_all.iterate`, so we feed it
+    the :py:func:`generated_cases` instead of running another generation pass.
+    """
+
+    # We must retrieve the shared cases before we stub the iteration.
+    serialized_cases = generated_cases()
+
+    def iterate(
+        formats: Sequence[serialized.Format], **_: Any
+    ) -> Iterator[serialized.SerializedCase]:
+        for serialized_case in serialized_cases:
+            if serialized_case[1] in formats:
+                yield serialized_case
+
+    sink = _MemorySink()
+    with unittest.mock.patch.object(
+        aas_core3_1_testgen.generate_all, "iterate", side_effect=iterate
+    ) as mocked_iterate:
+        with sink:
+            generate_to_sink(pathlib.Path(aas_core_meta.v3.__file__), sink)
+
+    mocked_iterate.assert_called_once()
+    if mocked_iterate.call_args.kwargs["formats"] != (fmt,):
+        raise AssertionError(
+            f"Expected the cases to be iterated only in {fmt.value}, "
+            f"but got: {mocked_iterate.call_args.kwargs['formats']}"
+        )
+
+    expected_files = generated_files(fmt=fmt)
+    if sink.files != expected_files:
+        differing = sorted(
+            name
+            for name in set(sink.files).union(expected_files)
+            if sink.files.get(name, None) != expected_files.get(name, None)
+        )
+        raise AssertionError(
+            f"The files written by generate_to_sink differ from the generated "
+            f"files in {fmt.value}: " + ",\n".join(differing)
+        )
+
+
+def _assert_files_match_recorded(
+    fmt: serialized.Format, got_files: Dict[str, bytes]
+) -> None:
+    """
+    Compare the ``got_files`` in the format ``fmt`` against the recorded ones.
+
+    The files are compared by their digests against the manifest of the recorded
+    test data. Only the files whose digest differs are read from the disk and
+    compared in full.
+    """
+    recorded_dir = recorded_test_data_dir()
+    manifest = writing.read_manifest(test_data_dir=recorded_dir)
+
+    got_file_set = set(got_files)
+
+    expected_file_set = set(
+        name for name in manifest if name.startswith(f"{fmt.value}/")
+    )
+
+    if got_file_set != expected_file_set:
+        only_in_got = sorted(got_file_set.difference(expected_file_set))
+        only_in_expected = sorted(expected_file_set.difference(got_file_set))
+
+        parts = []  # type: List[str]
+
+        if len(only_in_got) > 0:
+            only_in_got_str = ",\n".join(only_in_got)
+            parts.append(
+                f"File(s) generated, " f"but not in {recorded_dir}: {only_in_got_str}"
+            )
+
+        if len(only_in_expected) > 0:
+            only_in_expected_str = ",\n".join(only_in_expected)
+            parts.append(
+                f"File(s) in {recorded_dir} directory, "
+                f"but not generated: {only_in_expected_str}"
+            )
+
+        parts.insert(
+            0,
+            "There are differences in generated files and the expected files.",
+        )
+
+        raise AssertionError("\n\n".join(parts))
+
+    paths_diffs = []  # type: List[Tuple[str, str]]
+    for name in sorted(got_file_set):
+        data = got_files[name]
+        if hashlib.sha256(data).hexdigest() == manifest[name]:
+            continue
+
+        # We decode with universal newlines as we did when we read
+        # the generated files from the disk.
+        got_text = io.TextIOWrapper(io.BytesIO(data), encoding="utf-8").read()
+        expected_text = (recorded_dir / name).read_text(encoding="utf-8")
+
+        if got_text != expected_text:
+            diffs = difflib.ndiff(got_text.splitlines(), expected_text.splitlines())
+
+            paths_diffs.append((name, "\n\n".join(diffs)))
+
+    if len(paths_diffs) > 0:
+        parts = [
+            "There are differences between the generated and the expected examples."
+        ]
+
+        for name, diff in paths_diffs:
+            parts.append(f"In {name}:\n{diff}")
+
+        raise AssertionError("\n\n".join(parts))
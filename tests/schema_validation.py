@@ -0,0 +1,116 @@
+"""Validate the recorded test data against the schemas in a process pool."""
+import concurrent.futures
+import json
+import pathlib
+import xml.etree.ElementTree
+from typing import Any, List, Optional, Sequence, Tuple
+
+import jsonschema
+import jsonschema.validators
+import xmlschema
+
+# Each worker builds its validator once in the initializer and re-uses it for all
+# the files it receives. Building the validator, and especially checking the schema,
+# used to dominate the time spent in the tests when done for every file.
+
+#: Validator of the JSON schema in the current worker
+_JSON_VALIDATOR = None  # type: Optional[Any]
+
+#: XML schema in the current worker
+_XML_SCHEMA = None  # type: Optional[xmlschema.XMLSchema]
+
+
+def _initialize_json_validator(schema_path: pathlib.Path) -> None:
+    """Build the JSON schema validator for the current worker."""
+    global _JSON_VALIDATOR  # pylint: disable=global-statement
+
+    with schema_path.open("rt", encoding="utf-8") as fid:
+        schema = json.load(fid)
+
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    _JSON_VALIDATOR = validator_cls(schema)
+
+
+def _validate_json_file(pth: pathlib.Path) -> Optional[str]:
+    """
+    Validate the JSON file at ``pth`` with the validator of the current worker.
+
+    :return: error message, if any
+    """
+    assert _JSON_VALIDATOR is not None
+
+    with pth.open("rt", encoding="utf-8") as fid:
+        jsonable = json.load(fid)
+
+    error = jsonschema.exceptions.best_match(_JSON_VALIDATOR.iter_errors(jsonable))
+    if error is None:
+        return None
+
+    return str(error.message)
+
+
+def _initialize_xml_schema(schema_path: pathlib.Path) -> None:
+    """Build the XML schema for the current worker."""
+    global _XML_SCHEMA  # pylint: disable=global-statement
+
+    _XML_SCHEMA = xmlschema.XMLSchema(str(schema_path))
+
+
+def _validate_xml_file(pth: pathlib.Path) -> Optional[str]:
+    """
+    Validate the XML file at ``pth`` with the schema of the current worker.
+
+    :return: error message, if any
+    """
+    assert _XML_SCHEMA is not None
+
+    try:
+        _XML_SCHEMA.validate(str(pth))
+    except (
+        xmlschema.validators.exceptions.XMLSchemaValidationError,
+        xml.etree.ElementTree.ParseError,
+    ) as err:
+        return str(err)
+
+    return None
+
+
+def validate_json_files(
+    schema_path: pathlib.Path,
+    paths: Sequence[pathlib.Path],
+    workers: Optional[int] = None,
+) -> List[Tuple[pathlib.Path, Optional[str]]]:
+    """
+    Validate the JSON files at ``paths`` against the schema in a process pool.
+
+    :return: pairs of the paths and error messages, in the order of ``paths``
+    """
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_initialize_json_validator,
+        initargs=(schema_path,),
+    ) as executor:
+        errors = list(executor.map(_validate_json_file, paths, chunksize=32))
+
+    return list(zip(paths, errors))
+
+
+def validate_xml_files(
+    schema_path: pathlib.Path,
+    paths: Sequence[pathlib.Path],
+    workers: Optional[int] = None,
+) -> List[Tuple[pathlib.Path, Optional[str]]]:
+    """
+    Validate the XML files at ``paths`` against the schema in a process pool.
+
+    :return: pairs of the paths and error messages, in the order of ``paths``
+    """
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_initialize_xml_schema,
+        initargs=(schema_path,),
+    ) as executor:
+        errors = list(executor.map(_validate_xml_file, paths, chunksize=32))
+
+    return list(zip(paths, errors))
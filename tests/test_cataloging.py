@@ -0,0 +1,234 @@
+# pylint: disable=missing-docstring
+import hashlib
+import pathlib
+import tempfile
+import unittest
+import unittest.mock
+from typing import AbstractSet, Optional, Sequence
+
+from aas_core3_1_testgen import cataloging, serialized
+
+
+def _entry(
+    relative_path: str, content: bytes, class_name: str = "Property"
+) -> cataloging.Entry:
+    fmt = serialized.Format(relative_path.split("/")[0])
+
+    if "/Expected/" in relative_path:
+        kind = "Maximal"
+        expected_outcome = serialized.ExpectedOutcome.EXPECTED
+        property_name = None
+    else:
+        kind = "PatternViolation"
+        expected_outcome = serialized.ExpectedOutcome.INVALID
+        property_name = "ID_short"
+
+    return cataloging.Entry(
+        relative_path=pathlib.PurePosixPath(relative_path),
+        fmt=fmt,
+        container_class="Environment",
+        class_name=class_name,
+        kind=kind,
+        property_name=property_name,
+        example_name=None,
+        expected_outcome=expected_outcome,
+        sha256=hashlib.sha256(content).hexdigest(),
+    )
+
+
+def _write(
+    path: pathlib.Path,
+    entries: Sequence[cataloging.Entry],
+    replaced_class_names: Optional[AbstractSet[str]] = None,
+) -> None:
+    with cataloging.CatalogWriter(
+        path=path, replaced_class_names=replaced_class_names
+    ) as catalog:
+        for entry in entries:
+            catalog.write(entry)
+
+
+class Test_select(unittest.TestCase):
+    def test_filters(self) -> None:
+        entries = [
+            _entry("Json/ContainedInEnvironment/Expected/Property/maximal.json", b"a"),
+            _entry(
+                "Json/ContainedInEnvironment/Unexpected/Invalid/"
+                "PatternViolation/Property/idShort/a.json",
+                b"b",
+            ),
+            _entry("Xml/ContainedInEnvironment/Expected/property/maximal.xml", b"c"),
+        ]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = pathlib.Path(tmp_dir) / "catalog.sqlite3"
+            _write(path, entries)
+
+            self.assertListEqual(
+                [entry.relative_path for entry in entries],
+                [entry.relative_path for entry in cataloging.select(path)],
+            )
+
+            selected = cataloging.select(
+                path,
+                fmt=serialized.Format.JSON,
+                expected_outcome=serialized.ExpectedOutcome.INVALID,
+            )
+            self.assertListEqual(
+                [entries[1].relative_path],
+                [entry.relative_path for entry in selected],
+            )
+            self.assertEqual("ID_short", selected[0].property_name)
+            self.assertEqual(entries[1].sha256, selected[0].sha256)
+
+            self.assertListEqual(
+                [entries[2].relative_path],
+                [
+                    entry.relative_path
+                    for entry in cataloging.select(
+                        path, fmt=serialized.Format.XML, kind="Maximal"
+                    )
+                ],
+            )
+
+    def test_that_a_new_catalog_replaces_the_old_one(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = pathlib.Path(tmp_dir) / "catalog.sqlite3"
+            _write(path, [_entry("Json/SelfContained/Expected/Key/a.json", b"a")])
+            _write(path, [_entry("Json/SelfContained/Expected/Key/b.json", b"b")])
+
+            self.assertListEqual(
+                [pathlib.PurePosixPath("Json/SelfContained/Expected/Key/b.json")],
+                [entry.relative_path for entry in cataloging.select(path)],
+            )
+
+    def test_that_the_replaced_classes_are_updated_in_place(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = pathlib.Path(tmp_dir) / "catalog.sqlite3"
+            _write(
+                path,
+                [
+                    _entry("Json/SelfContained/Expected/Key/a.json", b"a", "Key"),
+                    _entry("Json/SelfContained/Expected/Blob/a.json", b"a", "Blob"),
+                ],
+            )
+            _write(
+                path,
+                [_entry("Json/SelfContained/Expected/Key/b.json", b"b", "Key")],
+                replaced_class_names={"Key"},
+            )
+
+            self.assertListEqual(
+                [
+                    pathlib.PurePosixPath("Json/SelfContained/Expected/Blob/a.json"),
+                    pathlib.PurePosixPath("Json/SelfContained/Expected/Key/b.json"),
+                ],
+                [entry.relative_path for entry in cataloging.select(path)],
+            )
+
+            self.assertListEqual(
+                [pathlib.PurePosixPath("Json/SelfContained/Expected/Key/b.json")],
+                [
+                    entry.relative_path
+                    for entry in cataloging.select(path, class_name="Key")
+                ],
+            )
+
+
+class Test_failure(unittest.TestCase):
+    def _write_failing(
+        self,
+        path: pathlib.Path,
+        entries: Sequence[cataloging.Entry],
+        replaced_class_names: Optional[AbstractSet[str]] = None,
+    ) -> None:
+        # We flush every entry so that the failure happens after the inserts.
+        with unittest.mock.patch.object(cataloging.CatalogWriter, "BATCH_SIZE", 1):
+            with self.assertRaises(RuntimeError):
+                with cataloging.CatalogWriter(
+                    path=path, replaced_class_names=replaced_class_names
+                ) as catalog:
+                    for entry in entries:
+                        catalog.write(entry)
+
+                    raise RuntimeError("Generation failed")
+
+    def test_that_a_failed_new_catalog_keeps_the_old_one(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = pathlib.Path(tmp_dir) / "catalog.sqlite3"
+            _write(path, [_entry("Json/SelfContained/Expected/Key/a.json", b"a")])
+
+            self._write_failing(
+                path, [_entry("Json/SelfContained/Expected/Key/b.json", b"b")]
+            )
+
+            self.assertListEqual(
+                [pathlib.PurePosixPath("Json/SelfContained/Expected/Key/a.json")],
+                [entry.relative_path for entry in cataloging.select(path)],
+            )
+            self.assertListEqual([path], list(pathlib.Path(tmp_dir).iterdir()))
+
+    def test_that_a_failed_update_keeps_the_replaced_classes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = pathlib.Path(tmp_dir) / "catalog.sqlite3"
+            _write(
+                path,
+                [
+                    _entry("Json/SelfContained/Expected/Key/a.json", b"a", "Key"),
+                    _entry("Json/SelfContained/Expected/Blob/a.json", b"a", "Blob"),
+                ],
+            )
+
+            self._write_failing(
+                path,
+                [_entry("Json/SelfContained/Expected/Key/b.json", b"b", "Key")],
+                replaced_class_names={"Key"},
+            )
+
+            self.assertListEqual(
+                [
+                    pathlib.PurePosixPath("Json/SelfContained/Expected/Blob/a.json"),
+                    pathlib.PurePosixPath("Json/SelfContained/Expected/Key/a.json"),
+                ],
+                [entry.relative_path for entry in cataloging.select(path)],
+            )
+
+
+class Test_diff(unittest.TestCase):
+    def test_added_removed_and_changed(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            old_path = pathlib.Path(tmp_dir) / "old.sqlite3"
+            new_path = pathlib.Path(tmp_dir) / "new.sqlite3"
+
+            _write(
+                old_path,
+                [
+                    _entry("Json/SelfContained/Expected/Key/kept.json", b"same"),
+                    _entry("Json/SelfContained/Expected/Key/changed.json", b"old"),
+                    _entry("Json/SelfContained/Expected/Key/removed.json", b"x"),
+                ],
+            )
+            _write(
+                new_path,
+                [
+                    _entry("Json/SelfContained/Expected/Key/kept.json", b"same"),
+                    _entry("Json/SelfContained/Expected/Key/changed.json", b"new"),
+                    _entry("Json/SelfContained/Expected/Key/added.json", b"y"),
+                ],
+            )
+
+            differences = cataloging.diff(old_path=old_path, new_path=new_path)
+
+            self.assertListEqual(
+                ["Json/SelfContained/Expected/Key/added.json"], differences.added
+            )
+            self.assertListEqual(
+                ["Json/SelfContained/Expected/Key/removed.json"], differences.removed
+            )
+            self.assertListEqual(
+                ["Json/SelfContained/Expected/Key/changed.json"], differences.changed
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
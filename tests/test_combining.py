@@ -0,0 +1,85 @@
+# pylint: disable=missing-docstring
+import unittest
+from typing import List
+
+from aas_core_codegen.common import Identifier
+
+from aas_core3_1_testgen import combining, serialized, validation
+import tests.common
+
+
+class Test_iterate_pairs(unittest.TestCase):
+    def test_that_all_pairs_are_iterated_exactly_once(self) -> None:
+        for mutation_count in [0, 1, 2, 3, 10, 101]:
+            pairs = list(combining.iterate_pairs(mutation_count))
+
+            self.assertEqual(combining.pair_count(mutation_count), len(pairs))
+            self.assertSetEqual(
+                {
+                    (first, second)
+                    for second in range(mutation_count)
+                    for first in range(second)
+                },
+                set(pairs),
+            )
+
+    def test_that_the_order_is_deterministic(self) -> None:
+        self.assertListEqual(
+            list(combining.iterate_pairs(50)), list(combining.iterate_pairs(50))
+        )
+
+
+class Test_iterate(unittest.TestCase):
+    def test_that_the_combinations_are_negative(self) -> None:
+        (
+            symbol_table,
+            constraints_by_class,
+        ) = tests.common.load_symbol_table_and_constraints()
+
+        # We restrict the classes so that we do not run another complete
+        # generation pass.
+        mutations = combining.collect_mutations(
+            symbol_table=symbol_table,
+            constraints_by_class=constraints_by_class,
+            class_names={"Blob", "Property", "Range", "Submodel"},
+        )
+
+        environment_cls = symbol_table.must_find_concrete_class(
+            Identifier("Environment")
+        )
+
+        combinations = list(
+            combining.iterate(
+                mutations=mutations, environment_cls=environment_cls, budget=200
+            )
+        )
+        self.assertEqual(200, len(combinations))
+
+        errors = []  # type: List[str]
+        for combination in combinations:
+            for fmt in [serialized.Format.JSON, serialized.Format.XML]:
+                serialization = combining.serialize(
+                    combination=combination, fmt=fmt, symbol_table=symbol_table
+                )
+
+                if serialization is None:
+                    continue
+
+                relative_pth, expected_outcome, data = serialization
+
+                error = validation.check_case(
+                    relative_path=relative_pth,
+                    fmt=fmt,
+                    expected_outcome=expected_outcome,
+                    data=data,
+                )
+
+                if error is not None:
+                    errors.append(f"{relative_pth}: {error}")
+
+        if len(errors) > 0:
+            raise AssertionError("\n".join(errors))
+
+
+if __name__ == "__main__":
+    unittest.main()
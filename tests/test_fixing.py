@@ -0,0 +1,77 @@
+# pylint: disable=missing-docstring
+import unittest
+from typing import List
+
+import aas_core3_1.jsonization as aas_jsonization
+import aas_core3_1.types as aas_types
+from aas_core3_1_testgen import common, fixing
+from aas_core3_1_testgen.codegened import wrapping
+
+
+class _HandymanWithoutMemo(fixing._Handyman):  # pylint: disable=protected-access
+    def visit_with_context(
+        self, that: aas_types.Class, context: common.CanHash
+    ) -> None:
+        that.accept_with_context(self, context)
+
+
+class Test_memoized_fixing(unittest.TestCase):
+    def test_that_it_fixes_the_same_as_without_memo(self) -> None:
+        handyman = fixing._Handyman()  # pylint: disable=protected-access
+        handyman_without_memo = _HandymanWithoutMemo()
+
+        errors = []  # type: List[str]
+
+        # We fix everything twice so that the second round re-plays the memo.
+        for _ in range(2):
+            for kind in ["minimal", "maximal"]:
+                in_environment = getattr(wrapping, f"{kind}_in_environment")
+
+                for class_name in wrapping._CLASS_NAME_TO_MINIMAL_IN_ENVIRONMENT:
+                    expected, expected_instance, expected_path = in_environment(
+                        class_name
+                    )
+                    handyman_without_memo.visit_with_context(
+                        expected, common.hash_path(None, [])
+                    )
+
+                    got, got_instance, got_path = in_environment(class_name)
+                    handyman.visit_with_context(got, common.hash_path(None, []))
+
+                    if aas_jsonization.to_jsonable(
+                        expected
+                    ) != aas_jsonization.to_jsonable(got):
+                        errors.append(
+                            f"The fixed {kind} environment of {class_name} differs"
+                        )
+
+                    if (
+                        common.dereference_instance(expected, expected_path)[0]
+                        is expected_instance
+                    ) != (
+                        common.dereference_instance(got, got_path)[0] is got_instance
+                    ):
+                        errors.append(
+                            f"The instance of the {kind} environment "
+                            f"of {class_name} has not been preserved"
+                        )
+
+        if len(errors) > 0:
+            raise AssertionError("\n".join(errors))
+
+        self.assertGreater(handyman.memo_statistics.hit_rate(), 0.5)
+
+    def test_that_the_memo_is_bounded(self) -> None:
+        handyman = fixing._Handyman(memo_capacity=3)  # pylint: disable=protected-access
+
+        for class_name in wrapping._CLASS_NAME_TO_MINIMAL_IN_ENVIRONMENT:
+            environment, _, _ = wrapping.maximal_in_environment(class_name)
+            handyman.visit_with_context(environment, common.hash_path(None, []))
+
+            self.assertLessEqual(len(handyman.memo), 3)
+
+        self.assertGreater(sum(handyman.memo_statistics.misses.values()), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
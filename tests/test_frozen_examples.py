@@ -0,0 +1,56 @@
+# pylint: disable=missing-docstring
+import json
+import os.path
+import pathlib
+import unittest
+
+from aas_core3_1_testgen.frozen_examples._types import LazyExamples
+
+
+def _frozen_examples_dir() -> pathlib.Path:
+    repo_root = pathlib.Path(os.path.realpath(__file__)).parent.parent
+    return repo_root / "aas_core3_1_testgen" / "frozen_examples"
+
+
+class Test_lazy_examples(unittest.TestCase):
+    def test_that_it_loads_the_recorded_files(self) -> None:
+        for name in ["pattern.jsonl", "xs_value.jsonl"]:
+            path = _frozen_examples_dir() / name
+
+            examples_by_key = LazyExamples(path=path)
+
+            with path.open("rt", encoding="utf-8") as fid:
+                lines = fid.read().splitlines()
+
+            self.assertListEqual(
+                [json.loads(line)[0] for line in lines], list(examples_by_key)
+            )
+
+            for line in lines:
+                key, positives, negatives = json.loads(line)
+
+                examples = examples_by_key[key]
+                self.assertListEqual(
+                    [list(pair) for pair in examples.positives.items()], positives
+                )
+                self.assertListEqual(
+                    [list(pair) for pair in examples.negatives.items()], negatives
+                )
+
+    def test_that_examples_are_decoded_on_first_access(self) -> None:
+        path = _frozen_examples_dir() / "xs_value.jsonl"
+        examples_by_key = LazyExamples(path=path)
+
+        self.assertIn("xs:string", examples_by_key)
+        self.assertNotIn("xs:non-existing", examples_by_key)
+
+        # pylint: disable=protected-access
+        self.assertDictEqual({}, examples_by_key._examples_by_key)
+
+        examples = examples_by_key["xs:string"]
+        self.assertIs(examples, examples_by_key["xs:string"])
+        self.assertListEqual(["xs:string"], list(examples_by_key._examples_by_key))
+
+
+if __name__ == "__main__":
+    unittest.main()
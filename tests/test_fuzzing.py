@@ -0,0 +1,44 @@
+# pylint: disable=missing-docstring
+import itertools
+import unittest
+
+from aas_core3_1_testgen import fuzzing
+import tests.common
+
+
+class Test_Fuzzer(unittest.TestCase):
+    def test_that_the_stream_is_reproducible_and_loadable(self) -> None:
+        (
+            symbol_table,
+            constraints_by_class,
+        ) = tests.common.load_symbol_table_and_constraints()
+
+        fuzzer = fuzzing.Fuzzer(
+            symbol_table=symbol_table, constraints_by_class=constraints_by_class
+        )
+
+        for fmt in fuzzing.FORMATS:
+            for fuzzed_case in itertools.islice(fuzzer.stream(seed=1), 300):
+                data = fuzzing.serialize(
+                    fuzzed_case=fuzzed_case, fmt=fmt, symbol_table=symbol_table
+                )
+
+                reproduced = fuzzing.serialize(
+                    fuzzed_case=fuzzer.generate_case(seed=1, index=fuzzed_case.index),
+                    fmt=fmt,
+                    symbol_table=symbol_table,
+                )
+                self.assertEqual(data, reproduced, fuzzed_case.describe())
+
+                if data is None:
+                    continue
+
+                # We only check that the SDK does not crash, as the outcome of
+                # a fuzzed case is not known in advance.
+                fuzzing.observe(
+                    data=data, fmt=fmt, container_class=fuzzed_case.container_class
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+# pylint: disable=missing-docstring
+import unittest
+from typing import List
+
+from aas_core3_1_testgen import serialized
+import tests.common
+
+
+class Test_iterate(unittest.TestCase):
+    def test_outcomes_consistent_with_paths(self) -> None:
+        # The content of the cases is compared against the recorded test data in
+        # the tests of the individual formats, which share the generated cases.
+        errors = []  # type: List[str]
+
+        for (
+            relative_pth,
+            fmt,
+            expected_outcome,
+            _,
+        ) in tests.common.generated_cases():
+            if relative_pth.parts[0] != fmt.value:
+                errors.append(f"Unexpected format {fmt} for {relative_pth}")
+
+            if fmt in (serialized.Format.JSON, serialized.Format.XML):
+                if expected_outcome is serialized.ExpectedOutcome.EXPECTED:
+                    if relative_pth.parts[2] != "Expected":
+                        errors.append(
+                            f"Unexpected outcome {expected_outcome} for {relative_pth}"
+                        )
+                elif relative_pth.parts[3] != expected_outcome.value:
+                    errors.append(
+                        f"Unexpected outcome {expected_outcome} for {relative_pth}"
+                    )
+
+        if len(errors) > 0:
+            raise AssertionError("\n".join(errors))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,176 @@
+# pylint: disable=missing-docstring
+import pathlib
+import unittest
+
+import aas_core_meta.v3
+from aas_core_codegen import infer_for_schema, intermediate
+from aas_core_codegen.common import Identifier
+
+from aas_core3_1_testgen import common, impact_analysis
+import tests.common
+
+
+class Test_analyze(unittest.TestCase):
+    def test_that_nothing_is_affected_without_a_change(self) -> None:
+        (
+            symbol_table,
+            constraints_by_class,
+        ) = tests.common.load_symbol_table_and_constraints()
+
+        impact = impact_analysis.analyze(
+            old_symbol_table=symbol_table,
+            old_constraints_by_class=constraints_by_class,
+            new_symbol_table=symbol_table,
+            new_constraints_by_class=constraints_by_class,
+        )
+
+        self.assertDictEqual({}, impact.changes_by_name)
+        self.assertListEqual([], impact.affected_classes)
+        self.assertListEqual([], impact.removed_classes)
+
+    def test_that_a_change_is_propagated_to_the_containers(self) -> None:
+        model_path = pathlib.Path(aas_core_meta.v3.__file__)
+
+        (
+            old_symbol_table,
+            old_constraints_by_class,
+        ) = tests.common.load_symbol_table_and_constraints()
+
+        (
+            new_symbol_table,
+            new_constraints_by_class,
+        ) = common.load_symbol_table_and_infer_constraints_for_schema(
+            model_path=model_path
+        )
+
+        range_cls = new_symbol_table.must_find_concrete_class(Identifier("Range"))
+        constraints_by_property = new_constraints_by_class[range_cls]
+        new_constraints_by_class[range_cls] = infer_for_schema.ConstraintsByProperty(
+            len_constraints_by_property=dict(),
+            patterns_by_property=constraints_by_property.patterns_by_property,
+            set_of_primitives_by_property=(
+                constraints_by_property.set_of_primitives_by_property
+            ),
+            set_of_enumeration_literals_by_property=(
+                constraints_by_property.set_of_enumeration_literals_by_property
+            ),
+        )
+
+        impact = impact_analysis.analyze(
+            old_symbol_table=old_symbol_table,
+            old_constraints_by_class=old_constraints_by_class,
+            new_symbol_table=new_symbol_table,
+            new_constraints_by_class=new_constraints_by_class,
+        )
+
+        self.assertListEqual(["Range"], list(impact.changes_by_name))
+
+        self.assertIn("Range", impact.affected_classes)
+        self.assertIn("Submodel", impact.affected_classes)
+        self.assertIn("Environment", impact.affected_classes)
+        self.assertNotIn("Key", impact.affected_classes)
+        self.assertNotIn("Property", impact.affected_classes)
+
+    def test_that_a_change_of_a_required_container_property_is_propagated(
+        self,
+    ) -> None:
+        model_path = pathlib.Path(aas_core_meta.v3.__file__)
+
+        (
+            old_symbol_table,
+            old_constraints_by_class,
+        ) = tests.common.load_symbol_table_and_constraints()
+
+        (
+            new_symbol_table,
+            new_constraints_by_class,
+        ) = common.load_symbol_table_and_infer_constraints_for_schema(
+            model_path=model_path
+        )
+
+        asset_information_cls = new_symbol_table.must_find_concrete_class(
+            Identifier("Asset_information")
+        )
+        self.assertGreater(len(asset_information_cls.invariants), 0)
+        asset_information_cls._set_invariants([])  # pylint: disable=protected-access
+
+        impact = impact_analysis.analyze(
+            old_symbol_table=old_symbol_table,
+            old_constraints_by_class=old_constraints_by_class,
+            new_symbol_table=new_symbol_table,
+            new_constraints_by_class=new_constraints_by_class,
+        )
+
+        self.assertListEqual(["Asset_information"], list(impact.changes_by_name))
+
+        # The extensions are wrapped in a minimal asset administration shell, which
+        # requires the asset information.
+        self.assertIn("Extension", impact.affected_classes)
+        self.assertIn("Asset_administration_shell", impact.affected_classes)
+
+        # The submodel elements are wrapped in a submodel, which does not refer to
+        # the asset information.
+        self.assertNotIn("Property", impact.affected_classes)
+
+    def test_that_a_removed_class_is_propagated_over_the_old_model(self) -> None:
+        model_path = pathlib.Path(aas_core_meta.v3.__file__)
+
+        (
+            old_symbol_table,
+            old_constraints_by_class,
+        ) = tests.common.load_symbol_table_and_constraints()
+
+        (
+            new_symbol_table,
+            new_constraints_by_class,
+        ) = common.load_symbol_table_and_infer_constraints_for_schema(
+            model_path=model_path
+        )
+
+        range_cls = new_symbol_table.must_find_concrete_class(Identifier("Range"))
+
+        for our_type in new_symbol_table.our_types:
+            if (
+                isinstance(
+                    our_type, (intermediate.AbstractClass, intermediate.ConcreteClass)
+                )
+                and range_cls in our_type.descendants
+            ):
+                our_type._set_descendants(  # pylint: disable=protected-access
+                    [
+                        descendant
+                        for descendant in our_type.descendants
+                        if descendant is not range_cls
+                    ]
+                )
+
+        setattr(
+            new_symbol_table,
+            "our_types",
+            [
+                our_type
+                for our_type in new_symbol_table.our_types
+                if our_type is not range_cls
+            ],
+        )
+
+        impact = impact_analysis.analyze(
+            old_symbol_table=old_symbol_table,
+            old_constraints_by_class=old_constraints_by_class,
+            new_symbol_table=new_symbol_table,
+            new_constraints_by_class=new_constraints_by_class,
+        )
+
+        self.assertDictEqual({"Range": ["removed"]}, impact.changes_by_name)
+        self.assertListEqual(["Range"], impact.removed_classes)
+
+        # The lists of submodel elements could contain ranges, so their cases
+        # change, although they are not described differently in the new model.
+        self.assertIn("Submodel_element_list", impact.affected_classes)
+        self.assertIn("Submodel", impact.affected_classes)
+        self.assertIn("Environment", impact.affected_classes)
+        self.assertNotIn("Property", impact.affected_classes)
+
+
+if __name__ == "__main__":
+    unittest.main()
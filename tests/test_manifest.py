@@ -0,0 +1,75 @@
+# pylint: disable=missing-docstring
+import os.path
+import pathlib
+import tempfile
+import unittest
+from typing import List
+
+from aas_core3_1_testgen import writing
+
+
+class Test_manifest(unittest.TestCase):
+    def test_that_it_matches_the_recorded_files(self) -> None:
+        repo_root = pathlib.Path(os.path.realpath(__file__)).parent.parent
+        test_data_dir = repo_root / "test_data"
+
+        manifest = writing.read_manifest(test_data_dir=test_data_dir)
+
+        names = writing.list_generated_files(test_data_dir=test_data_dir)
+        digest_by_name = writing.digest_files(directory=test_data_dir, names=names)
+
+        errors = []  # type: List[str]
+
+        for name in sorted(set(manifest).difference(digest_by_name)):
+            errors.append(f"In the manifest, but not in {test_data_dir}: {name}")
+
+        for name in sorted(set(digest_by_name).difference(manifest)):
+            errors.append(f"In {test_data_dir}, but not in the manifest: {name}")
+
+        for name in sorted(set(manifest).intersection(digest_by_name)):
+            if manifest[name] != digest_by_name[name]:
+                errors.append(f"The digest differs from the manifest: {name}")
+
+        if len(errors) > 0:
+            errors.insert(
+                0,
+                f"The manifest {writing.MANIFEST} is out of sync with the test data; "
+                f"re-generate it with aas_core3_1_testgen.writing.write_manifest.",
+            )
+            raise AssertionError("\n".join(errors))
+
+
+class Test_update_manifest(unittest.TestCase):
+    def test_that_only_the_given_names_change(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir_as_str:
+            test_data_dir = pathlib.Path(tmp_dir_as_str)
+            for name, data in (
+                ("Json/a.json", b"a"),
+                ("Json/b.json", b"b"),
+                ("Json/c.json", b"c"),
+            ):
+                pth = test_data_dir / name
+                pth.parent.mkdir(parents=True, exist_ok=True)
+                pth.write_bytes(data)
+
+            writing.write_manifest(test_data_dir=test_data_dir, workers=1)
+            manifest = writing.read_manifest(test_data_dir=test_data_dir)
+
+            writing.update_manifest(
+                test_data_dir=test_data_dir,
+                removed_names=["Json/b.json", "Json/non-existing.json"],
+                digest_by_name={"Json/c.json": "0" * 64, "Json/d.json": "1" * 64},
+            )
+
+            self.assertDictEqual(
+                {
+                    "Json/a.json": manifest["Json/a.json"],
+                    "Json/c.json": "0" * 64,
+                    "Json/d.json": "1" * 64,
+                },
+                writing.read_manifest(test_data_dir=test_data_dir),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+# pylint: disable=missing-docstring
+import unittest
+from typing import List
+
+import aas_core3_1_testgen.generate_json
+from aas_core3_1_testgen import generation, minimizing, serialized, validation
+import tests.common
+
+
+class Test_reduce(unittest.TestCase):
+    def test_that_only_the_needed_components_are_kept(self) -> None:
+        needed = {3, 11, 17}
+
+        self.assertListEqual(
+            [3, 11, 17],
+            minimizing.reduce(list(range(20)), lambda kept: needed <= set(kept)),
+        )
+
+    def test_that_everything_is_removed_if_nothing_is_needed(self) -> None:
+        self.assertListEqual([], minimizing.reduce(list(range(7)), lambda kept: True))
+
+    def test_that_nothing_is_removed_if_everything_is_needed(self) -> None:
+        self.assertListEqual(
+            list(range(7)),
+            minimizing.reduce(list(range(7)), lambda kept: len(kept) == 7),
+        )
+
+
+class Test_Minimizer(unittest.TestCase):
+    def test_that_the_minimized_cases_are_smaller_and_keep_the_outcome(
+        self,
+    ) -> None:
+        (
+            symbol_table,
+            constraints_by_class,
+        ) = tests.common.load_symbol_table_and_constraints()
+
+        minimizer = minimizing.Minimizer()
+
+        errors = []  # type: List[str]
+        # We restrict the classes so that we do not run another complete
+        # generation pass.
+        for test_case in generation.generate(
+            symbol_table=symbol_table,
+            constraints_by_class=constraints_by_class,
+            class_names={"Blob", "File", "Property", "Submodel"},
+        ):
+            if not isinstance(
+                test_case,
+                (generation.CasePatternViolation, generation.CaseEnumViolation),
+            ):
+                continue
+
+            minimized_case = minimizer.minimize(
+                case=test_case, symbol_table=symbol_table
+            )
+
+            (
+                relative_pth,
+                expected_outcome,
+                data,
+            ) = aas_core3_1_testgen.generate_json.serialize_case(
+                test_case=minimized_case, symbol_table=symbol_table
+            )
+
+            error = validation.check_case(
+                relative_path=relative_pth,
+                fmt=serialized.Format.JSON,
+                expected_outcome=expected_outcome,
+                data=data,
+            )
+            if error is not None:
+                errors.append(f"{relative_pth}: {error}")
+
+            if minimizer.statistics.case_count >= 50:
+                break
+
+        if len(errors) > 0:
+            raise AssertionError("\n".join(errors))
+
+        self.assertLess(
+            minimizer.statistics.minimized_size, minimizer.statistics.original_size
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+# pylint: disable=missing-docstring
+import collections
+import copy
+import pickle
+import unittest
+from typing import Optional, OrderedDict
+
+from aas_core3_1_testgen.codegened import preserialization
+
+
+class Test_properties(unittest.TestCase):
+    def test_that_mutations_behave_like_an_ordered_dict(self) -> None:
+        properties = preserialization.Properties()
+        expected = (
+            collections.OrderedDict()
+        )  # type: OrderedDict[str, Optional[preserialization.ValueUnion]]
+
+        for mapping in [properties, expected]:
+            mapping["id"] = "something"
+            mapping["id_short"] = "somethingShort"
+            mapping["category"] = "CONSTANT"
+            mapping["id"] = "something else"
+            mapping["category"] = None
+            del mapping["id_short"]
+            mapping["unexpected_additional_property"] = "INVALID"
+            mapping["id_short"] = "somethingShortAgain"
+
+        self.assertListEqual(list(expected.items()), list(properties.items()))
+        self.assertNotIn("non_existing", properties)
+
+        with self.assertRaises(KeyError):
+            del properties["non_existing"]
+
+    def test_that_equal_names_share_the_schema(self) -> None:
+        first = preserialization.Properties()
+        second = preserialization.Properties()
+
+        for properties in [first, second]:
+            properties["id"] = "something"
+            properties["id_short"] = "somethingShort"
+
+        # pylint: disable=protected-access
+        self.assertIs(first._schema, second._schema)
+
+        for clone in [copy.deepcopy(first), pickle.loads(pickle.dumps(first))]:
+            self.assertIs(first._schema, clone._schema)
+            self.assertListEqual(list(first.items()), list(clone.items()))
+
+
+if __name__ == "__main__":
+    unittest.main()
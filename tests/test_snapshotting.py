@@ -0,0 +1,95 @@
+# pylint: disable=missing-docstring
+import itertools
+import pathlib
+import tempfile
+import unittest
+
+import aas_core_meta.v3
+
+import aas_core3_1_testgen.generate_json
+from aas_core3_1_testgen import generation, snapshotting
+import tests.common
+
+
+class Test_snapshot(unittest.TestCase):
+    def test_that_the_replayed_cases_serialize_identically(self) -> None:
+        model_path = pathlib.Path(aas_core_meta.v3.__file__)
+
+        (
+            symbol_table,
+            constraints_by_class,
+        ) = tests.common.load_symbol_table_and_constraints()
+
+        cases = list(
+            itertools.islice(
+                generation.generate(
+                    symbol_table=symbol_table, constraints_by_class=constraints_by_class
+                ),
+                500,
+            )
+        )
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = pathlib.Path(tmp_dir) / "cases.snapshot"
+
+            self.assertEqual(
+                len(cases),
+                snapshotting.write(
+                    path=path,
+                    cases=cases,
+                    model_path=model_path,
+                    symbol_table=symbol_table,
+                ),
+            )
+
+            replayed_cases = list(
+                snapshotting.replay(
+                    path=path, model_path=model_path, symbol_table=symbol_table
+                )
+            )
+
+        self.assertEqual(len(cases), len(replayed_cases))
+
+        for case, replayed_case in zip(cases, replayed_cases):
+            self.assertIs(case.cls, replayed_case.cls)
+            self.assertIs(case.container_class, replayed_case.container_class)
+
+            # The pre-serialized container suffices unless the case keeps
+            # the replica of its model container.
+            if not isinstance(
+                replayed_case, (generation.CaseMinimal, generation.CaseMaximal)
+            ):
+                self.assertIsNone(replayed_case.container)
+
+            self.assertEqual(
+                aas_core3_1_testgen.generate_json.serialize_case(
+                    test_case=case, symbol_table=symbol_table
+                ),
+                aas_core3_1_testgen.generate_json.serialize_case(
+                    test_case=replayed_case, symbol_table=symbol_table
+                ),
+            )
+
+    def test_that_a_snapshot_of_another_model_is_rejected(self) -> None:
+        model_path = pathlib.Path(aas_core_meta.v3.__file__)
+
+        symbol_table, _ = tests.common.load_symbol_table_and_constraints()
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = pathlib.Path(tmp_dir) / "cases.snapshot"
+
+            with snapshotting.SnapshotWriter(
+                path=path, symbol_table=symbol_table, model_sha256="0" * 64
+            ):
+                pass
+
+            with self.assertRaises(ValueError):
+                list(
+                    snapshotting.replay(
+                        path=path, model_path=model_path, symbol_table=symbol_table
+                    )
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
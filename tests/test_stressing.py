@@ -0,0 +1,79 @@
+# pylint: disable=missing-docstring
+import io
+import unittest
+
+import aas_core3_1.jsonization as aas_jsonization
+import aas_core3_1.types as aas_types
+import aas_core3_1.verification as aas_verification
+from aas_core3_1_testgen import serialized, stressing
+import tests.common
+
+
+class Test_ladder(unittest.TestCase):
+    def test_that_the_rungs_are_powers_of_ten(self) -> None:
+        self.assertListEqual(
+            [10**exponent for exponent in range(1, 7)],
+            [shape.element_count() for shape in stressing.ladder(max_exponent=6)],
+        )
+
+
+class Test_generate_environment(unittest.TestCase):
+    def test_that_small_environments_are_valid_and_deterministic(self) -> None:
+        for shape in stressing.ladder(max_exponent=3):
+            environment = stressing.generate_environment(shape)
+
+            errors = [
+                f"{error.path}: {error.cause}"
+                for error in aas_verification.verify(environment)
+            ]
+            self.assertListEqual([], errors, shape.describe())
+
+            self.assertEqual(
+                shape.element_count(),
+                sum(
+                    1
+                    for instance in environment.descend()
+                    if isinstance(instance, aas_types.SubmodelElement)
+                ),
+            )
+
+            self.assertEqual(
+                aas_jsonization.to_jsonable(environment),
+                aas_jsonization.to_jsonable(stressing.generate_environment(shape)),
+            )
+
+
+class Test_write_environment(unittest.TestCase):
+    def test_that_it_writes_the_same_as_serialize(self) -> None:
+        symbol_table, _ = tests.common.load_symbol_table_and_constraints()
+
+        shapes = stressing.ladder(max_exponent=3) + [
+            stressing.Shape(
+                aas_count=3,
+                submodel_count=12,
+                elements_per_submodel=11,
+                depth=1,
+                list_length=2,
+            )
+        ]
+
+        for shape in shapes:
+            environment = stressing.generate_environment(shape)
+
+            for fmt in serialized.Format:
+                stream = io.BytesIO()
+                stressing.write_environment(
+                    shape=shape, fmt=fmt, stream=stream, symbol_table=symbol_table
+                )
+
+                self.assertEqual(
+                    stressing.serialize(
+                        environment=environment, fmt=fmt, symbol_table=symbol_table
+                    ),
+                    stream.getvalue(),
+                    f"{shape.describe()} in {fmt.value}",
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,301 @@
+# pylint: disable=missing-docstring
+import json
+import pathlib
+import subprocess
+import sys
+import tempfile
+import unittest
+from typing import Callable, Optional
+
+import aas_core3_1.types as aas_types
+from aas_core3_1 import jsonization as aasjsonization, xmlization as aasxmlization
+
+from aas_core3_1_testgen import serialized, validation
+
+
+def _submodel(id_short: str) -> aas_types.Submodel:
+    return aas_types.Submodel(id="urn:something:submodel", id_short=id_short)
+
+
+def _environment(id_short: str) -> aas_types.Environment:
+    return aas_types.Environment(submodels=[_submodel(id_short=id_short)])
+
+
+def _json(environment: aas_types.Environment) -> bytes:
+    return json.dumps(aasjsonization.to_jsonable(environment)).encode("utf-8")
+
+
+def _xml(environment: aas_types.Environment) -> bytes:
+    return aasxmlization.to_str(environment).encode("utf-8")
+
+
+class Test_check_environment(unittest.TestCase):
+    def assert_outcome(
+        self,
+        check: Callable[[bytes, serialized.ExpectedOutcome], Optional[str]],
+        data: bytes,
+        observed_outcome: serialized.ExpectedOutcome,
+    ) -> None:
+        for expected_outcome in serialized.ExpectedOutcome:
+            error = check(data, expected_outcome)
+            if expected_outcome is observed_outcome:
+                self.assertIsNone(error)
+            else:
+                self.assertIsNotNone(
+                    error,
+                    f"Expected an error when checking for {expected_outcome}, "
+                    f"but got none",
+                )
+
+    def test_json(self) -> None:
+        self.assert_outcome(
+            validation.check_json_environment,
+            _json(_environment(id_short="something")),
+            serialized.ExpectedOutcome.EXPECTED,
+        )
+
+        self.assert_outcome(
+            validation.check_json_environment,
+            b'{"submodels": "unexpected string"}',
+            serialized.ExpectedOutcome.UNSERIALIZABLE,
+        )
+
+        self.assert_outcome(
+            validation.check_json_environment,
+            _json(_environment(id_short="!invalid")),
+            serialized.ExpectedOutcome.INVALID,
+        )
+
+    def test_xml(self) -> None:
+        self.assert_outcome(
+            validation.check_xml_environment,
+            _xml(_environment(id_short="something")),
+            serialized.ExpectedOutcome.EXPECTED,
+        )
+
+        self.assert_outcome(
+            validation.check_xml_environment,
+            _xml(_environment(id_short="something")).replace(
+                b"<idShort>", b"<unexpectedElement/><idShort>"
+            ),
+            serialized.ExpectedOutcome.UNSERIALIZABLE,
+        )
+
+        self.assert_outcome(
+            validation.check_xml_environment,
+            _xml(_environment(id_short="!invalid")),
+            serialized.ExpectedOutcome.INVALID,
+        )
+
+
+_RDF = b"""\
+@prefix aas: <https://admin-shell.io/aas/3/1/> .
+@prefix rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#> .
+@prefix xs: <http://www.w3.org/2001/XMLSchema#> .
+
+<something_48c66017> rdf:type aas:Submodel ;
+    <https://admin-shell.io/aas/3/1/Referable/idShort> "some\\"thing"^^xs:string ;
+    <https://admin-shell.io/aas/3/1/HasKind/kind> <https://admin-shell.io/aas/3/1/ModellingKind/Instance> ;
+    <https://admin-shell.io/aas/3/1/Qualifiable/qualifiers> [
+        rdf:type aas:Qualifier ;
+        <https://admin-shell.io/aas/3/1/Qualifier/value> "multi\\nline\\r"^^xs:string ;
+    ] ;
+.
+"""
+
+
+class Test_check_rdf_well_formed(unittest.TestCase):
+    def test_well_formed(self) -> None:
+        self.assertIsNone(validation.check_rdf_well_formed(_RDF))
+
+    def test_not_well_formed(self) -> None:
+        for data in (
+            _RDF.replace(b"@prefix xs:", b"@prefix xsd:"),
+            _RDF.replace(b"\n.\n", b"\n"),
+            _RDF.replace(b"] ;", b"]"),
+            _RDF.replace(b"] ;", b";"),
+            _RDF.replace(b"rdf:type aas:Qualifier ;", b"rdf:type ;"),
+            _RDF.replace(b'"some', b'"so\rme'),
+            _RDF.replace(b"multi\\nline", b"multi\nline"),
+            b"\xff",
+        ):
+            self.assertIsNotNone(validation.check_rdf_well_formed(data), data)
+
+
+class Test_check_instance(unittest.TestCase):
+    def test_dispatch_covers_the_recorded_classes(self) -> None:
+        self.assertIn("SpecificAssetId", validation.from_jsonable_dispatch())
+        self.assertIn("DataSpecificationIec61360", validation.from_jsonable_dispatch())
+        self.assertIn("specificAssetId", validation.from_str_dispatch())
+        self.assertIn("dataSpecificationIec61360", validation.from_str_dispatch())
+
+        # Enumerations are not classes.
+        self.assertNotIn("ModellingKind", validation.from_jsonable_dispatch())
+
+    def test_self_contained(self) -> None:
+        submodel = _submodel(id_short="something")
+
+        self.assertIsNone(
+            validation.check_json_instance(
+                json.dumps(aasjsonization.to_jsonable(submodel)).encode("utf-8"),
+                "Submodel",
+                serialized.ExpectedOutcome.EXPECTED,
+            )
+        )
+
+        self.assertIsNone(
+            validation.check_xml_instance(
+                aasxmlization.to_str(submodel).encode("utf-8"),
+                "submodel",
+                serialized.ExpectedOutcome.EXPECTED,
+            )
+        )
+
+        # The environment is not a submodel.
+        self.assertIsNotNone(
+            validation.check_json_instance(
+                _json(_environment(id_short="something")),
+                "Submodel",
+                serialized.ExpectedOutcome.EXPECTED,
+            )
+        )
+
+
+class Test_deserialize_instance(unittest.TestCase):
+    def test_valid(self) -> None:
+        for fmt, data in (
+            (serialized.Format.JSON, _json(_environment(id_short="something"))),
+            (serialized.Format.XML, _xml(_environment(id_short="something"))),
+        ):
+            instance, cause = validation.deserialize_instance(
+                data=data, fmt=fmt, class_name="Environment"
+            )
+            self.assertIsInstance(instance, aas_types.Environment, fmt)
+            self.assertIsNone(cause, fmt)
+
+    def test_unserializable(self) -> None:
+        for fmt, data in (
+            (serialized.Format.JSON, b'{"submodels": "unexpected string"}'),
+            (
+                serialized.Format.XML,
+                _xml(_environment(id_short="something")).replace(
+                    b"<idShort>", b"<unexpectedElement/><idShort>"
+                ),
+            ),
+        ):
+            instance, cause = validation.deserialize_instance(
+                data=data, fmt=fmt, class_name="Environment"
+            )
+            self.assertIsNone(instance, fmt)
+            self.assertIsNotNone(cause, fmt)
+
+    def test_meta_model_names_with_acronyms(self) -> None:
+        data_specification = aas_types.DataSpecificationIEC61360(
+            preferred_name=[
+                aas_types.LangStringPreferredNameTypeIEC61360(
+                    language="en", text="something"
+                )
+            ]
+        )
+
+        for fmt, data in (
+            (
+                serialized.Format.JSON,
+                json.dumps(aasjsonization.to_jsonable(data_specification)).encode(
+                    "utf-8"
+                ),
+            ),
+            (
+                serialized.Format.XML,
+                aasxmlization.to_str(data_specification).encode("utf-8"),
+            ),
+        ):
+            instance, _ = validation.deserialize_instance(
+                data=data, fmt=fmt, class_name="Data_specification_IEC_61360"
+            )
+            self.assertIsInstance(instance, aas_types.DataSpecificationIEC61360, fmt)
+
+
+class Test_validate_tree(unittest.TestCase):
+    def test_errors_are_collected_and_sorted(self) -> None:
+        def submodel_json(id_short: str) -> bytes:
+            return json.dumps(
+                aasjsonization.to_jsonable(_submodel(id_short=id_short))
+            ).encode("utf-8")
+
+        files = {
+            "ContainedInEnvironment/Expected/Submodel/ok.json": _json(
+                _environment(id_short="something")
+            ),
+            "ContainedInEnvironment/Expected/Submodel/wrong.json": _json(
+                _environment(id_short="!invalid")
+            ),
+            "ContainedInEnvironment/Unexpected/Unserializable/TypeViolation/"
+            "Submodel/ok.json": b'{"submodels": "unexpected string"}',
+            "ContainedInEnvironment/Unexpected/Invalid/PatternViolation/"
+            "Submodel/ok.json": _json(_environment(id_short="!invalid")),
+            "SelfContained/Expected/Submodel/ok.json": submodel_json("something"),
+            "SelfContained/Unexpected/Unserializable/TypeViolation/"
+            "Submodel/ok.json": b'{"id": 1}',
+            "SelfContained/Unexpected/Invalid/PatternViolation/"
+            "Submodel/ok.json": submodel_json("!invalid"),
+            "SelfContained/Unexpected/Invalid/PatternViolation/"
+            "Submodel/wrong.json": submodel_json("something"),
+        }
+
+        with tempfile.TemporaryDirectory() as tmp_dir_as_str:
+            test_data_dir = pathlib.Path(tmp_dir_as_str)
+            base_dir = test_data_dir / "Json"
+
+            for relative_pth, data in files.items():
+                pth = base_dir / relative_pth
+                pth.parent.mkdir(parents=True, exist_ok=True)
+                pth.write_bytes(data)
+
+            for workers in (1, 2):
+                errors = validation.validate_tree(
+                    test_data_dir=test_data_dir,
+                    fmt=serialized.Format.JSON,
+                    workers=workers,
+                )
+
+                self.assertListEqual(
+                    [
+                        str(base_dir / "ContainedInEnvironment/Expected/Submodel"),
+                        str(
+                            base_dir / "SelfContained/Unexpected/Invalid/"
+                            "PatternViolation/Submodel"
+                        ),
+                    ],
+                    [str(pathlib.Path(error.split(":")[0]).parent) for error in errors],
+                )
+                for error in errors:
+                    self.assertIn("wrong.json", error)
+
+    def test_missing_cases_reported(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir_as_str:
+            errors = validation.validate_tree(
+                test_data_dir=pathlib.Path(tmp_dir_as_str),
+                fmt=serialized.Format.RDF,
+                workers=1,
+            )
+            self.assertEqual(1, len(errors))
+            self.assertIn("Unexpected no .ttl files", errors[0])
+
+
+class Test_lazy_import(unittest.TestCase):
+    def test_that_sdk_is_not_loaded_on_import(self) -> None:
+        # We need a fresh interpreter since the SDK has been already loaded by
+        # the other tests.
+        code = (
+            "import sys\n"
+            "import aas_core3_1_testgen.validation\n"
+            "for name in ('types', 'jsonization', 'verification', 'xmlization'):\n"
+            "    module = sys.modules['aas_core3_1.' + name]\n"
+            "    assert type(module).__name__ == '_LazyModule', name\n"
+        )
+        subprocess.check_call([sys.executable, "-c", code])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+# pylint: disable=missing-docstring
+import unittest
+import unittest.mock
+from typing import Any, Callable, Iterator, List, Mapping, Tuple, Union
+
+import aas_core3_1.jsonization as aas_jsonization
+import aas_core3_1.types as aas_types
+from aas_core3_1_testgen.codegened import wrapping
+
+_Wrapped = Tuple[aas_types.Environment, aas_types.Class, List[Union[str, int]]]
+
+
+def _route_and_creation_function(
+    function: Callable[[], _Wrapped]
+) -> Tuple[Callable[..., _Wrapped], Callable[..., aas_types.Class]]:
+    """Intercept the route and the creation function of the wrapping ``function``."""
+    with unittest.mock.patch.object(
+        wrapping, "_in_cached_environment", wraps=wrapping._in_cached_environment
+    ) as spy:
+        function()
+
+    return spy.call_args.kwargs["route"], spy.call_args.kwargs["creation_function"]
+
+
+def _uncached(function: Callable[[], _Wrapped]) -> _Wrapped:
+    """Call the route of the wrapping ``function`` directly, bypassing the cache."""
+    route, creation_function = _route_and_creation_function(function)
+
+    result = route(creation_function)
+    assert isinstance(result, tuple)
+    return result
+
+
+def _dispatches() -> Iterator[Tuple[str, str, Callable[[], _Wrapped]]]:
+    for kind, dispatch in (
+        (
+            "minimal",
+            wrapping._CLASS_NAME_TO_MINIMAL_IN_ENVIRONMENT,
+        ),
+        (
+            "maximal",
+            wrapping._CLASS_NAME_TO_MAXIMAL_IN_ENVIRONMENT,
+        ),
+    ):
+        assert isinstance(dispatch, Mapping)
+        for class_name, function in dispatch.items():
+            yield kind, class_name, function
+
+
+def _identities(environment: aas_types.Environment) -> List[int]:
+    return [id(environment)] + [id(instance) for instance in environment.descend()]
+
+
+def _at(environment: aas_types.Environment, path: List[Union[str, int]]) -> Any:
+    container = environment  # type: Any
+    for segment in path:
+        if isinstance(segment, int):
+            container = container[segment]
+        else:
+            container = getattr(container, segment)
+
+    return container
+
+
+class Test_in_cached_environment(unittest.TestCase):
+    def test_that_the_cached_output_equals_the_uncached_one(self) -> None:
+        for kind, class_name, function in _dispatches():
+            expected_environment, _, expected_path = _uncached(function)
+            expected_jsonable = aas_jsonization.to_jsonable(expected_environment)
+
+            # The first call fills the cache, the second one hits it.
+            for _ in range(2):
+                environment, instance, path = function()
+
+                self.assertEqual(
+                    expected_jsonable,
+                    aas_jsonization.to_jsonable(environment),
+                    f"{kind} {class_name}",
+                )
+                self.assertListEqual(expected_path, path, f"{kind} {class_name}")
+                self.assertIs(instance, _at(environment, path))
+
+    def test_that_the_skeletons_are_neither_shared_nor_mutated(self) -> None:
+        for kind, class_name, function in _dispatches():
+            expected_environment, _, _ = _uncached(function)
+            expected_jsonable = aas_jsonization.to_jsonable(expected_environment)
+
+            environment, instance, path = function()
+
+            # Mutate everything we got.
+            environment.submodels = None
+            environment.asset_administration_shells = None
+            environment.concept_descriptions = None
+            path.append("something")
+
+            another_environment, another_instance, another_path = function()
+
+            self.assertIsNot(instance, another_instance)
+            self.assertSetEqual(
+                set(),
+                set(_identities(environment)).intersection(
+                    _identities(another_environment)
+                ),
+                f"{kind} {class_name}",
+            )
+
+            self.assertEqual(
+                expected_jsonable,
+                aas_jsonization.to_jsonable(another_environment),
+                f"{kind} {class_name}",
+            )
+
+            route, _ = _route_and_creation_function(function)
+            skeleton_environment, _, skeleton_path = wrapping._SKELETONS[route]
+            self.assertListEqual(another_path, skeleton_path)
+            self.assertIs(
+                wrapping._PLACEHOLDER, _at(skeleton_environment, skeleton_path)
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
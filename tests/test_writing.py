@@ -0,0 +1,133 @@
+# pylint: disable=missing-docstring
+import pathlib
+import tarfile
+import tempfile
+import unittest
+import zipfile
+from typing import List, Tuple
+
+from aas_core3_1_testgen import writing
+
+_FILES = [
+    (pathlib.PurePosixPath("Json/SelfContained/Expected/Blob/minimal.json"), b"{}"),
+    (
+        pathlib.PurePosixPath("Json/SelfContained/Expected/Blob/maximal.json"),
+        b'{\n  "idShort": "something"\n}',
+    ),
+    (pathlib.PurePosixPath("Xml/SelfContained/Expected/blob/minimal.xml"), b"<blob/>"),
+]  # type: List[Tuple[pathlib.PurePosixPath, bytes]]
+
+
+class Test_directory_sink(unittest.TestCase):
+    def test_round_trip(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir_as_str:
+            tmp_dir = pathlib.Path(tmp_dir_as_str)
+
+            with writing.DirectorySink(directory=tmp_dir, fsync=True) as sink:
+                for relative_pth, data in _FILES:
+                    sink.write(relative_pth, data)
+
+            for relative_pth, data in _FILES:
+                self.assertEqual(data, (tmp_dir / relative_pth).read_bytes())
+
+
+class Test_archive_sink(unittest.TestCase):
+    def test_round_trip_and_reproducibility(self) -> None:
+        for suffix in (".zip", ".tar", ".tar.gz"):
+            with tempfile.TemporaryDirectory() as tmp_dir_as_str:
+                tmp_dir = pathlib.Path(tmp_dir_as_str)
+
+                archive_paths = []  # type: List[pathlib.Path]
+                for i in range(2):
+                    archive_pth = tmp_dir / f"test_data{i}{suffix}"
+                    with writing.ArchiveSink(path=archive_pth) as sink:
+                        for relative_pth, data in _FILES:
+                            sink.write(relative_pth, data)
+
+                    archive_paths.append(archive_pth)
+
+                self.assertEqual(
+                    archive_paths[0].read_bytes(),
+                    archive_paths[1].read_bytes(),
+                    f"Expected reproducible archives for {suffix}",
+                )
+
+                if suffix == ".zip":
+                    with zipfile.ZipFile(archive_paths[0]) as zip_file:
+                        for zip_info in zip_file.infolist():
+                            self.assertEqual((1980, 1, 1, 0, 0, 0), zip_info.date_time)
+                else:
+                    with tarfile.open(archive_paths[0]) as tar_file:
+                        for member in tar_file.getmembers():
+                            self.assertEqual(0, member.mtime)
+
+                with writing.ArchiveReader(path=archive_paths[0]) as reader:
+                    self.assertListEqual(
+                        [relative_pth.as_posix() for relative_pth, _ in _FILES],
+                        reader.names(),
+                    )
+
+                    for relative_pth, data in _FILES:
+                        self.assertEqual(data, reader.read(relative_pth.as_posix()))
+
+    def test_duplicate_entry_rejected(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir_as_str:
+            archive_pth = pathlib.Path(tmp_dir_as_str) / "test_data.zip"
+            with writing.ArchiveSink(path=archive_pth) as sink:
+                relative_pth, data = _FILES[0]
+                sink.write(relative_pth, data)
+
+                with self.assertRaises(ValueError):
+                    sink.write(relative_pth, data)
+
+
+class Test_content_addressed_sink(unittest.TestCase):
+    def test_dedup_and_materialize(self) -> None:
+        files = _FILES + [
+            (
+                pathlib.PurePosixPath("Json/SelfContained/Expected/Range/minimal.json"),
+                _FILES[0][1],
+            )
+        ]
+
+        with tempfile.TemporaryDirectory() as tmp_dir_as_str:
+            tmp_dir = pathlib.Path(tmp_dir_as_str)
+            store_dir = tmp_dir / "store"
+
+            with writing.ContentAddressedSink(directory=store_dir) as sink:
+                for relative_pth, data in files:
+                    sink.write(relative_pth, data)
+
+            assert isinstance(sink, writing.ContentAddressedSink)
+            self.assertEqual(4, sink.statistics.files)
+            self.assertEqual(3, sink.statistics.unique_payloads)
+            self.assertEqual(
+                sum(len(data) for _, data in files), sink.statistics.total_bytes
+            )
+            self.assertEqual(
+                sum(len(data) for _, data in _FILES), sink.statistics.unique_bytes
+            )
+
+            self.assertEqual(3, len(list((store_dir / "objects").glob("*/*"))))
+
+            self.assertListEqual(
+                sorted(relative_pth.as_posix() for relative_pth, _ in files),
+                [
+                    name
+                    for name, _ in writing.read_content_addressed_index(
+                        store_dir=store_dir
+                    )
+                ],
+            )
+
+            target_dir = tmp_dir / "tree"
+            writing.materialize_content_addressed(
+                store_dir=store_dir, target_dir=target_dir
+            )
+
+            for relative_pth, data in files:
+                self.assertEqual(data, (target_dir / relative_pth).read_bytes())
+
+
+if __name__ == "__main__":
+    unittest.main()